@@ -0,0 +1,314 @@
+import asyncio
+import ctypes
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from src.board_loaders import parse_rows
+from src.game_board import GameBoard, Placement
+from src.results import SolveResult, SolveStatus
+from src.solve_metrics import SolveMetrics
+from src.solver_service import SolverService
+from src.solver_workers import (
+    EncodedBoard,
+    copy_for_workers,
+    get_worker_solver_service,
+)
+from src.solver_workers import init_worker as init_solver_worker
+
+DEFAULT_MAX_QUEUE_SIZE = 100
+
+# Set in each worker process by init_worker. It has one flag per dispatcher,
+# set while the request that dispatcher sent should stop.
+worker_cancel_flags: Any = None
+
+
+def init_worker(solver_service: SolverService, cancel_flags: Any) -> None:
+    global worker_cancel_flags
+    init_solver_worker(solver_service)
+    worker_cancel_flags = cancel_flags
+
+
+def solve_request(
+    slot: int, encoded_board: EncodedBoard, timeout: float | None
+) -> tuple[SolveStatus, list[Placement], SolveMetrics]:
+    # The search checks should_stop every stop_check_interval board states,
+    # so a request stops soon after its deadline or its cancellation.
+    worker_solver_service = get_worker_solver_service()
+    cancel_flags = worker_cancel_flags
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def should_stop() -> bool:
+        return bool(cancel_flags[slot]) or (
+            deadline is not None and time.monotonic() >= deadline
+        )
+
+    worker_solver_service.should_stop = should_stop
+    status, moves_made = worker_solver_service.search_placements(
+        GameBoard.from_encoded(encoded_board)
+    )
+    if status == SolveStatus.CANCELLED and not cancel_flags[slot]:
+        status = SolveStatus.TIMED_OUT
+    return status, moves_made, worker_solver_service.metrics
+
+
+@dataclass(eq=False)
+class SolveRequest:
+    game_board: GameBoard
+    # In event loop time, or None for no deadline.
+    deadline: float | None
+    future: "asyncio.Future[SolveResult]"
+    # The dispatcher running the request, while it runs.
+    slot: int | None = None
+
+
+class AsyncSolverService:
+    # Solves boards on a process pool from an asyncio event loop. Requests
+    # wait in a bounded queue, so submitting blocks while it is full, and one
+    # dispatcher per worker sends them to the pool one at a time. Every
+    # request can have a deadline, after which its search stops and it is
+    # answered as TIMED_OUT with the metrics of the work done so far; the
+    # time spent in the queue counts towards it. A slow board therefore only
+    # holds up a single worker for at most its timeout.
+    solver_service: SolverService
+    num_workers: int
+    max_queue_size: int
+    default_timeout: float | None
+    __queue: "asyncio.Queue[SolveRequest] | None"
+    __executor: ProcessPoolExecutor | None
+    __dispatchers: list["asyncio.Task[None]"]
+    __cancel_flags: Any
+
+    def __init__(
+        self,
+        solver_service: SolverService,
+        num_workers: int | None = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        default_timeout: float | None = None,
+    ) -> None:
+        self.solver_service = solver_service
+        self.num_workers = (
+            num_workers if num_workers is not None else os.cpu_count() or 1
+        )
+        self.max_queue_size = max_queue_size
+        self.default_timeout = default_timeout
+        self.__queue = None
+        self.__executor = None
+        self.__dispatchers = []
+        self.__cancel_flags = None
+
+    async def __aenter__(self) -> "AsyncSolverService":
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self.__executor is not None:
+            return
+        self.__cancel_flags = multiprocessing.Array(
+            ctypes.c_byte, self.num_workers, lock=False
+        )
+        self.__executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=init_worker,
+            initargs=(copy_for_workers(self.solver_service), self.__cancel_flags),
+        )
+        self.__queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.__dispatchers = [
+            asyncio.create_task(self.__dispatch(slot))
+            for slot in range(self.num_workers)
+        ]
+
+    async def close(self) -> None:
+        # Stops running searches and answers every request still queued as
+        # CANCELLED.
+        if self.__executor is None:
+            return
+        assert self.__queue is not None
+        for slot in range(self.num_workers):
+            self.__cancel_flags[slot] = 1
+        for dispatcher in self.__dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self.__dispatchers, return_exceptions=True)
+        while not self.__queue.empty():
+            request = self.__queue.get_nowait()
+            self.__finish(request, SolveStatus.CANCELLED, [], SolveMetrics())
+        executor = self.__executor
+        self.__executor = None
+        self.__queue = None
+        self.__dispatchers = []
+        # Waiting for the workers to exit blocks, so it happens off the event
+        # loop.
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: executor.shutdown(wait=True)
+        )
+
+    async def submit(
+        self, game_board: GameBoard, timeout: float | None = None
+    ) -> SolveRequest:
+        # Waits while the queue is full. timeout defaults to default_timeout.
+        if self.__queue is None:
+            raise RuntimeError("the service has not been started")
+        loop = asyncio.get_running_loop()
+        timeout = timeout if timeout is not None else self.default_timeout
+        request = SolveRequest(
+            game_board=game_board,
+            deadline=loop.time() + timeout if timeout is not None else None,
+            future=loop.create_future(),
+        )
+        await self.__queue.put(request)
+        return request
+
+    async def solve(
+        self, game_board: GameBoard, timeout: float | None = None
+    ) -> SolveResult:
+        request = await self.submit(game_board, timeout)
+        try:
+            return await asyncio.shield(request.future)
+        except asyncio.CancelledError:
+            self.cancel(request)
+            raise
+
+    def cancel(self, request: SolveRequest) -> None:
+        # A queued request is answered as CANCELLED at once; a running one
+        # when its search next checks for a stop.
+        if request.slot is not None:
+            self.__cancel_flags[request.slot] = 1
+        else:
+            self.__finish(request, SolveStatus.CANCELLED, [], SolveMetrics())
+
+    async def serve(self, socket_path: str) -> asyncio.AbstractServer:
+        # Listens on a Unix socket for one JSON request per line, e.g.
+        # {"id": 1, "rows": ["xxoo", "xx  ", " oox", "  oo"], "timeout": 1.5},
+        # and writes one JSON response per line in the order they finish.
+        await self.start()
+        return await asyncio.start_unix_server(
+            self.__handle_connection, path=socket_path
+        )
+
+    async def __dispatch(self, slot: int) -> None:
+        assert self.__queue is not None and self.__executor is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            request = await self.__queue.get()
+            if request.future.done():
+                continue
+            timeout = None
+            if request.deadline is not None:
+                timeout = request.deadline - loop.time()
+                if timeout <= 0:
+                    self.__finish(request, SolveStatus.TIMED_OUT, [], SolveMetrics())
+                    continue
+            request.slot = slot
+            self.__cancel_flags[slot] = 0
+            try:
+                status, moves_made, metrics = await loop.run_in_executor(
+                    self.__executor,
+                    solve_request,
+                    slot,
+                    request.game_board.encode(),
+                    timeout,
+                )
+            except asyncio.CancelledError:
+                # The service is closing; the search was told to stop.
+                self.__finish(request, SolveStatus.CANCELLED, [], SolveMetrics())
+                raise
+            except Exception as error:
+                if not request.future.done():
+                    request.future.set_exception(error)
+                continue
+            finally:
+                request.slot = None
+            self.__finish(request, status, moves_made, metrics)
+
+    def __finish(
+        self,
+        request: SolveRequest,
+        status: SolveStatus,
+        moves_made: list[Placement],
+        metrics: SolveMetrics,
+    ) -> None:
+        if not request.future.done():
+            request.future.set_result(
+                SolveResult.from_placements(
+                    status, request.game_board, moves_made, metrics
+                )
+            )
+
+    async def __handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Requests are read only as fast as the queue accepts them, so a full
+        # queue pushes back on the client. Requests still open when the client
+        # disconnects are cancelled.
+        write_lock = asyncio.Lock()
+        open_requests: set[SolveRequest] = set()
+        responders: set["asyncio.Task[None]"] = set()
+
+        async def respond(response: dict[str, Any]) -> None:
+            async with write_lock:
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+
+        async def respond_when_done(request_id: Any, request: SolveRequest) -> None:
+            result = await request.future
+            open_requests.discard(request)
+            await respond(
+                {
+                    "id": request_id,
+                    "status": result.status.value,
+                    "solution": result.get_solution_rows(),
+                    "metrics": result.metrics.to_dict(),
+                }
+            )
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                message: Any = None
+                try:
+                    message = json.loads(line)
+                    rows = message["rows"]
+                    if not isinstance(rows, list) or not all(
+                        isinstance(row, str) for row in rows
+                    ):
+                        raise ValueError("rows must be a list of strings")
+                    game_board = parse_rows(rows)
+                    timeout = message.get("timeout")
+                    if timeout is not None and (
+                        not isinstance(timeout, (int, float))
+                        or isinstance(timeout, bool)
+                        or not timeout > 0
+                    ):
+                        raise ValueError("timeout must be a positive number")
+                except (ValueError, KeyError, TypeError) as error:
+                    request_id = (
+                        message.get("id") if isinstance(message, dict) else None
+                    )
+                    await respond({"id": request_id, "error": str(error)})
+                    continue
+                request = await self.submit(game_board, timeout)
+                open_requests.add(request)
+                responder = asyncio.create_task(
+                    respond_when_done(message.get("id"), request)
+                )
+                responders.add(responder)
+                responder.add_done_callback(responders.discard)
+            await asyncio.gather(*responders, return_exceptions=True)
+        finally:
+            for request in open_requests:
+                self.cancel(request)
+            writer.close()
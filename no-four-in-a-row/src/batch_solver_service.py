@@ -0,0 +1,214 @@
+import glob
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TextIO
+
+from src.board_loaders import (
+    BOARD_EXTENSIONS,
+    BoardFormatError,
+    format_rows,
+    load_board_file,
+    load_board_file_or_errors,
+    parse_rows,
+)
+from src.game_board import GameBoard
+from src.results import SolveStatus
+from src.solver_service import SolverService
+from src.solver_workers import (
+    EncodedBoard,
+    copy_for_workers,
+    get_worker_solver_service,
+    init_worker,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+BatchResult = dict[str, Any]
+# A board that could not be read is passed on as its error, so it becomes an
+# error result instead of ending the batch.
+BatchBoard = tuple[str, GameBoard | BoardFormatError]
+
+STDIN_SOURCE = "-"
+MAX_IN_FLIGHT_PER_WORKER = 4
+
+
+def solve_encoded_board(board_id: str, encoded_board: EncodedBoard) -> BatchResult:
+    return solve_board(get_worker_solver_service(), board_id, encoded_board)
+
+
+def solve_board(
+    solver_service: SolverService, board_id: str, encoded_board: EncodedBoard
+) -> BatchResult:
+    game_board = GameBoard.from_encoded(encoded_board)
+    start = time.perf_counter()
+    status, moves_made = solver_service.search_placements(game_board)
+    wall_time = time.perf_counter() - start
+
+    solution = None
+    if status == SolveStatus.SOLVED:
+        for cell_idx, char in moves_made:
+            game_board.update_cell_idx(cell_idx, char)
+        solution = format_rows(game_board)
+    return {
+        "id": board_id,
+        "status": status.value,
+        "solution": solution,
+        "num_board_states": solver_service.metrics.num_board_states,
+        "wall_time": wall_time,
+    }
+
+
+def get_error_result(board_id: str, error: BoardFormatError) -> BatchResult:
+    return {"id": board_id, "error": str(error)}
+
+
+def read_board_stream(stream: TextIO, name: str) -> Iterator[BatchBoard]:
+    # One board per line, as a JSON array of row strings, e.g.
+    # ["xxoo", "xx  ", " oox", "  oo"]. A malformed line is yielded as its
+    # error and the lines after it are still read.
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        board_id = f"{name}:{line_number}"
+        try:
+            rows = json.loads(line)
+            if not isinstance(rows, list) or not all(
+                isinstance(row, str) for row in rows
+            ):
+                raise BoardFormatError(f"{board_id}: expected a JSON list of rows")
+            game_board = parse_rows(rows, board_id)
+        except ValueError as error:
+            yield board_id, BoardFormatError(str(error))
+        else:
+            yield board_id, game_board
+
+
+def iter_board_paths(source: str) -> Iterator[str]:
+    # A directory of board files, a board file or a glob pattern matching
+    # board files. Board files are CSV, text or packed, see load_board_file.
+    if os.path.isdir(source):
+        for board_path in sorted(os.listdir(source)):
+            if board_path.endswith(BOARD_EXTENSIONS):
+                yield os.path.join(source, board_path)
+    elif os.path.isfile(source):
+        yield source
+    else:
+        yield from sorted(glob.glob(source, recursive=True))
+
+
+def iter_boards(sources: Iterable[str]) -> Iterator[tuple[str, GameBoard]]:
+    # Each source is "-" for a newline-delimited stream on stdin or a source
+    # of board files, see iter_board_paths. Raises on the first board that
+    # cannot be read.
+    for source in sources:
+        if source == STDIN_SOURCE:
+            for board_id, game_board in read_board_stream(sys.stdin, "stdin"):
+                if isinstance(game_board, BoardFormatError):
+                    raise game_board
+                yield board_id, game_board
+        else:
+            for board_path in iter_board_paths(source):
+                yield from load_board_file(board_path)
+
+
+def iter_boards_or_errors(sources: Iterable[str]) -> Iterator[BatchBoard]:
+    # As iter_boards, but boards that cannot be read are yielded as their
+    # errors, so one bad line or file does not end a batch.
+    for source in sources:
+        if source == STDIN_SOURCE:
+            yield from read_board_stream(sys.stdin, "stdin")
+        else:
+            for board_path in iter_board_paths(source):
+                yield from load_board_file_or_errors(board_path)
+
+
+class BatchSolverService:
+    # Solves many boards across worker processes, streaming one result per
+    # board. Boards are read lazily and only a bounded number are in flight,
+    # so arbitrarily long inputs can be processed.
+    solver_service: SolverService
+    num_workers: int
+
+    def __init__(
+        self, solver_service: SolverService, num_workers: int | None = None
+    ) -> None:
+        self.solver_service = solver_service
+        self.num_workers = (
+            num_workers if num_workers is not None else os.cpu_count() or 1
+        )
+
+    def solve_all(
+        self, boards: Iterable[BatchBoard], ordered: bool = False
+    ) -> Iterator[BatchResult]:
+        if self.num_workers <= 1:
+            for board_id, game_board in boards:
+                if isinstance(game_board, BoardFormatError):
+                    yield get_error_result(board_id, game_board)
+                else:
+                    yield solve_board(
+                        self.solver_service, board_id, game_board.encode()
+                    )
+            return
+
+        # Process pools are only imported when used, as the CLI reads its
+        # boards through this module.
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        max_in_flight = self.num_workers * MAX_IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=init_worker,
+            initargs=(copy_for_workers(self.solver_service),),
+        ) as executor:
+            pending: dict["Future", int] = {}
+            finished: dict[int, BatchResult] = {}
+            next_idx_to_yield = 0
+            board_iter = enumerate(boards)
+            is_exhausted = False
+
+            # In input order, results waiting on an earlier board also count
+            # against max_in_flight, so a slow board cannot pile them up.
+            while pending or not is_exhausted:
+                while not is_exhausted and len(pending) + len(finished) < max_in_flight:
+                    next_board = next(board_iter, None)
+                    if next_board is None:
+                        is_exhausted = True
+                        break
+                    board_idx, (board_id, game_board) = next_board
+                    if isinstance(game_board, BoardFormatError):
+                        error_result = get_error_result(board_id, game_board)
+                        if ordered:
+                            finished[board_idx] = error_result
+                        else:
+                            yield error_result
+                        continue
+                    future = executor.submit(
+                        solve_encoded_board, board_id, game_board.encode()
+                    )
+                    pending[future] = board_idx
+
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        board_idx = pending.pop(future)
+                        if ordered:
+                            finished[board_idx] = future.result()
+                        else:
+                            yield future.result()
+                while next_idx_to_yield in finished:
+                    yield finished.pop(next_idx_to_yield)
+                    next_idx_to_yield += 1
+
+    def write_json_lines(
+        self,
+        boards: Iterable[BatchBoard],
+        output: TextIO,
+        ordered: bool = False,
+    ) -> None:
+        for result in self.solve_all(boards, ordered=ordered):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
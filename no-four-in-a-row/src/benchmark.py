@@ -0,0 +1,115 @@
+import argparse
+import sys
+
+from src.benchmark_service import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_REPEATS,
+    TIERS,
+    BenchmarkService,
+    compare_to_baseline,
+    iter_corpus,
+    measure_startup,
+)
+from src.game_service import GameService
+from src.generator_service import GeneratorService
+from src.solver_service import SolverService
+from src.solving_engines import SatEngine
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the solver.")
+    parser.add_argument(
+        "--tiers",
+        nargs="+",
+        choices=TIERS,
+        default=list(TIERS),
+        help="corpus tiers to run",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="timed runs per board",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["backtracking", "sat"],
+        default="backtracking",
+        help="search engine to benchmark",
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="measure the import time of the command line instead of solving "
+        "the corpus",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", help="compare the results to this JSON file from --output"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="relative growth of a metric over the baseline that counts as a "
+        "regression",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    game_service = GameService()
+    solver_service = SolverService(
+        game_service=game_service,
+        engine=SatEngine(game_service) if args.engine == "sat" else None,
+    )
+    benchmark_service = BenchmarkService(solver_service, repeats=args.repeats)
+
+    results = []
+    if args.startup:
+        result = measure_startup(repeats=args.repeats)
+        results.append(result)
+        print(
+            f"{result['name']:<41} {result['median_wall_time'] * 1000:>10.2f} ms "
+            f"{result['num_modules']:>8} modules"
+        )
+        for name, self_time in result["slowest_modules"].items():
+            print(f"  {name:<39} {self_time / 1000:>10.2f} ms")
+        for name in result["deferred_modules"]:
+            print(f"REGRESSION {result['name']} imports {name} at startup")
+    for case in iter_corpus(
+        GeneratorService(solver_service), [] if args.startup else args.tiers
+    ):
+        result = benchmark_service.run_case(case)
+        results.append(result)
+        print(
+            f"{result['tier']:<8} {result['name']:<32} {result['status']:<12} "
+            f"{result['median_wall_time'] * 1000:>10.2f} ms "
+            f"{result['num_board_states']:>8} states "
+            f"{result['num_guesses']:>6} guesses "
+            f"{result['peak_memory'] / 1024:>10.1f} KiB"
+        )
+    if args.output:
+        benchmark_service.save(results, args.output)
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, BenchmarkService.load(args.baseline), args.threshold
+        )
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.name} {regression.metric}: "
+                f"{regression.baseline:.6g} -> {regression.current:.6g} "
+                f"({regression.ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print("No regressions")
+    if any(result.get("deferred_modules") for result in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
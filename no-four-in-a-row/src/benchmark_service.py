@@ -0,0 +1,261 @@
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from src.board_loaders import load_csv
+from src.game_board import EMPTY_CHAR, GameBoard
+from src.generator_service import GeneratorService
+from src.solver_service import SolverService
+
+BOARDS_DIR = "boards"
+FIXTURES_TIER = "fixtures"
+SIZES_BY_TIER = {
+    "small": (4, 8),
+    "medium": (12, 16),
+    "large": (20, 30),
+}
+TIERS = (FIXTURES_TIER, *SIZES_BY_TIER)
+DENSITIES = (0.1, 0.3, 0.5)
+CORPUS_SEED = 0
+DEFAULT_REPEATS = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+# Wall time changes smaller than this are timer noise on the smallest boards.
+MIN_WALL_TIME_DELTA = 0.001
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_MODULE = "src.main"
+# Modules the CLI only needs for some of its options. Importing any of them
+# whenever it starts is a regression, whatever the time it costs.
+DEFERRED_MODULES = (
+    "pydantic",
+    "prettytable",
+    "numpy",
+    "asyncio",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures.process",
+    "cProfile",
+)
+NUM_SLOWEST_MODULES = 10
+
+BenchmarkResult = dict[str, Any]
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    tier: str
+    game_board: GameBoard
+
+
+@dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def iter_corpus(
+    generator_service: GeneratorService,
+    tiers: Iterable[str] = TIERS,
+    boards_dir: str = BOARDS_DIR,
+) -> Iterator[BenchmarkCase]:
+    # The CSV boards shipped with the project, then for every size a random
+    # completed grid with DENSITIES of its cells kept as clues. Generated
+    # boards depend only on CORPUS_SEED and their size, so the corpus is the
+    # same on every run.
+    for tier in tiers:
+        if tier == FIXTURES_TIER:
+            for board_path in sorted(glob.glob(os.path.join(boards_dir, "*.csv"))):
+                yield BenchmarkCase(
+                    name=os.path.basename(board_path),
+                    tier=tier,
+                    game_board=load_csv(board_path),
+                )
+            continue
+        for size in SIZES_BY_TIER[tier]:
+            solution = generator_service.generate_solution(
+                size, size, CORPUS_SEED + size
+            )
+            for density in DENSITIES:
+                rng = random.Random(f"{CORPUS_SEED}-{size}-{density}")
+                game_board = solution.copy()
+                for cell_idx in game_board.cell_idxs():
+                    if rng.random() >= density:
+                        game_board.update_cell_idx(cell_idx, EMPTY_CHAR)
+                yield BenchmarkCase(
+                    name=f"{size}x{size}-{int(density * 100)}",
+                    tier=tier,
+                    game_board=game_board,
+                )
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[Regression]:
+    # A case regresses when its median wall time, board states or peak memory
+    # grew by more than threshold. Board states are deterministic, so growth
+    # there is a real change in the search rather than noise.
+    baseline_by_name = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_result = baseline_by_name.get(result["name"])
+        if baseline_result is None:
+            continue
+        for metric in ("median_wall_time", "num_board_states", "peak_memory"):
+            if metric not in result or metric not in baseline_result:
+                # Startup results only have wall times.
+                continue
+            if result[metric] <= baseline_result[metric] * (1 + threshold):
+                continue
+            if (
+                metric == "median_wall_time"
+                and result[metric] - baseline_result[metric] < MIN_WALL_TIME_DELTA
+            ):
+                continue
+            regressions.append(
+                Regression(
+                    name=result["name"],
+                    metric=metric,
+                    baseline=baseline_result[metric],
+                    current=result[metric],
+                )
+            )
+    return regressions
+
+
+def parse_import_times(output: str) -> dict[str, tuple[int, int]]:
+    # The self and cumulative microseconds of every module in the output of
+    # python -X importtime.
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # The header line
+            continue
+        import_times[name.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+
+def measure_startup(
+    module: str = STARTUP_MODULE, repeats: int = DEFAULT_REPEATS
+) -> BenchmarkResult:
+    # Imports module in a fresh interpreter under -X importtime, repeats
+    # times. The result has the same wall time keys as run_case, so a
+    # baseline comparison covers it, plus the modules it imported that should
+    # have been deferred and the modules with the most import time of their
+    # own.
+    runs = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(parse_import_times(completed.stderr))
+    import_times = [run[module][1] / 1_000_000 for run in runs]
+    slowest_modules = sorted(
+        runs[-1].items(), key=lambda item: item[1][0], reverse=True
+    )[:NUM_SLOWEST_MODULES]
+    return {
+        "name": f"startup:{module}",
+        "tier": "startup",
+        "min_wall_time": min(import_times),
+        "median_wall_time": statistics.median(import_times),
+        "mean_wall_time": statistics.mean(import_times),
+        "num_modules": len(runs[-1]),
+        "deferred_modules": [name for name in DEFERRED_MODULES if name in runs[-1]],
+        "slowest_modules": {name: times[0] for name, times in slowest_modules},
+    }
+
+
+class BenchmarkService:
+    # Times a solver service over a corpus of boards. Each case is solved once
+    # to warm up the per-shape caches, repeats times with time.perf_counter,
+    # then once more under tracemalloc for peak memory, which would otherwise
+    # slow the timed runs down.
+    solver_service: SolverService
+    repeats: int
+
+    def __init__(
+        self, solver_service: SolverService, repeats: int = DEFAULT_REPEATS
+    ) -> None:
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        self.solver_service = solver_service
+        self.repeats = repeats
+
+    def run(self, cases: Iterable[BenchmarkCase]) -> list[BenchmarkResult]:
+        return [self.run_case(case) for case in cases]
+
+    def run_case(self, case: BenchmarkCase) -> BenchmarkResult:
+        solver_service = self.solver_service
+        solver_service.search_placements(case.game_board)
+        wall_times = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            status, _ = solver_service.search_placements(case.game_board)
+            wall_times.append(time.perf_counter() - start)
+        metrics = solver_service.metrics
+
+        tracemalloc.start()
+        try:
+            solver_service.search_placements(case.game_board)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "name": case.name,
+            "tier": case.tier,
+            "n_rows": case.game_board.n_rows,
+            "n_cols": case.game_board.n_cols,
+            "num_empty_cells": len(case.game_board.empty_cell_idxs()),
+            "status": status.value,
+            "min_wall_time": min(wall_times),
+            "median_wall_time": statistics.median(wall_times),
+            "mean_wall_time": statistics.mean(wall_times),
+            "num_board_states": metrics.num_board_states,
+            "num_guesses": metrics.num_guesses,
+            "max_depth": metrics.max_depth,
+            "peak_memory": peak_memory,
+        }
+
+    def save(self, results: list[BenchmarkResult], path: str) -> None:
+        report = {
+            "metadata": {
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "repeats": self.repeats,
+            },
+            "results": results,
+        }
+        with open(path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+    @staticmethod
+    def load(path: str) -> list[BenchmarkResult]:
+        with open(path) as report_file:
+            results: list[BenchmarkResult] = json.load(report_file)["results"]
+        return results
@@ -0,0 +1,322 @@
+import csv
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from types import TracebackType
+from typing import BinaryIO
+
+from src.game_board import EMPTY_CHAR, O_CHAR, X_CHAR, GameBoard
+
+CSV_EXTENSION = ".csv"
+TEXT_EXTENSION = ".txt"
+PACKED_EXTENSION = ".nfb"
+BOARD_EXTENSIONS = (CSV_EXTENSION, TEXT_EXTENSION, PACKED_EXTENSION)
+
+VALID_CHARS = frozenset((EMPTY_CHAR, X_CHAR, O_CHAR))
+# Translate a row string into binary digits for each player, so a whole row is
+# turned into a bitmask by int() instead of a loop over its cells.
+X_DIGITS = str.maketrans({X_CHAR: "1", O_CHAR: "0", EMPTY_CHAR: "0"})
+O_DIGITS = str.maketrans({X_CHAR: "0", O_CHAR: "1", EMPTY_CHAR: "0"})
+
+# Packed files start with a header of the magic bytes, the format version and
+# the board shape, followed by fixed-size records. Each record is the x plane
+# then the o plane, one bit per cell in row-major order, so every cell takes
+# two bits. Records are a whole number of bytes, so board i starts at
+# HEADER_SIZE + i * record_size and is read without touching the others.
+PACKED_MAGIC = b"NFIR"
+PACKED_VERSION = 1
+HEADER_FORMAT = "<4sBxHH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+class BoardFormatError(ValueError):
+    pass
+
+
+def parse_rows(rows: Sequence[str], name: str = "board") -> GameBoard:
+    # Builds a board from one string per row, such as "ooo xx x", checking
+    # that every row has the same length and only holds valid characters.
+    if not rows or not rows[0]:
+        raise BoardFormatError(f"{name}: board is empty")
+    n_cols = len(rows[0])
+    stride = n_cols + 1
+    x_bits = 0
+    o_bits = 0
+    for row_idx, row in enumerate(rows):
+        if len(row) != n_cols:
+            raise BoardFormatError(
+                f"{name}: row {row_idx} has {len(row)} cells, expected {n_cols}"
+            )
+        if not VALID_CHARS.issuperset(row):
+            invalid_chars = sorted(set(row) - VALID_CHARS)
+            raise BoardFormatError(
+                f"{name}: row {row_idx} has invalid characters {invalid_chars}"
+            )
+        # The first character is the lowest bit, so the digits are reversed.
+        shift = row_idx * stride
+        x_bits |= int(row.translate(X_DIGITS)[::-1], 2) << shift
+        o_bits |= int(row.translate(O_DIGITS)[::-1], 2) << shift
+    return GameBoard.from_encoded((len(rows), n_cols, x_bits, o_bits))
+
+
+def load_csv(board_path: str) -> GameBoard:
+    with open(board_path, newline="") as csv_file:
+        rows = []
+        for line_number, cells in enumerate(csv.reader(csv_file), start=1):
+            if any(len(cell) != 1 for cell in cells):
+                raise BoardFormatError(
+                    f"{board_path}:{line_number}: every cell must be one character"
+                )
+            rows.append("".join(cells))
+    return parse_rows(rows, board_path)
+
+
+def iter_text_boards(board_path: str) -> Iterator[tuple[str, GameBoard]]:
+    for board_id, rows in iter_text_rows(board_path):
+        yield board_id, parse_rows(rows, board_id)
+
+
+def iter_text_rows(board_path: str) -> Iterator[tuple[str, list[str]]]:
+    # One row per line with boards separated by blank lines. Rows of empty
+    # cells are spaces, so only lines with no characters at all separate
+    # boards. Boards are identified by the line they start on.
+    with open(board_path) as text_file:
+        rows: list[str] = []
+        first_line_number = 1
+        for line_number, line in enumerate(text_file, start=1):
+            line = line.rstrip("\r\n")
+            if line:
+                if not rows:
+                    first_line_number = line_number
+                rows.append(line)
+                continue
+            if rows:
+                yield f"{board_path}:{first_line_number}", rows
+                rows = []
+        if rows:
+            yield f"{board_path}:{first_line_number}", rows
+
+
+def format_rows(game_board: GameBoard) -> list[str]:
+    return ["".join(row) for row in game_board.board]
+
+
+def format_text_board(game_board: GameBoard) -> str:
+    return "\n".join(format_rows(game_board))
+
+
+def get_record_size(n_rows: int, n_cols: int) -> int:
+    return 2 * ((n_rows * n_cols + 7) // 8)
+
+
+def pack_board(game_board: GameBoard) -> bytes:
+    # Drops the guard column from the stride layout of GameBoard.
+    n_cols = game_board.n_cols
+    row_mask = (1 << n_cols) - 1
+    x_plane = 0
+    o_plane = 0
+    for row_idx in range(game_board.n_rows):
+        shift = row_idx * game_board.stride
+        x_plane |= (game_board.x_bits >> shift & row_mask) << row_idx * n_cols
+        o_plane |= (game_board.o_bits >> shift & row_mask) << row_idx * n_cols
+    plane_size = get_record_size(game_board.n_rows, n_cols) // 2
+    return x_plane.to_bytes(plane_size, "little") + o_plane.to_bytes(
+        plane_size, "little"
+    )
+
+
+def unpack_board(record: bytes, n_rows: int, n_cols: int) -> GameBoard:
+    plane_size = len(record) // 2
+    x_plane = int.from_bytes(record[:plane_size], "little")
+    o_plane = int.from_bytes(record[plane_size:], "little")
+    if x_plane & o_plane:
+        raise BoardFormatError("record has cells that are both x and o")
+    if (x_plane | o_plane) >> n_rows * n_cols:
+        raise BoardFormatError("record has cells outside the board")
+    stride = n_cols + 1
+    row_mask = (1 << n_cols) - 1
+    x_bits = 0
+    o_bits = 0
+    for row_idx in range(n_rows):
+        shift = row_idx * n_cols
+        x_bits |= (x_plane >> shift & row_mask) << row_idx * stride
+        o_bits |= (o_plane >> shift & row_mask) << row_idx * stride
+    return GameBoard.from_encoded((n_rows, n_cols, x_bits, o_bits))
+
+
+class PackedBoardWriter:
+    # Writes boards of a single shape to a packed file. Use as a context
+    # manager, or call close() when done.
+    n_rows: int
+    n_cols: int
+    num_boards: int
+    __file: BinaryIO
+
+    def __init__(self, board_path: str, n_rows: int, n_cols: int) -> None:
+        if n_rows < 1 or n_cols < 1:
+            raise BoardFormatError(f"invalid board shape {n_rows}x{n_cols}")
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.num_boards = 0
+        self.__file = open(board_path, "wb")
+        self.__file.write(
+            struct.pack(HEADER_FORMAT, PACKED_MAGIC, PACKED_VERSION, n_rows, n_cols)
+        )
+
+    def __enter__(self) -> "PackedBoardWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, game_board: GameBoard) -> None:
+        if (game_board.n_rows, game_board.n_cols) != (self.n_rows, self.n_cols):
+            raise BoardFormatError(
+                f"board is {game_board.n_rows}x{game_board.n_cols}, "
+                f"expected {self.n_rows}x{self.n_cols}"
+            )
+        self.__file.write(pack_board(game_board))
+        self.num_boards += 1
+
+    def write_all(self, game_boards: Iterable[GameBoard]) -> None:
+        for game_board in game_boards:
+            self.write(game_board)
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class PackedBoardReader:
+    # Random access to the boards of a packed file through mmap, so opening a
+    # file with millions of boards reads nothing but the header, and only the
+    # pages of the boards asked for are loaded.
+    board_path: str
+    n_rows: int
+    n_cols: int
+    record_size: int
+    __mmap: mmap.mmap
+
+    def __init__(self, board_path: str) -> None:
+        self.board_path = board_path
+        with open(board_path, "rb") as board_file:
+            header = board_file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise BoardFormatError(f"{board_path}: file is too short")
+            magic, version, n_rows, n_cols = struct.unpack(HEADER_FORMAT, header)
+            if magic != PACKED_MAGIC:
+                raise BoardFormatError(f"{board_path}: not a packed board file")
+            if version != PACKED_VERSION:
+                raise BoardFormatError(f"{board_path}: unsupported version {version}")
+            if n_rows < 1 or n_cols < 1:
+                raise BoardFormatError(
+                    f"{board_path}: invalid board shape {n_rows}x{n_cols}"
+                )
+            self.n_rows = n_rows
+            self.n_cols = n_cols
+            self.record_size = get_record_size(n_rows, n_cols)
+            self.__mmap = mmap.mmap(board_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if (len(self.__mmap) - HEADER_SIZE) % self.record_size:
+            self.close()
+            raise BoardFormatError(f"{board_path}: file ends with a partial board")
+
+    def __enter__(self) -> "PackedBoardReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return (len(self.__mmap) - HEADER_SIZE) // self.record_size
+
+    def __getitem__(self, board_idx: int) -> GameBoard:
+        num_boards = len(self)
+        if board_idx < 0:
+            board_idx += num_boards
+        if not 0 <= board_idx < num_boards:
+            raise IndexError(f"board index {board_idx} out of range")
+        start = HEADER_SIZE + board_idx * self.record_size
+        try:
+            return unpack_board(
+                self.__mmap[start : start + self.record_size], self.n_rows, self.n_cols
+            )
+        except BoardFormatError as error:
+            raise BoardFormatError(f"{self.board_path}[{board_idx}]: {error}")
+
+    def __iter__(self) -> Iterator[GameBoard]:
+        for board_idx in range(len(self)):
+            yield self[board_idx]
+
+    def close(self) -> None:
+        self.__mmap.close()
+
+
+def write_packed_boards(board_path: str, game_boards: Iterable[GameBoard]) -> int:
+    # Takes the shape from the first board. Returns the number of boards.
+    board_iter = iter(game_boards)
+    first_board = next(board_iter, None)
+    if first_board is None:
+        raise BoardFormatError("cannot pack an empty set of boards")
+    with PackedBoardWriter(
+        board_path, first_board.n_rows, first_board.n_cols
+    ) as writer:
+        writer.write(first_board)
+        writer.write_all(board_iter)
+        return writer.num_boards
+
+
+def iter_packed_boards(board_path: str) -> Iterator[tuple[str, GameBoard]]:
+    with PackedBoardReader(board_path) as reader:
+        for board_idx in range(len(reader)):
+            yield f"{board_path}[{board_idx}]", reader[board_idx]
+
+
+def load_board_file(board_path: str) -> Iterator[tuple[str, GameBoard]]:
+    # Picks the loader from the file extension. CSV files hold one board,
+    # text and packed files any number.
+    if board_path.endswith(PACKED_EXTENSION):
+        yield from iter_packed_boards(board_path)
+    elif board_path.endswith(TEXT_EXTENSION):
+        yield from iter_text_boards(board_path)
+    else:
+        yield board_path, load_csv(board_path)
+
+
+def load_board_file_or_errors(
+    board_path: str,
+) -> Iterator[tuple[str, GameBoard | BoardFormatError]]:
+    # As load_board_file, but a board that cannot be read is yielded as its
+    # error and the rest of the file is still read. A file that cannot be
+    # opened at all is a single error.
+    try:
+        if board_path.endswith(PACKED_EXTENSION):
+            with PackedBoardReader(board_path) as reader:
+                for board_idx in range(len(reader)):
+                    board_id = f"{board_path}[{board_idx}]"
+                    try:
+                        game_board = reader[board_idx]
+                    except BoardFormatError as error:
+                        yield board_id, error
+                    else:
+                        yield board_id, game_board
+        elif board_path.endswith(TEXT_EXTENSION):
+            for board_id, rows in iter_text_rows(board_path):
+                try:
+                    game_board = parse_rows(rows, board_id)
+                except BoardFormatError as error:
+                    yield board_id, error
+                else:
+                    yield board_id, game_board
+        else:
+            yield board_path, load_csv(board_path)
+    except (OSError, UnicodeDecodeError, BoardFormatError) as error:
+        yield board_path, BoardFormatError(str(error))
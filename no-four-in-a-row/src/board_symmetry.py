@@ -0,0 +1,123 @@
+import hashlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from src.board_loaders import format_rows, parse_rows
+from src.game_board import O_CHAR, X_CHAR, GameBoard
+from src.rule_spec import Direction
+
+Rows = list[str]
+
+SWAP_CHARS = str.maketrans({X_CHAR: O_CHAR, O_CHAR: X_CHAR})
+
+
+def transpose(rows: Rows) -> Rows:
+    return ["".join(col) for col in zip(*rows)]
+
+
+# The symmetries of the square, as functions on rows. Each maps windows to
+# windows, so a board is solvable exactly when its image is, and they work on
+# rectangular boards too, with the rotations by 90 degrees changing the shape.
+TRANSFORMS: tuple[Callable[[Rows], Rows], ...] = (
+    lambda rows: list(rows),
+    lambda rows: transpose(rows[::-1]),  # rotate 90 degrees clockwise
+    lambda rows: [row[::-1] for row in rows[::-1]],  # rotate 180 degrees
+    lambda rows: transpose(rows)[::-1],  # rotate 90 degrees anticlockwise
+    lambda rows: [row[::-1] for row in rows],  # mirror left to right
+    lambda rows: rows[::-1],  # mirror top to bottom
+    transpose,  # mirror in the main diagonal
+    lambda rows: transpose(rows[::-1])[::-1],  # mirror in the other diagonal
+)
+# The rotations by 90 degrees undo each other; the rest undo themselves.
+INVERSE_TRANSFORM_IDXS = (0, 3, 2, 1, 4, 5, 6, 7)
+# Where each transform sends a step of (row, col) along a direction.
+DIRECTION_TRANSFORMS: tuple[Callable[[int, int], Direction], ...] = (
+    lambda row, col: (row, col),
+    lambda row, col: (col, -row),
+    lambda row, col: (-row, -col),
+    lambda row, col: (-col, row),
+    lambda row, col: (row, -col),
+    lambda row, col: (-row, col),
+    lambda row, col: (col, row),
+    lambda row, col: (-col, -row),
+)
+
+
+@dataclass(frozen=True)
+class BoardSymmetry:
+    # One of the 8 symmetries of the square, optionally followed by swapping
+    # x and o. Together these are the 16 changes the no-four rule ignores.
+    transform_idx: int = 0
+    swaps_chars: bool = False
+
+    def apply(self, rows: Rows) -> Rows:
+        rows = TRANSFORMS[self.transform_idx](rows)
+        if self.swaps_chars:
+            rows = [row.translate(SWAP_CHARS) for row in rows]
+        return rows
+
+    def invert(self, rows: Rows) -> Rows:
+        return BoardSymmetry(
+            INVERSE_TRANSFORM_IDXS[self.transform_idx], self.swaps_chars
+        ).apply(rows)
+
+
+SYMMETRIES = tuple(
+    BoardSymmetry(transform_idx, swaps_chars)
+    for transform_idx in range(len(TRANSFORMS))
+    for swaps_chars in (False, True)
+)
+
+
+def get_symmetries(directions: Iterable[Direction]) -> tuple[BoardSymmetry, ...]:
+    # The symmetries that map the directions runs are counted along onto
+    # each other, so only these keep the rules unchanged when some directions
+    # are left out.
+    def normalize(direction: Direction) -> Direction:
+        # A direction and its opposite give the same runs.
+        return max(direction, (-direction[0], -direction[1]))
+
+    direction_set = {normalize(direction) for direction in directions}
+    return tuple(
+        symmetry
+        for symmetry in SYMMETRIES
+        if {
+            normalize(DIRECTION_TRANSFORMS[symmetry.transform_idx](*direction))
+            for direction in direction_set
+        }
+        == direction_set
+    )
+
+
+def canonicalize(
+    game_board: GameBoard, symmetries: tuple[BoardSymmetry, ...] = SYMMETRIES
+) -> tuple[Rows, BoardSymmetry]:
+    # The smallest image of the board under symmetries, compared as its rows
+    # joined by newlines, and the symmetry that maps the board onto it. Boards
+    # that are symmetric to each other have the same canonical rows.
+    rows = format_rows(game_board)
+    canonical_rows = rows
+    canonical_text = "\n".join(rows)
+    canonical_symmetry = SYMMETRIES[0]
+    for symmetry in symmetries:
+        image_rows = symmetry.apply(rows)
+        image_text = "\n".join(image_rows)
+        if image_text < canonical_text:
+            canonical_rows = image_rows
+            canonical_text = image_text
+            canonical_symmetry = symmetry
+    return canonical_rows, canonical_symmetry
+
+
+def get_canonical_key(
+    game_board: GameBoard, symmetries: tuple[BoardSymmetry, ...] = SYMMETRIES
+) -> tuple[str, BoardSymmetry]:
+    # A digest of the canonical rows, short enough to key a cache on disk.
+    canonical_rows, symmetry = canonicalize(game_board, symmetries)
+    digest = hashlib.blake2b("\n".join(canonical_rows).encode(), digest_size=16)
+    return digest.hexdigest(), symmetry
+
+
+def from_canonical(canonical_rows: Rows, symmetry: BoardSymmetry) -> GameBoard:
+    # Maps rows in the canonical orientation back to the original board's.
+    return parse_rows(symmetry.invert(canonical_rows))
@@ -0,0 +1,109 @@
+import random
+from abc import ABC, abstractmethod
+
+from src.game_board import GameBoard, Placement
+from src.game_service import GameService
+from src.search_state import SearchState
+
+
+class BranchingStrategy(ABC):
+    # Picks the alternatives for a guess once no forced or deduced move is
+    # left. Every empty cell has two valid moves at that point, so trying both
+    # moves of a single cell already covers every solution.
+    # Whether no solution is reachable through two of the selected moves, so
+    # that solutions can be counted by visiting every leaf.
+    is_disjoint: bool = True
+
+    @abstractmethod
+    def select_moves(self, search_state: SearchState) -> list[Placement]:
+        pass
+
+
+class AllMovesBranching(BranchingStrategy):
+    # Every valid move of every empty cell in board order. Complete but
+    # revisits the same cell in sibling subtrees.
+    is_disjoint = False
+
+    def select_moves(self, search_state: SearchState) -> list[Placement]:
+        return search_state.valid_move_map.all_moves()
+
+
+class FirstCellBranching(BranchingStrategy):
+    def select_moves(self, search_state: SearchState) -> list[Placement]:
+        cell_idx = search_state.valid_move_map.first_cell_with(2)
+        if cell_idx is None:
+            return []
+        return search_state.valid_move_map.get_moves(cell_idx)
+
+
+class RandomCellBranching(BranchingStrategy):
+    # A random cell with its moves in random order, so that solving an empty
+    # board produces a random completed grid.
+    random: random.Random
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.random = random.Random(seed)
+
+    def select_moves(self, search_state: SearchState) -> list[Placement]:
+        cell_idxs = search_state.valid_move_map.cells_by_num_moves[2]
+        if not cell_idxs:
+            return []
+        cell_idx = self.random.choice(list(cell_idxs))
+        moves = search_state.valid_move_map.get_moves(cell_idx)
+        self.random.shuffle(moves)
+        return moves
+
+
+class MostConstrainedCellBranching(BranchingStrategy):
+    # Branches on the empty cell that belongs to the most windows already
+    # holding a character, breaking ties by the total number of windows, and
+    # optionally tries the least-constraining character first.
+    game_service: GameService
+    least_constraining_value: bool
+
+    def __init__(
+        self, game_service: GameService, least_constraining_value: bool = False
+    ) -> None:
+        self.game_service = game_service
+        self.least_constraining_value = least_constraining_value
+
+    def select_moves(self, search_state: SearchState) -> list[Placement]:
+        game_board = search_state.game_board
+        cell_windows = self.game_service.get_cell_windows(game_board)
+        filled_bits = game_board.x_bits | game_board.o_bits
+
+        best_cell_idx = None
+        best_score = (-1, -1)
+        valid_move_map = search_state.valid_move_map
+        for cell_idx in valid_move_map.cells_by_num_moves[2]:
+            windows = cell_windows[cell_idx]
+            num_live_windows = sum(1 for window in windows if window & filled_bits)
+            score = (num_live_windows, len(windows))
+            if score > best_score:
+                best_score = score
+                best_cell_idx = cell_idx
+        if best_cell_idx is None:
+            return []
+
+        best_moves = valid_move_map.get_moves(best_cell_idx)
+
+        if self.least_constraining_value:
+            return sorted(
+                best_moves,
+                key=lambda move: self.__num_options_removed(game_board, move),
+            )
+        return best_moves
+
+    def __num_options_removed(self, game_board: GameBoard, move: Placement) -> int:
+        # Windows left with n - 1 of the character and a single blank: placing
+        # the move takes that character away from the blank.
+        n = self.game_service.disallowed_num_consecutive_chars
+        cell_idx, char = move
+        char_bits = game_board.get_bits(char) | (1 << cell_idx)
+        empty_bits = ~(game_board.x_bits | game_board.o_bits | (1 << cell_idx))
+        return sum(
+            1
+            for window in self.game_service.get_cell_windows(game_board)[cell_idx]
+            if (char_bits & window).bit_count() == n - 1
+            and (empty_bits & window).bit_count() == 1
+        )
@@ -0,0 +1,84 @@
+import hashlib
+import time
+from typing import TYPE_CHECKING
+
+from src.board_loaders import format_rows
+from src.board_symmetry import (
+    BoardSymmetry,
+    from_canonical,
+    get_canonical_key,
+    get_symmetries,
+)
+from src.game_board import GameBoard, Placement
+from src.results import SolveResult, SolveStatus
+from src.solution_cache import CACHEABLE_STATUSES, CachedSolution, SolutionCache
+from src.solve_metrics import SolveMetrics
+from src.solver_service import SolverService
+
+if TYPE_CHECKING:
+    from src.models import Move
+
+
+class CachingSolverService:
+    # Answers boards that are rotations, reflections or x/o swaps of boards
+    # solved before from a SolutionCache. Solutions are stored in the
+    # canonical orientation and mapped back to the caller's board. A cache
+    # hit does no search, so its metrics only hold the wall time and the
+    # solver service's hooks are not called. Only the symmetries that keep
+    # the game service's rules unchanged are used, and keys include the
+    # rules, so variants can share a cache.
+    solver_service: SolverService
+    solution_cache: SolutionCache
+    symmetries: tuple[BoardSymmetry, ...]
+    rules_key: str
+
+    def __init__(
+        self, solver_service: SolverService, solution_cache: SolutionCache
+    ) -> None:
+        self.solver_service = solver_service
+        self.solution_cache = solution_cache
+        rules = solver_service.game_service.rules
+        self.symmetries = get_symmetries(rules.directions)
+        self.rules_key = hashlib.blake2b(
+            repr(rules).encode(), digest_size=4
+        ).hexdigest()
+
+    def solve(self, game_board: GameBoard) -> SolveResult:
+        status, moves_made = self.search_placements(game_board)
+        return SolveResult.from_placements(
+            status, game_board, moves_made, self.solver_service.metrics
+        )
+
+    def search(self, game_board: GameBoard) -> tuple[SolveStatus, list["Move"]]:
+        status, moves_made = self.search_placements(game_board)
+        return status, self.solver_service.to_moves(game_board, moves_made)
+
+    def search_placements(
+        self, game_board: GameBoard
+    ) -> tuple[SolveStatus, list[Placement]]:
+        start = time.perf_counter()
+        board_key, symmetry = get_canonical_key(game_board, self.symmetries)
+        key = f"{self.rules_key}-{board_key}"
+        cached_solution = self.solution_cache.get(key)
+        if cached_solution is not None:
+            self.solver_service.metrics = SolveMetrics()
+            moves_made = []
+            if cached_solution.solution_rows is not None:
+                solution = from_canonical(list(cached_solution.solution_rows), symmetry)
+                moves_made = [
+                    (cell_idx, solution.get_cell(*solution.cell_location(cell_idx)))
+                    for cell_idx in game_board.empty_cell_idxs()
+                ]
+            self.solver_service.metrics.wall_time = time.perf_counter() - start
+            return cached_solution.status, moves_made
+
+        status, moves_made = self.solver_service.search_placements(game_board)
+        if status in CACHEABLE_STATUSES:
+            solution_rows = None
+            if status == SolveStatus.SOLVED:
+                solved_board = game_board.copy()
+                for cell_idx, char in moves_made:
+                    solved_board.update_cell_idx(cell_idx, char)
+                solution_rows = tuple(symmetry.apply(format_rows(solved_board)))
+            self.solution_cache.put(key, CachedSolution(status, solution_rows))
+        return status, moves_made
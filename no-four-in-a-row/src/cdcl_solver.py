@@ -0,0 +1,330 @@
+import heapq
+from typing import Callable
+
+from src.results import SolveStatus
+
+Clause = list[int]
+
+RESTART_BASE = 100
+ACTIVITY_DECAY = 0.95
+ACTIVITY_RESCALE_LIMIT = 1e100
+MAX_LEARNED_CLAUSES = 2000
+
+
+def luby(i: int) -> int:
+    # 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+    size, seq = 1, 0
+    while size < i + 1:
+        seq += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) // 2
+        seq -= 1
+        i %= size
+    return 2**seq
+
+
+class CdclSolver:
+    # Conflict-driven clause learning over variables 1..num_vars. A literal is
+    # +var or -var. Clauses are watched by their first two literals; the
+    # literal a clause implies is moved to its front so the clause can serve
+    # as that literal's reason. Conflicts are analysed to the first unique
+    # implication point, the learned clause is added and the search jumps back
+    # to the second highest level in it. Decisions follow variable activity
+    # with saved phases, and the search restarts on a Luby schedule, dropping
+    # the learned clauses with the most decision levels at each restart.
+    num_vars: int
+    clauses: list[Clause]
+    learned_clauses: list[Clause]
+    watches: dict[int, list[Clause]]
+    values: list[int]
+    levels: list[int]
+    reasons: list[Clause | None]
+    trail: list[int]
+    trail_limits: list[int]
+    propagation_head: int
+    activities: list[float]
+    activity_increment: float
+    activity_heap: list[tuple[float, int]]
+    saved_phases: list[int]
+    is_unsatisfiable: bool
+    num_decisions: int
+    num_conflicts: int
+    num_assignments: int
+    num_restarts: int
+    num_learned_clauses: int
+
+    def __init__(self, num_vars: int) -> None:
+        self.num_vars = num_vars
+        self.clauses = []
+        self.learned_clauses = []
+        self.watches = {
+            lit: [] for var in range(1, num_vars + 1) for lit in (var, -var)
+        }
+        self.values = [0] * (num_vars + 1)
+        self.levels = [0] * (num_vars + 1)
+        self.reasons = [None] * (num_vars + 1)
+        self.trail = []
+        self.trail_limits = []
+        self.propagation_head = 0
+        self.activities = [0.0] * (num_vars + 1)
+        self.activity_increment = 1.0
+        self.activity_heap = [(0.0, var) for var in range(1, num_vars + 1)]
+        self.saved_phases = [1] * (num_vars + 1)
+        self.is_unsatisfiable = False
+        self.num_decisions = 0
+        self.num_conflicts = 0
+        self.num_assignments = 0
+        self.num_restarts = 0
+        self.num_learned_clauses = 0
+
+    def add_clause(self, clause: Clause) -> None:
+        # Only valid before solve() is called.
+        clause = list(dict.fromkeys(clause))
+        if any(-lit in clause for lit in clause):
+            return
+        if not clause:
+            self.is_unsatisfiable = True
+        elif len(clause) == 1:
+            if self.__value(clause[0]) == -1:
+                self.is_unsatisfiable = True
+            elif self.__value(clause[0]) == 0:
+                self.__assign(clause[0], None)
+        else:
+            self.clauses.append(clause)
+            self.__watch(clause)
+
+    def solve(
+        self,
+        max_assignments: int | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        stop_check_interval: int = 1000,
+    ) -> SolveStatus:
+        if self.is_unsatisfiable or self.__propagate() is not None:
+            return SolveStatus.UNSOLVABLE
+        max_num_assignments = (
+            self.num_assignments + max_assignments
+            if max_assignments is not None
+            else None
+        )
+        next_stop_check = self.num_assignments + stop_check_interval
+        num_conflicts_until_restart = RESTART_BASE * luby(self.num_restarts)
+
+        while True:
+            conflict = self.__propagate()
+            if conflict is not None:
+                self.num_conflicts += 1
+                if not self.trail_limits:
+                    return SolveStatus.UNSOLVABLE
+                learned_clause, backjump_level = self.__analyse(conflict)
+                self.__cancel_until(backjump_level)
+                self.__learn(learned_clause)
+                self.__decay_activities()
+                num_conflicts_until_restart -= 1
+                continue
+
+            if (
+                max_num_assignments is not None
+                and self.num_assignments >= max_num_assignments
+            ):
+                return SolveStatus.NODE_LIMIT_REACHED
+            if should_stop is not None and self.num_assignments >= next_stop_check:
+                if should_stop():
+                    return SolveStatus.CANCELLED
+                next_stop_check = self.num_assignments + stop_check_interval
+
+            if num_conflicts_until_restart <= 0:
+                self.num_restarts += 1
+                self.__cancel_until(0)
+                self.__reduce_learned_clauses()
+                num_conflicts_until_restart = RESTART_BASE * luby(self.num_restarts)
+                continue
+
+            var = self.__pick_branching_var()
+            if var is None:
+                return SolveStatus.SOLVED
+            self.num_decisions += 1
+            self.trail_limits.append(len(self.trail))
+            self.__assign(var * self.saved_phases[var], None)
+
+    def get_model(self) -> list[bool]:
+        # Indexed by variable; index 0 is unused.
+        return [value == 1 for value in self.values]
+
+    def __value(self, lit: int) -> int:
+        value = self.values[abs(lit)]
+        return value if lit > 0 else -value
+
+    def __assign(self, lit: int, reason: Clause | None) -> None:
+        var = abs(lit)
+        self.values[var] = 1 if lit > 0 else -1
+        self.levels[var] = len(self.trail_limits)
+        self.reasons[var] = reason
+        self.trail.append(lit)
+        self.num_assignments += 1
+
+    def __watch(self, clause: Clause) -> None:
+        self.watches[clause[0]].append(clause)
+        self.watches[clause[1]].append(clause)
+
+    def __propagate(self) -> Clause | None:
+        # Returns a clause with every literal false, if any.
+        values = self.values
+        trail = self.trail
+        watches = self.watches
+        while self.propagation_head < len(trail):
+            false_lit = -trail[self.propagation_head]
+            self.propagation_head += 1
+            watching = watches[false_lit]
+            still_watching = []
+            for clause_idx, clause in enumerate(watching):
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                first_value = values[abs(first)]
+                if (first_value if first > 0 else -first_value) == 1:
+                    still_watching.append(clause)
+                    continue
+                for lit_idx in range(2, len(clause)):
+                    lit = clause[lit_idx]
+                    value = values[abs(lit)]
+                    if (value if lit > 0 else -value) != -1:
+                        clause[1], clause[lit_idx] = lit, false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    still_watching.append(clause)
+                    if first_value == 0:
+                        self.__assign(first, clause)
+                    else:
+                        still_watching.extend(watching[clause_idx + 1 :])
+                        watches[false_lit] = still_watching
+                        return clause
+            watches[false_lit] = still_watching
+        return None
+
+    def __analyse(self, conflict: Clause) -> tuple[Clause, int]:
+        # Resolves the conflict clause with the reasons of the most recently
+        # assigned literals of the current level until one literal of that
+        # level is left.
+        levels = self.levels
+        current_level = len(self.trail_limits)
+        seen = set()
+        learned_clause = [0]
+        num_pending = 0
+        trail_idx = len(self.trail) - 1
+        clause: Clause | None = conflict
+        implied_lit = 0
+        while True:
+            assert clause is not None
+            for lit in clause if implied_lit == 0 else clause[1:]:
+                var = abs(lit)
+                if var in seen or levels[var] == 0:
+                    continue
+                seen.add(var)
+                self.__bump_activity(var)
+                if levels[var] == current_level:
+                    num_pending += 1
+                else:
+                    learned_clause.append(lit)
+            while abs(self.trail[trail_idx]) not in seen:
+                trail_idx -= 1
+            implied_lit = self.trail[trail_idx]
+            trail_idx -= 1
+            num_pending -= 1
+            if num_pending == 0:
+                break
+            clause = self.reasons[abs(implied_lit)]
+        learned_clause[0] = -implied_lit
+
+        backjump_level = 0
+        if len(learned_clause) > 1:
+            # Watch the literal assigned last among the rest.
+            max_idx = max(
+                range(1, len(learned_clause)),
+                key=lambda idx: levels[abs(learned_clause[idx])],
+            )
+            learned_clause[1], learned_clause[max_idx] = (
+                learned_clause[max_idx],
+                learned_clause[1],
+            )
+            backjump_level = levels[abs(learned_clause[1])]
+        return learned_clause, backjump_level
+
+    def __learn(self, learned_clause: Clause) -> None:
+        self.num_learned_clauses += 1
+        if len(learned_clause) == 1:
+            self.__assign(learned_clause[0], None)
+            return
+        self.learned_clauses.append(learned_clause)
+        self.__watch(learned_clause)
+        self.__assign(learned_clause[0], learned_clause)
+
+    def __cancel_until(self, level: int) -> None:
+        if len(self.trail_limits) <= level:
+            return
+        trail_limit = self.trail_limits[level]
+        for lit in self.trail[trail_limit:]:
+            var = abs(lit)
+            self.saved_phases[var] = 1 if lit > 0 else -1
+            self.values[var] = 0
+            self.reasons[var] = None
+            heapq.heappush(self.activity_heap, (-self.activities[var], var))
+        del self.trail[trail_limit:]
+        del self.trail_limits[level:]
+        self.propagation_head = trail_limit
+        if len(self.activity_heap) > 4 * self.num_vars:
+            self.__rebuild_activity_heap()
+
+    def __pick_branching_var(self) -> int | None:
+        # The heap may hold stale entries; assigned variables are skipped.
+        while self.activity_heap:
+            _, var = heapq.heappop(self.activity_heap)
+            if self.values[var] == 0:
+                return var
+        for var in range(1, self.num_vars + 1):
+            if self.values[var] == 0:
+                return var
+        return None
+
+    def __bump_activity(self, var: int) -> None:
+        self.activities[var] += self.activity_increment
+        if self.activities[var] > ACTIVITY_RESCALE_LIMIT:
+            self.activities = [
+                activity / ACTIVITY_RESCALE_LIMIT for activity in self.activities
+            ]
+            self.activity_increment /= ACTIVITY_RESCALE_LIMIT
+            self.__rebuild_activity_heap()
+        elif self.values[var] == 0:
+            heapq.heappush(self.activity_heap, (-self.activities[var], var))
+
+    def __rebuild_activity_heap(self) -> None:
+        self.activity_heap = [
+            (-self.activities[var], var)
+            for var in range(1, self.num_vars + 1)
+            if self.values[var] == 0
+        ]
+        heapq.heapify(self.activity_heap)
+
+    def __decay_activities(self) -> None:
+        self.activity_increment /= ACTIVITY_DECAY
+
+    def __reduce_learned_clauses(self) -> None:
+        # Called at level 0, where no learned clause is the reason for a
+        # literal that conflict analysis could reach.
+        if len(self.learned_clauses) <= MAX_LEARNED_CLAUSES:
+            return
+        self.learned_clauses.sort(key=self.__num_levels)
+        removed = {
+            id(clause) for clause in self.learned_clauses[MAX_LEARNED_CLAUSES // 2 :]
+        }
+        del self.learned_clauses[MAX_LEARNED_CLAUSES // 2 :]
+        for lit, watching in self.watches.items():
+            self.watches[lit] = [
+                clause for clause in watching if id(clause) not in removed
+            ]
+
+    def __num_levels(self, clause: Clause) -> int:
+        # The number of distinct decision levels in a clause when it was last
+        # falsified; fewer levels means the clause prunes more.
+        return len({self.levels[abs(lit)] for lit in clause})
@@ -0,0 +1,170 @@
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from src.game_board import GameBoard, Placement
+from src.results import SolveResult, SolveStatus
+from src.solve_metrics import SolveMetrics
+from src.solver_service import SolverService
+from src.solver_workers import (
+    EncodedBoard,
+    copy_for_workers,
+    get_worker_solver_service,
+    init_worker,
+)
+
+if TYPE_CHECKING:
+    from src.models import Move
+
+
+def solve_component(
+    encoded_board: EncodedBoard, cell_idxs: list[int]
+) -> tuple[SolveStatus, list[Placement], SolveMetrics]:
+    worker_solver_service = get_worker_solver_service()
+    status, moves_made = worker_solver_service.search_placements(
+        GameBoard.from_encoded(encoded_board), cell_idxs
+    )
+    return status, moves_made, worker_solver_service.metrics
+
+
+class DecomposingSolverService:
+    # Splits the empty cells into components that share no live window, i.e.
+    # one that does not already hold both characters, nor a row or column
+    # when counts are balanced, and solves each component on its own. No
+    # constraint links two components, so any combination of their solutions
+    # solves the board, and a wrong guess in one component never makes the
+    # search re-explore another. The cost of the search is then the sum of the
+    # components' costs rather than their product. Limits such as max_nodes
+    # apply to each component separately.
+    solver_service: SolverService
+    num_workers: int
+
+    def __init__(self, solver_service: SolverService, num_workers: int = 1) -> None:
+        self.solver_service = solver_service
+        self.num_workers = num_workers
+
+    def solve(self, game_board: GameBoard) -> SolveResult:
+        status, moves_made = self.search_placements(game_board)
+        return SolveResult.from_placements(
+            status, game_board, moves_made, self.solver_service.metrics
+        )
+
+    def search(self, game_board: GameBoard) -> tuple[SolveStatus, list["Move"]]:
+        status, moves_made = self.search_placements(game_board)
+        return status, self.solver_service.to_moves(game_board, moves_made)
+
+    def search_placements(
+        self, game_board: GameBoard
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # The solver service's metrics cover every component.
+        components = self.find_components(game_board)
+        if len(components) <= 1:
+            return self.solver_service.search_placements(game_board)
+
+        start = time.perf_counter()
+        metrics = SolveMetrics()
+        if self.num_workers > 1:
+            status, moves_made = self.__solve_in_parallel(
+                game_board, components, metrics
+            )
+        else:
+            status, moves_made = self.__solve_in_turn(game_board, components, metrics)
+        metrics.wall_time = time.perf_counter() - start
+        self.solver_service.metrics = metrics
+        return status, moves_made
+
+    def find_components(self, game_board: GameBoard) -> list[list[int]]:
+        # Union-find over the empty cells, joining the empty cells of every
+        # live window, and of every row and column when counts are balanced.
+        # Components are sorted by their first cell.
+        filled_bits = game_board.x_bits | game_board.o_bits
+        empty_cell_idxs = game_board.empty_cell_idxs()
+        parents = {cell_idx: cell_idx for cell_idx in empty_cell_idxs}
+
+        def find(cell_idx: int) -> int:
+            while parents[cell_idx] != cell_idx:
+                parents[cell_idx] = parents[parents[cell_idx]]
+                cell_idx = parents[cell_idx]
+            return cell_idx
+
+        def join(cell_idx: int, cells_bits: int) -> None:
+            empty_bits = cells_bits & ~filled_bits
+            while empty_bits:
+                cell_bit = empty_bits & -empty_bits
+                other_root = find(cell_bit.bit_length() - 1)
+                root = find(cell_idx)
+                if other_root != root:
+                    parents[max(root, other_root)] = min(root, other_root)
+                empty_bits ^= cell_bit
+
+        compiled_rules = self.solver_service.game_service.get_compiled_rules(game_board)
+        for cell_idx in empty_cell_idxs:
+            for window in compiled_rules.cell_windows[cell_idx]:
+                if not (window & game_board.x_bits and window & game_board.o_bits):
+                    join(cell_idx, window)
+            for line, _ in compiled_rules.cell_lines.get(cell_idx, []):
+                join(cell_idx, line)
+
+        components: dict[int, list[int]] = {}
+        for cell_idx in empty_cell_idxs:
+            components.setdefault(find(cell_idx), []).append(cell_idx)
+        return list(components.values())
+
+    def __solve_in_turn(
+        self,
+        game_board: GameBoard,
+        components: list[list[int]],
+        metrics: SolveMetrics,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # Smallest components first, so an unsolvable one is found cheaply.
+        moves_made: list[Placement] = []
+        for cell_idxs in sorted(components, key=len):
+            status, component_moves = self.solver_service.search_placements(
+                game_board, cell_idxs
+            )
+            metrics.merge(self.solver_service.metrics)
+            if status != SolveStatus.SOLVED:
+                return status, []
+            moves_made += component_moves
+        return SolveStatus.SOLVED, moves_made
+
+    def __solve_in_parallel(
+        self,
+        game_board: GameBoard,
+        components: list[list[int]],
+        metrics: SolveMetrics,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # The first component that is not solved stops the others.
+        stop_event = multiprocessing.Event()
+        moves_by_component: dict[int, list[Placement]] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(self.num_workers, len(components)),
+            initializer=init_worker,
+            initargs=(copy_for_workers(self.solver_service), stop_event),
+        ) as executor:
+            pending: dict[Future, int] = {
+                executor.submit(
+                    solve_component, game_board.encode(), cell_idxs
+                ): component_idx
+                for component_idx, cell_idxs in enumerate(components)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    component_idx = pending.pop(future)
+                    status, component_moves, component_metrics = future.result()
+                    metrics.merge(component_metrics)
+                    if status != SolveStatus.SOLVED:
+                        stop_event.set()
+                        for other_future in pending:
+                            other_future.cancel()
+                        return status, []
+                    moves_by_component[component_idx] = component_moves
+
+        # Components in board order, so the moves do not depend on timing.
+        return SolveStatus.SOLVED, [
+            move
+            for component_idx in range(len(components))
+            for move in moves_by_component[component_idx]
+        ]
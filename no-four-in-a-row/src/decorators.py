@@ -1,13 +0,0 @@
-# type: ignore
-import time
-
-
-def timing_decorator(func):
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        result = func(*args, **kwargs)
-        end = time.time()
-        print(f"{func.__name__} executed in {end - start} seconds")
-        return result
-
-    return wrapper
@@ -1,17 +1,39 @@
 import csv
-from prettytable import PrettyTable
-from src.models import Move
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models import Move
+
+EMPTY_CHAR = " "
+X_CHAR = "x"
+O_CHAR = "o"
+
+# A move inside the solver: the bit index of the cell and the character.
+Placement = tuple[int, str]
 
 
 class GameBoard:
-    board: list[list[str]]
+    # Each player is stored as a bitmask. Cell (row_idx, col_idx) maps to bit
+    # row_idx * stride + col_idx, where stride leaves one always-empty guard
+    # column at the end of every row so that shifted runs never wrap around.
     n_rows: int
     n_cols: int
+    stride: int
+    x_bits: int
+    o_bits: int
 
     def __init__(self, board: list[list[str]]) -> None:
-        self.board = board
         self.n_rows = len(board)
         self.n_cols = len(board[0])
+        self.stride = self.n_cols + 1
+        self.x_bits = 0
+        self.o_bits = 0
+        for row_idx, row in enumerate(board):
+            for col_idx, char in enumerate(row):
+                if char == X_CHAR:
+                    self.x_bits |= 1 << self.bit_index(row_idx, col_idx)
+                elif char == O_CHAR:
+                    self.o_bits |= 1 << self.bit_index(row_idx, col_idx)
 
     @staticmethod
     def from_csv(board_path: str) -> "GameBoard":
@@ -27,38 +49,102 @@ class GameBoard:
     def from_board(board: list[list[str]]) -> "GameBoard":
         return GameBoard(board=board)
 
+    @staticmethod
+    def from_encoded(encoded_board: tuple[int, int, int, int]) -> "GameBoard":
+        n_rows, n_cols, x_bits, o_bits = encoded_board
+        game_board = GameBoard.__new__(GameBoard)
+        game_board.n_rows = n_rows
+        game_board.n_cols = n_cols
+        game_board.stride = n_cols + 1
+        game_board.x_bits = x_bits
+        game_board.o_bits = o_bits
+        return game_board
+
+    def encode(self) -> tuple[int, int, int, int]:
+        return self.n_rows, self.n_cols, self.x_bits, self.o_bits
+
+    @property
+    def board(self) -> list[list[str]]:
+        return [
+            [self.get_cell(row_idx, col_idx) for col_idx in range(self.n_cols)]
+            for row_idx in range(self.n_rows)
+        ]
+
+    def bit_index(self, row_idx: int, col_idx: int) -> int:
+        return row_idx * self.stride + col_idx
+
+    def cell_location(self, cell_idx: int) -> tuple[int, int]:
+        return divmod(cell_idx, self.stride)
+
+    def cell_idxs(self) -> list[int]:
+        return [
+            self.bit_index(row_idx, col_idx)
+            for row_idx in range(self.n_rows)
+            for col_idx in range(self.n_cols)
+        ]
+
+    def empty_cell_idxs(self) -> list[int]:
+        filled_bits = self.x_bits | self.o_bits
+        return [
+            cell_idx for cell_idx in self.cell_idxs() if not filled_bits >> cell_idx & 1
+        ]
+
+    def get_bits(self, char: str) -> int:
+        if char == X_CHAR:
+            return self.x_bits
+        if char == O_CHAR:
+            return self.o_bits
+        return 0
+
     def get_cell(self, row_idx: int, col_idx: int) -> str:
-        return self.board[row_idx][col_idx]
+        cell_bit = 1 << self.bit_index(row_idx, col_idx)
+        if self.x_bits & cell_bit:
+            return X_CHAR
+        if self.o_bits & cell_bit:
+            return O_CHAR
+        return EMPTY_CHAR
 
     def update_cell(self, row_idx: int, col_idx: int, char: str) -> None:
-        self.board[row_idx][col_idx] = char
+        self.update_cell_idx(self.bit_index(row_idx, col_idx), char)
+
+    def update_cell_idx(self, cell_idx: int, char: str) -> None:
+        cell_bit = 1 << cell_idx
+        self.x_bits &= ~cell_bit
+        self.o_bits &= ~cell_bit
+        if char == X_CHAR:
+            self.x_bits |= cell_bit
+        elif char == O_CHAR:
+            self.o_bits |= cell_bit
 
     def copy(self) -> "GameBoard":
-        shallow_board = [row[:] for row in self.board]
-        return GameBoard.from_board(board=shallow_board)
+        return GameBoard.from_encoded(self.encode())
+
+    def display_board(self, latest_move: "Move | None" = None) -> None:
+        print(
+            self.format_table(
+                self.bit_index(latest_move.cell.row_idx, latest_move.cell.col_idx)
+                if latest_move is not None
+                else None
+            )
+        )
+
+    def format_table(self, latest_cell_idx: int | None = None) -> str:
+        # prettytable is only imported when a table is rendered.
+        from prettytable import PrettyTable
 
-    def display_board(self, latest_move: Move | None = None) -> None:
-        column_names = [" "] + [str(i) for i in range(len(self.board[0]))]
+        column_names = [" "] + [str(i) for i in range(self.n_cols)]
         table = PrettyTable(column_names)
-        coloured_board = self.__colour_board(latest_move)
+        coloured_board = self.__colour_board(latest_cell_idx)
         for y, row in enumerate(coloured_board):
             table.add_row([y] + row)
-        print(table)
+        return str(table)
 
-    def __colour_board(self, latest_move: Move | None) -> list[list[str]]:
+    def __colour_board(self, latest_cell_idx: int | None) -> list[list[str]]:
         coloured_board = []
         for row_idx, row in enumerate(self.board):
             coloured_row = []
             for col_idx, char in enumerate(row):
-                is_latest = (
-                    (row_idx, col_idx)
-                    == (
-                        latest_move.cell.row_idx,
-                        latest_move.cell.col_idx,
-                    )
-                    if latest_move is not None
-                    else False
-                )
+                is_latest = self.bit_index(row_idx, col_idx) == latest_cell_idx
                 coloured_row.append(self.__add_colour_to_char(char, is_latest))
             coloured_board.append(coloured_row)
         return coloured_board
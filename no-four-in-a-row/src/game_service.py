@@ -1,22 +1,35 @@
+from typing import TYPE_CHECKING
+
 from src.game_board import GameBoard
-from src.models import BoardLocation, Move
+from src.rule_spec import CompiledRules, RuleSpec
+
+if TYPE_CHECKING:
+    from src.models import BoardLocation, Move
 
 
 class InvalidMoveException(Exception):
     pass
 
 
-VERTICAL_MOVE = (1, 0)
-HORIZONTAL_MOVE = (0, 1)
-FORWARD_DIAGONAL_MOVE = (-1, 1)
-BACKWARD_DIAGONAL_MOVE = (1, 1)
-
-
 class GameService:
-    def __init__(self, disallowed_num_consecutive_chars: int = 4) -> None:
-        self.disallowed_num_consecutive_chars = disallowed_num_consecutive_chars
+    # Applies a RuleSpec. The spec is compiled into bitmask tables once per
+    # board shape, which every check and the solver's services look up.
+    rules: RuleSpec
+    disallowed_num_consecutive_chars: int
+    compiled_rules_by_shape: dict[tuple[int, int], CompiledRules]
 
-    def make_move(self, game_board: GameBoard, new_move: Move) -> GameBoard:
+    def __init__(
+        self, disallowed_num_consecutive_chars: int = 4, rules: RuleSpec | None = None
+    ) -> None:
+        self.rules = (
+            rules
+            if rules is not None
+            else RuleSpec(run_length=disallowed_num_consecutive_chars)
+        )
+        self.disallowed_num_consecutive_chars = self.rules.run_length
+        self.compiled_rules_by_shape = {}
+
+    def make_move(self, game_board: GameBoard, new_move: "Move") -> GameBoard:
         if self.is_valid_move(game_board, new_move):
             new_game_board = game_board.copy()
             new_game_board.update_cell(
@@ -28,25 +41,52 @@ class GameService:
             raise InvalidMoveException()
         return new_game_board
 
-    def is_valid_move(self, game_board: GameBoard, move: Move) -> bool:
-        return (
-            self.__is_within_board_boundaries(game_board, move.cell)
-            and self.__is_empty_spot(game_board, move.cell)
-            and self.__is_valid_num_consecutive_chars(game_board, move, VERTICAL_MOVE)
-            and self.__is_valid_num_consecutive_chars(game_board, move, HORIZONTAL_MOVE)
-            and self.__is_valid_num_consecutive_chars(
-                game_board, move, FORWARD_DIAGONAL_MOVE
-            )
-            and self.__is_valid_num_consecutive_chars(
-                game_board, move, BACKWARD_DIAGONAL_MOVE
-            )
+    def is_valid_move(self, game_board: GameBoard, move: "Move") -> bool:
+        return self.__is_within_board_boundaries(
+            game_board, move.cell
+        ) and self.is_valid_placement(
+            game_board,
+            game_board.bit_index(move.cell.row_idx, move.cell.col_idx),
+            move.char,
         )
 
-    def __is_empty_spot(self, game_board: GameBoard, cell: BoardLocation) -> bool:
-        return game_board.get_cell(row_idx=cell.row_idx, col_idx=cell.col_idx) == " "
+    def is_valid_placement(
+        self, game_board: GameBoard, cell_idx: int, char: str
+    ) -> bool:
+        # Same as is_valid_move for a cell given by its bit index, which must
+        # lie on the board. Used by the solver to avoid building Moves.
+        if not self.__is_empty_spot(game_board, cell_idx):
+            return False
+        compiled_rules = self.get_compiled_rules(game_board)
+        player_bits = game_board.get_bits(char)
+        for shift in compiled_rules.shifts:
+            if not self.__is_valid_num_consecutive_chars(player_bits, cell_idx, shift):
+                return False
+        if compiled_rules.cell_lines:
+            for line, max_count in compiled_rules.cell_lines[cell_idx]:
+                if (player_bits & line).bit_count() >= max_count:
+                    return False
+        return True
+
+    def get_compiled_rules(self, game_board: GameBoard) -> CompiledRules:
+        shape = (game_board.n_rows, game_board.n_cols)
+        compiled_rules = self.compiled_rules_by_shape.get(shape)
+        if compiled_rules is None:
+            compiled_rules = self.rules.compile(*shape)
+            self.compiled_rules_by_shape[shape] = compiled_rules
+        return compiled_rules
+
+    def get_cell_windows(self, game_board: GameBoard) -> dict[int, list[int]]:
+        # Every run of disallowed_num_consecutive_chars cells as a bitmask over
+        # the board, indexed by the bit index of each cell in it. Built once
+        # per board shape.
+        return self.get_compiled_rules(game_board).cell_windows
+
+    def __is_empty_spot(self, game_board: GameBoard, cell_idx: int) -> bool:
+        return not (game_board.x_bits | game_board.o_bits) >> cell_idx & 1
 
     def __is_within_board_boundaries(
-        self, game_board: GameBoard, loc: BoardLocation
+        self, game_board: GameBoard, loc: "BoardLocation"
     ) -> bool:
         return (
             0 <= loc.row_idx < game_board.n_rows
@@ -54,38 +94,16 @@ class GameService:
         )
 
     def __is_valid_num_consecutive_chars(
-        self, game_board: GameBoard, move: Move, direction: tuple[int, int]
+        self, player_bits: int, cell_idx: int, shift: int
     ) -> bool:
-        return (
-            self.__count_consecutive_chars(
-                game_board=game_board, move=move, direction=direction
-            )
-            < self.disallowed_num_consecutive_chars
-        )
-
-    def __count_consecutive_chars(
-        self, game_board: GameBoard, move: Move, direction: tuple[int, int]
-    ) -> int:
-        temp_board = game_board.copy()
-        temp_board.update_cell(
-            row_idx=move.cell.row_idx, col_idx=move.cell.col_idx, char=move.char
-        )
+        # A run along a direction is the same set of cells as a run along the
+        # opposite direction, so only the magnitude of the bit shift matters.
+        cell_bit = 1 << cell_idx
+        player_bits |= cell_bit
 
-        count = 0
-        for i in range(
-            -1 * self.disallowed_num_consecutive_chars + 1,
-            self.disallowed_num_consecutive_chars,
-        ):
-            current_row_idx = move.cell.row_idx + i * direction[0]
-            current_col_idx = move.cell.col_idx + i * direction[1]
-            if (
-                0 <= current_row_idx < temp_board.n_rows
-                and 0 <= current_col_idx < temp_board.n_cols
-                and temp_board.get_cell(current_row_idx, current_col_idx) == move.char
-            ):
-                count += 1
-                if count == self.disallowed_num_consecutive_chars:
-                    return count
-            else:
-                count = 0
-        return count
+        run_starts = player_bits
+        starts_covering_cell = cell_bit
+        for i in range(1, self.disallowed_num_consecutive_chars):
+            run_starts &= player_bits >> (i * shift)
+            starts_covering_cell |= cell_bit >> (i * shift)
+        return not run_starts & starts_covering_cell
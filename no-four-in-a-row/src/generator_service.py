@@ -0,0 +1,218 @@
+import json
+import os
+import random
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TextIO
+
+from src.board_loaders import format_rows
+from src.branching_strategies import RandomCellBranching
+from src.game_board import EMPTY_CHAR, GameBoard
+from src.results import SolveStatus
+from src.solver_service import SolverService
+
+if TYPE_CHECKING:
+    from src.models import BoardShape
+
+MAX_IN_FLIGHT_PER_WORKER = 4
+DEFAULT_MAX_ATTEMPTS = 10
+
+
+@dataclass
+class GeneratedPuzzle:
+    seed: int
+    puzzle: GameBoard
+    solution: GameBoard
+    # Measured by solving the puzzle with the generator's difficulty solver
+    # service.
+    num_guesses: int
+    num_board_states: int
+
+    def to_json_dict(self) -> dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "puzzle": format_rows(self.puzzle),
+            "solution": format_rows(self.solution),
+            "num_guesses": self.num_guesses,
+            "num_board_states": self.num_board_states,
+        }
+
+
+# Set in each worker process by init_worker.
+worker_generator_service: "GeneratorService | None" = None
+
+
+def init_worker(generator_service: "GeneratorService") -> None:
+    global worker_generator_service
+    worker_generator_service = generator_service
+
+
+def generate_seeded_puzzle(n_rows: int, n_cols: int, seed: int) -> GeneratedPuzzle:
+    assert worker_generator_service is not None
+    return worker_generator_service.generate_puzzle(n_rows, n_cols, seed)
+
+
+class GeneratorService:
+    # Generates puzzles with a unique solution. A random completed grid is
+    # found by solving an empty board with random branching, then clues are
+    # removed in random order, each removal kept only if the solution stays
+    # unique. Once a clue cannot be removed it never can be later, as removing
+    # others only adds solutions, so a single pass suffices.
+    #
+    # Difficulty is the number of guesses and board states
+    # difficulty_solver_service takes to solve the puzzle, by default the
+    # same solver service. With a target difficulty, clue removal stops as
+    # soon as the puzzle takes at least target_guesses guesses or
+    # target_board_states board states; grids that never get there are
+    # retried up to max_attempts times, keeping the hardest puzzle. Every
+    # puzzle depends only on its seed, so output is reproducible whatever the
+    # number of workers.
+    solver_service: SolverService
+    difficulty_solver_service: SolverService
+    target_guesses: int | None
+    target_board_states: int | None
+    max_attempts: int
+
+    def __init__(
+        self,
+        solver_service: SolverService,
+        target_guesses: int | None = None,
+        target_board_states: int | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        difficulty_solver_service: SolverService | None = None,
+    ) -> None:
+        self.solver_service = solver_service
+        self.difficulty_solver_service = (
+            difficulty_solver_service
+            if difficulty_solver_service is not None
+            else solver_service
+        )
+        self.target_guesses = target_guesses
+        self.target_board_states = target_board_states
+        self.max_attempts = max_attempts
+
+    def generate(self, board_shape: "BoardShape", seed: int = 0) -> GeneratedPuzzle:
+        return self.generate_puzzle(board_shape.rows, board_shape.cols, seed)
+
+    def generate_puzzle(self, n_rows: int, n_cols: int, seed: int) -> GeneratedPuzzle:
+        rng = random.Random(seed)
+        hardest_puzzle = None
+        for _ in range(self.max_attempts):
+            solution = self.generate_solution(n_rows, n_cols, rng.getrandbits(64))
+            puzzle = self.__remove_clues(solution, rng)
+            num_guesses, num_board_states = self.__measure_difficulty(puzzle)
+            generated_puzzle = GeneratedPuzzle(
+                seed=seed,
+                puzzle=puzzle,
+                solution=solution,
+                num_guesses=num_guesses,
+                num_board_states=num_board_states,
+            )
+            if self.__is_target_reached(num_guesses, num_board_states):
+                return generated_puzzle
+            if hardest_puzzle is None or (
+                (num_guesses, num_board_states)
+                > (hardest_puzzle.num_guesses, hardest_puzzle.num_board_states)
+            ):
+                hardest_puzzle = generated_puzzle
+        assert hardest_puzzle is not None
+        return hardest_puzzle
+
+    def generate_many(
+        self,
+        board_shape: "BoardShape",
+        count: int,
+        seed: int = 0,
+        num_workers: int | None = None,
+    ) -> Iterator[GeneratedPuzzle]:
+        # Puzzle i uses seed + i. Puzzles are yielded in seed order as they
+        # are generated.
+        n_rows, n_cols = board_shape.rows, board_shape.cols
+        num_workers = num_workers if num_workers is not None else os.cpu_count() or 1
+        if num_workers <= 1:
+            for puzzle_seed in range(seed, seed + count):
+                yield self.generate_puzzle(n_rows, n_cols, puzzle_seed)
+            return
+
+        max_in_flight = num_workers * MAX_IN_FLIGHT_PER_WORKER
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=init_worker, initargs=(self,)
+        ) as executor:
+            pending: list[Future] = []
+            next_seed = seed
+            while pending or next_seed < seed + count:
+                while next_seed < seed + count and len(pending) < max_in_flight:
+                    pending.append(
+                        executor.submit(
+                            generate_seeded_puzzle, n_rows, n_cols, next_seed
+                        )
+                    )
+                    next_seed += 1
+                yield pending.pop(0).result()
+
+    def write_json_lines(
+        self,
+        board_shape: "BoardShape",
+        count: int,
+        output: TextIO,
+        seed: int = 0,
+        num_workers: int | None = None,
+    ) -> None:
+        for generated_puzzle in self.generate_many(
+            board_shape, count, seed=seed, num_workers=num_workers
+        ):
+            output.write(json.dumps(generated_puzzle.to_json_dict()) + "\n")
+            output.flush()
+
+    def generate_solution(self, n_rows: int, n_cols: int, seed: int) -> GameBoard:
+        # A random completed grid.
+        game_service = self.solver_service.game_service
+        random_solver_service = SolverService(
+            game_service,
+            branching_strategy=RandomCellBranching(seed),
+            use_transposition_table=False,
+        )
+        solution = GameBoard([[EMPTY_CHAR] * n_cols for _ in range(n_rows)])
+        status, moves_made = random_solver_service.search_placements(solution)
+        if status != SolveStatus.SOLVED:
+            raise ValueError(f"No valid {n_rows}x{n_cols} board exists")
+        for cell_idx, char in moves_made:
+            solution.update_cell_idx(cell_idx, char)
+        return solution
+
+    def __remove_clues(self, solution: GameBoard, rng: random.Random) -> GameBoard:
+        puzzle = solution.copy()
+        cell_idxs = puzzle.cell_idxs()
+        rng.shuffle(cell_idxs)
+        for cell_idx in cell_idxs:
+            char = puzzle.get_cell(*puzzle.cell_location(cell_idx))
+            puzzle.update_cell_idx(cell_idx, EMPTY_CHAR)
+            if not self.solver_service.count_solutions(puzzle, limit=2).is_unique:
+                puzzle.update_cell_idx(cell_idx, char)
+            elif self.__has_target() and self.__is_target_reached(
+                *self.__measure_difficulty(puzzle)
+            ):
+                break
+        return puzzle
+
+    def __measure_difficulty(self, puzzle: GameBoard) -> tuple[int, int]:
+        solver_service = self.difficulty_solver_service
+        solver_service.search_placements(puzzle)
+        return (
+            solver_service.metrics.num_guesses,
+            solver_service.metrics.num_board_states,
+        )
+
+    def __has_target(self) -> bool:
+        return self.target_guesses is not None or self.target_board_states is not None
+
+    def __is_target_reached(self, num_guesses: int, num_board_states: int) -> bool:
+        if not self.__has_target():
+            return True
+        if self.target_guesses is not None and num_guesses >= self.target_guesses:
+            return True
+        return (
+            self.target_board_states is not None
+            and num_board_states >= self.target_board_states
+        )
@@ -1,13 +1,370 @@
+import argparse
+import itertools
+import os
+import signal
+import sys
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from src.batch_solver_service import iter_boards, iter_boards_or_errors
 from src.game_board import GameBoard
 from src.game_service import GameService
+from src.reporters import (
+    BoardRenderer,
+    FinalBoardReporter,
+    PlainTextRenderer,
+    QuietReporter,
+    ReplayReporter,
+    Reporter,
+    TableRenderer,
+)
+from src.results import SolveResult
+from src.rule_spec import DIRECTIONS, ORTHOGONAL_DIRECTIONS, RuleSpec
 from src.solver_service import SolverService
 
+# The CLI is started once per board by some callers, so modules only needed
+# by one option, and pydantic, are imported when that option is used.
+if TYPE_CHECKING:
+    from src.async_solver_service import AsyncSolverService
+    from src.models import BoardShape
+
+DEFAULT_BOARD_PATH = "boards/bigger-board.csv"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve No Four In A Row boards.")
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        default=[DEFAULT_BOARD_PATH],
+        help="CSV, text (.txt) or packed (.nfb) board files, directories of "
+        "board files, glob patterns, or - to read one JSON list of rows per line "
+        "from stdin",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="print one JSON result per board instead of displaying the solve",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="print batch results in input order instead of completion order",
+    )
+    parser.add_argument(
+        "--pack",
+        metavar="FILE",
+        help="write the boards to FILE in the packed binary format instead of "
+        "solving them",
+    )
+    parser.add_argument(
+        "--run-length",
+        type=int,
+        default=4,
+        help="length of the runs of one symbol that are not allowed",
+    )
+    parser.add_argument(
+        "--no-diagonals",
+        action="store_true",
+        help="only count runs along rows and columns",
+    )
+    parser.add_argument(
+        "--balanced",
+        action="store_true",
+        help="require every row and column to hold as many x as o",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["backtracking", "sat"],
+        default="backtracking",
+        help="search engine used to solve each board",
+    )
+    parser.add_argument(
+        "--decompose",
+        action="store_true",
+        help="solve independent groups of empty cells separately, on --workers "
+        "processes",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="reuse solutions of symmetric boards, stored in the SQLite database "
+        "FILE",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="serve JSON line requests on the Unix socket SOCKET instead of "
+        "solving boards",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="seconds a served request may take, including time queued",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="FILE",
+        help="save the search to FILE every --checkpoint-interval seconds, on "
+        "SIGUSR1, and on SIGTERM before stopping",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=float,
+        default=None,
+        help="seconds between checkpoints (default 300)",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="FILE",
+        help="carry on the search saved in the checkpoint FILE instead of "
+        "solving boards",
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        metavar="COUNT",
+        help="print COUNT generated puzzles with a unique solution as JSON lines "
+        "instead of solving boards",
+    )
+    parser.add_argument(
+        "--shape",
+        type=parse_shape,
+        default=None,
+        help="shape of generated puzzles as ROWSxCOLS (default 8x8)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first generated puzzle"
+    )
+    parser.add_argument(
+        "--target-guesses",
+        type=int,
+        default=None,
+        help="minimum guesses a generated puzzle takes without propagation",
+    )
+    parser.add_argument(
+        "--target-board-states",
+        type=int,
+        default=None,
+        help="minimum board states a generated puzzle takes without propagation",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["quiet", "final", "replay"],
+        default="replay",
+        help="print nothing, the final board, or the board after every move",
+    )
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="render boards as plain text instead of coloured tables",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="append the metrics of every solve to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="write every guess, propagation and backtrack to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="profile the solves with cProfile and write the stats to FILE",
+    )
+    return parser.parse_args(argv)
+
+
+def parse_shape(shape: str) -> "BoardShape":
+    from src.models import BoardShape
+
+    try:
+        rows, cols = shape.lower().split("x")
+        return BoardShape(rows=int(rows), cols=int(cols))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWSxCOLS, got {shape!r}")
+
+
+def get_reporter(report: str, plain: bool) -> Reporter:
+    renderer: BoardRenderer = PlainTextRenderer() if plain else TableRenderer()
+    if report == "quiet":
+        return QuietReporter()
+    if report == "final":
+        return FinalBoardReporter(renderer)
+    return ReplayReporter(renderer)
+
+
+async def serve(async_solver_service: "AsyncSolverService", socket_path: str) -> None:
+    async with async_solver_service:
+        server = await async_solver_service.serve(socket_path)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.decompose and args.cache:
+        sys.exit("--decompose and --cache cannot be used together")
+    if args.engine == "sat" and args.balanced:
+        sys.exit("--engine sat does not support --balanced")
+    if (args.checkpoint or args.resume) and (
+        args.engine == "sat" or args.decompose or args.cache
+    ):
+        sys.exit(
+            "--checkpoint and --resume only work with the backtracking engine, "
+            "without --decompose or --cache"
+        )
+    game_service = GameService(
+        rules=RuleSpec(
+            run_length=args.run_length,
+            directions=ORTHOGONAL_DIRECTIONS if args.no_diagonals else DIRECTIONS,
+            balanced_counts=args.balanced,
+        )
+    )
+    solver_service = SolverService(game_service=game_service)
+    if args.engine == "sat":
+        from src.solving_engines import SatEngine
+
+        solver_service.engine = SatEngine(game_service)
+
+    if args.generate is not None:
+        from src.generator_service import GeneratorService
+        from src.models import BoardShape
+
+        generator_service = GeneratorService(
+            solver_service,
+            target_guesses=args.target_guesses,
+            target_board_states=args.target_board_states,
+            difficulty_solver_service=SolverService(
+                game_service=game_service, use_propagation=False
+            ),
+        )
+        generator_service.write_json_lines(
+            args.shape if args.shape is not None else BoardShape(rows=8, cols=8),
+            args.generate,
+            sys.stdout,
+            seed=args.seed,
+            num_workers=args.workers,
+        )
+        return
+
+    if args.pack:
+        from src.board_loaders import write_packed_boards
+
+        num_boards = write_packed_boards(
+            args.pack, (game_board for _, game_board in iter_boards(args.sources))
+        )
+        print(f"Packed {num_boards} boards into {args.pack}")
+        return
+
+    if args.serve:
+        import asyncio
+
+        from src.async_solver_service import AsyncSolverService
+
+        asyncio.run(
+            serve(
+                AsyncSolverService(
+                    solver_service,
+                    num_workers=args.workers,
+                    default_timeout=args.timeout,
+                ),
+                args.serve,
+            )
+        )
+        return
+
+    if args.batch:
+        from src.batch_solver_service import BatchSolverService
+
+        batch_solver_service = BatchSolverService(
+            solver_service, num_workers=args.workers
+        )
+        batch_solver_service.write_json_lines(
+            iter_boards_or_errors(args.sources), sys.stdout, ordered=args.ordered
+        )
+        return
+
+    boards: Iterable[tuple[str, GameBoard]] = iter_boards(args.sources)
+    if args.checkpoint and not args.resume:
+        # A checkpoint holds a single search and is removed when it finishes,
+        # so the boards after the first could not be resumed.
+        boards = list(itertools.islice(boards, 2))
+        if len(boards) > 1:
+            sys.exit("--checkpoint only works with a single board")
+
+    if args.profile or args.metrics or args.trace:
+        from src.solve_hooks import JsonMetricsHooks, ProfilingHooks, TraceHooks
+    if args.profile:
+        solver_service.hooks.append(ProfilingHooks(args.profile))
+    if args.metrics:
+        metrics_file = open(args.metrics, "a")
+        solver_service.hooks.append(JsonMetricsHooks(metrics_file))
+        solver_service.collect_timings = True
+    if args.trace:
+        trace_file = open(args.trace, "w")
+        solver_service.hooks.append(TraceHooks(trace_file))
+    if args.checkpoint or args.resume:
+        from src.search_checkpoint import (
+            DEFAULT_CHECKPOINT_INTERVAL,
+            SearchCheckpointer,
+            load_checkpoint,
+        )
+    if args.checkpoint:
+        checkpointer = SearchCheckpointer(
+            args.checkpoint,
+            (
+                args.checkpoint_interval
+                if args.checkpoint_interval is not None
+                else DEFAULT_CHECKPOINT_INTERVAL
+            ),
+        )
+        solver_service.checkpointer = checkpointer
+        signal.signal(signal.SIGUSR1, lambda signum, frame: checkpointer.request())
+        signal.signal(
+            signal.SIGTERM, lambda signum, frame: checkpointer.request(stop=True)
+        )
+    reporter = get_reporter(args.report, args.plain)
+    solve: Callable[[GameBoard], SolveResult] = solver_service.solve
+    if args.decompose:
+        from src.decomposing_solver_service import DecomposingSolverService
 
-def main() -> None:
-    game_board = GameBoard.from_csv("boards/bigger-board.csv")
-    solver_service = SolverService(game_service=GameService())
+        solve = DecomposingSolverService(
+            solver_service, num_workers=args.workers if args.workers is not None else 1
+        ).solve
+    elif args.cache:
+        from src.caching_solver_service import CachingSolverService
+        from src.solution_cache import SolutionCache
 
-    solver_service.solve(game_board)
+        solution_cache = SolutionCache(db_path=args.cache)
+        solve = CachingSolverService(solver_service, solution_cache).solve
+    try:
+        if args.resume:
+            reporter.report(solver_service.resume(load_checkpoint(args.resume)))
+        else:
+            for _, game_board in boards:
+                reporter.report(solve(game_board))
+                if args.checkpoint and checkpointer.is_stop_requested:
+                    break
+        if (
+            args.checkpoint
+            and checkpointer.is_stop_requested
+            and os.path.exists(args.checkpoint)
+        ):
+            print(f"Saved the search to {args.checkpoint}", file=sys.stderr)
+    finally:
+        if args.metrics:
+            metrics_file.close()
+        if args.trace:
+            trace_file.close()
+        if args.cache:
+            solution_cache.close()
 
 
 if __name__ == "__main__":
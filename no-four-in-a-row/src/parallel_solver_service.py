@@ -0,0 +1,139 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from src.game_board import GameBoard, Placement
+from src.results import SolveResult, SolveStatus
+from src.search_state import SearchState
+from src.solve_metrics import SolveMetrics
+from src.solver_service import SolverService
+from src.solver_workers import (
+    EncodedBoard,
+    copy_for_workers,
+    get_worker_solver_service,
+    init_worker,
+)
+
+if TYPE_CHECKING:
+    from src.models import Move
+
+
+def solve_encoded_board(
+    encoded_board: EncodedBoard,
+) -> tuple[SolveStatus, list[Placement], SolveMetrics]:
+    worker_solver_service = get_worker_solver_service()
+    status, moves_made = worker_solver_service.search_placements(
+        GameBoard.from_encoded(encoded_board)
+    )
+    return status, moves_made, worker_solver_service.metrics
+
+
+class ParallelSolverService:
+    # Splits the search at the first split_depth guess levels and solves the
+    # resulting subproblems on a process pool. Workers receive the solver
+    # settings once at start-up and then only encoded boards; the first
+    # worker to find a solution stops the others.
+    solver_service: SolverService
+    num_workers: int
+    split_depth: int
+
+    def __init__(
+        self,
+        solver_service: SolverService,
+        num_workers: int | None = None,
+        split_depth: int = 2,
+    ) -> None:
+        self.solver_service = solver_service
+        self.num_workers = (
+            num_workers if num_workers is not None else os.cpu_count() or 1
+        )
+        self.split_depth = split_depth
+
+    def solve(self, game_board: GameBoard) -> SolveResult:
+        status, moves_made = self.search_placements(game_board)
+        return SolveResult.from_placements(
+            status, game_board, moves_made, self.solver_service.metrics
+        )
+
+    def search(self, game_board: GameBoard) -> tuple[SolveStatus, list["Move"]]:
+        status, moves_made = self.search_placements(game_board)
+        return status, self.solver_service.to_moves(game_board, moves_made)
+
+    def search_placements(
+        self, game_board: GameBoard
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # The solver service's metrics cover the split and every subproblem.
+        start = time.perf_counter()
+        self.solver_service.metrics = SolveMetrics()
+        status, moves_made, subproblems = self.__split(game_board)
+        if status is None:
+            if len(subproblems) == 0:
+                status, moves_made = SolveStatus.UNSOLVABLE, []
+            else:
+                status, moves_made = self.__solve_subproblems(game_board, subproblems)
+        self.solver_service.metrics.wall_time = time.perf_counter() - start
+        return status, moves_made
+
+    def __split(
+        self, game_board: GameBoard
+    ) -> tuple[SolveStatus | None, list[Placement], list[list[Placement]]]:
+        # Breadth-first expansion of the first guess levels. Each subproblem
+        # is the list of moves leading to it from the original board.
+        solver_service = self.solver_service
+        subproblems: list[list[Placement]] = [[]]
+        for _ in range(self.split_depth):
+            next_subproblems: list[list[Placement]] = []
+            for moves_made in subproblems:
+                search_state = SearchState(solver_service.game_service, game_board)
+                for move in moves_made:
+                    search_state.make_move(move)
+                if not solver_service.propagate(search_state):
+                    continue
+                if len(search_state.valid_move_map) == 0:
+                    return SolveStatus.SOLVED, search_state.moves_made, []
+                for new_move in solver_service.branching_strategy.select_moves(
+                    search_state
+                ):
+                    solver_service.metrics.num_guesses += 1
+                    solver_service.metrics.num_board_states += 1
+                    next_subproblems.append(search_state.moves_made + [new_move])
+            subproblems = next_subproblems
+        return None, [], subproblems
+
+    def __solve_subproblems(
+        self, game_board: GameBoard, subproblems: list[list[Placement]]
+    ) -> tuple[SolveStatus, list[Placement]]:
+        stop_event = multiprocessing.Event()
+        statuses: list[SolveStatus] = []
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=init_worker,
+            initargs=(copy_for_workers(self.solver_service), stop_event),
+        ) as executor:
+            pending: dict[Future, list[Placement]] = {}
+            for moves_made in subproblems:
+                subproblem_board = game_board.copy()
+                for cell_idx, char in moves_made:
+                    subproblem_board.update_cell_idx(cell_idx, char)
+                future = executor.submit(solve_encoded_board, subproblem_board.encode())
+                pending[future] = moves_made
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    moves_made = pending.pop(future)
+                    status, worker_moves_made, metrics = future.result()
+                    self.solver_service.metrics.merge(metrics)
+                    statuses.append(status)
+                    if status == SolveStatus.SOLVED:
+                        stop_event.set()
+                        for other_future in pending:
+                            other_future.cancel()
+                        return status, moves_made + worker_moves_made
+
+        for status in statuses:
+            if status != SolveStatus.UNSOLVABLE:
+                return status, []
+        return SolveStatus.UNSOLVABLE, []
@@ -0,0 +1,69 @@
+from src.game_board import O_CHAR, X_CHAR, GameBoard, Placement
+from src.game_service import GameService
+from src.search_state import SearchState
+
+
+class PropagationService:
+    # Deductions beyond forced singles. Every run of
+    # disallowed_num_consecutive_chars cells is a constraint that must not be
+    # filled with a single character. Each empty cell is probed with both of
+    # its characters: the hypothetical assignment is propagated through the
+    # windows (a window with n - 1 of a character and one blank forces the
+    # blank to the other character, which covers the pairwise "these two
+    # blanks cannot both be x" case), and a character that leads to a full
+    # window can be ruled out without guessing.
+    game_service: GameService
+
+    def __init__(self, game_service: GameService) -> None:
+        self.game_service = game_service
+
+    def probe(self, search_state: SearchState) -> tuple[bool, Placement | None]:
+        game_board = search_state.game_board
+        cell_windows = self.game_service.get_cell_windows(game_board)
+        valid_move_map = search_state.valid_move_map
+        for cell_idx in valid_move_map.cells_by_num_moves[2]:
+            consistent_chars = [
+                char
+                for char in valid_move_map.get_chars(cell_idx)
+                if self.__is_consistent(game_board, cell_windows, cell_idx, char)
+            ]
+            if len(consistent_chars) == 0:
+                return False, None
+            if len(consistent_chars) == 1:
+                return True, (cell_idx, consistent_chars[0])
+        return True, None
+
+    def __is_consistent(
+        self,
+        game_board: GameBoard,
+        cell_windows: dict[int, list[int]],
+        cell_idx: int,
+        char: str,
+    ) -> bool:
+        n = self.game_service.disallowed_num_consecutive_chars
+        assumed_bits = {X_CHAR: 0, O_CHAR: 0}
+        assumed_bits[char] |= 1 << cell_idx
+        pending = [(cell_idx, char)]
+        while pending:
+            current_idx, current_char = pending.pop()
+            other_char = O_CHAR if current_char == X_CHAR else X_CHAR
+            char_bits = game_board.get_bits(current_char) | assumed_bits[current_char]
+            filled_bits = (
+                game_board.x_bits
+                | game_board.o_bits
+                | assumed_bits[X_CHAR]
+                | assumed_bits[O_CHAR]
+            )
+            for window in cell_windows[current_idx]:
+                num_chars = (char_bits & window).bit_count()
+                if num_chars >= n:
+                    return False
+                if num_chars == n - 1:
+                    blank_bits = window & ~filled_bits
+                    if blank_bits:
+                        # The only blank left in the window must take the other
+                        # character.
+                        assumed_bits[other_char] |= blank_bits
+                        filled_bits |= blank_bits
+                        pending.append((blank_bits.bit_length() - 1, other_char))
+        return True
@@ -0,0 +1,117 @@
+import sys
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from src.game_board import EMPTY_CHAR, GameBoard
+from src.results import SolveResult, SolveStatus
+
+PLAIN_EMPTY_CHAR = "."
+
+
+class BoardRenderer(ABC):
+    @abstractmethod
+    def render(self, game_board: GameBoard, latest_cell_idx: int | None = None) -> str:
+        pass
+
+
+class PlainTextRenderer(BoardRenderer):
+    # One line per row with no colours or borders. Empty cells are shown as
+    # dots and the latest move in upper case.
+    def render(self, game_board: GameBoard, latest_cell_idx: int | None = None) -> str:
+        lines = []
+        for row_idx, row in enumerate(game_board.board):
+            chars = []
+            for col_idx, char in enumerate(row):
+                if char == EMPTY_CHAR:
+                    char = PLAIN_EMPTY_CHAR
+                elif game_board.bit_index(row_idx, col_idx) == latest_cell_idx:
+                    char = char.upper()
+                chars.append(char)
+            lines.append(" ".join(chars))
+        return "\n".join(lines)
+
+
+class TableRenderer(BoardRenderer):
+    # A PrettyTable with row and column numbers and ANSI colours.
+    def render(self, game_board: GameBoard, latest_cell_idx: int | None = None) -> str:
+        return game_board.format_table(latest_cell_idx)
+
+
+class Reporter(ABC):
+    # Presents a SolveResult. Solving never prints; callers pick a reporter.
+    @abstractmethod
+    def report(self, result: SolveResult) -> None:
+        pass
+
+
+class QuietReporter(Reporter):
+    def report(self, result: SolveResult) -> None:
+        pass
+
+
+class FinalBoardReporter(Reporter):
+    # The solved board, or the original one if it was not solved, followed by
+    # the outcome and the search statistics.
+    renderer: BoardRenderer
+    output: TextIO
+
+    def __init__(
+        self, renderer: BoardRenderer | None = None, output: TextIO | None = None
+    ) -> None:
+        self.renderer = renderer if renderer is not None else PlainTextRenderer()
+        self.output = output if output is not None else sys.stdout
+
+    def report(self, result: SolveResult) -> None:
+        final_board = (
+            result.solution if result.solution is not None else result.game_board
+        )
+        self.output.write(self.renderer.render(final_board) + "\n")
+        self.output.write(format_summary(result) + "\n")
+
+
+class ReplayReporter(Reporter):
+    # The original board and then the board after every move, with the move
+    # highlighted. Moves are replayed on a single copy without validation, as
+    # the solver already validated them.
+    renderer: BoardRenderer
+    output: TextIO
+
+    def __init__(
+        self, renderer: BoardRenderer | None = None, output: TextIO | None = None
+    ) -> None:
+        self.renderer = renderer if renderer is not None else TableRenderer()
+        self.output = output if output is not None else sys.stdout
+
+    def report(self, result: SolveResult) -> None:
+        game_board = result.game_board.copy()
+        self.output.write(self.renderer.render(game_board) + "\n")
+        if result.status == SolveStatus.SOLVED:
+            for cell_idx, char in result.placements:
+                game_board.update_cell_idx(cell_idx, char)
+                self.output.write(self.renderer.render(game_board, cell_idx) + "\n")
+        self.output.write(format_summary(result) + "\n")
+
+
+def format_summary(result: SolveResult) -> str:
+    if result.status == SolveStatus.UNSOLVABLE:
+        return "Invalid Board. Cannot be solved."
+    if result.status != SolveStatus.SOLVED:
+        return f"Search stopped before finishing: {result.status.value}"
+    metrics = result.metrics
+    lines = [
+        "Game Complete. Solved",
+        f"Number of board states analysed: {metrics.num_board_states}",
+    ]
+    if metrics.num_transposition_hits or metrics.num_transposition_misses:
+        lines.append(
+            f"Transposition table hits: {metrics.num_transposition_hits}, "
+            f"misses: {metrics.num_transposition_misses}"
+        )
+    lines += [
+        f"Number of guesses: {metrics.num_guesses}",
+        f"Number of incorrect guesses: {metrics.num_incorrect_guesses}",
+        f"Number of guesses avoided by propagation: {metrics.num_guesses_avoided}",
+        f"Maximum guess depth: {metrics.max_depth}",
+        f"Solved in {metrics.wall_time:.6f} seconds",
+    ]
+    return "\n".join(lines)
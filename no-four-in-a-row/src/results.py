@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from src.board_loaders import format_rows
+from src.game_board import GameBoard, Placement
+from src.solve_metrics import SolveMetrics
+
+if TYPE_CHECKING:
+    from src.models import Move
+
+
+def to_moves(game_board: GameBoard, placements: list[Placement]) -> list["Move"]:
+    # Moves are pydantic models, which are only imported at the API boundary,
+    # so the solver itself starts up without pydantic.
+    from src.models import BoardLocation, Move
+
+    moves = []
+    for cell_idx, char in placements:
+        row_idx, col_idx = game_board.cell_location(cell_idx)
+        moves.append(
+            Move(cell=BoardLocation(row_idx=row_idx, col_idx=col_idx), char=char)
+        )
+    return moves
+
+
+class SolveStatus(str, Enum):
+    SOLVED = "solved"
+    UNSOLVABLE = "unsolvable"
+    NODE_LIMIT_REACHED = "node_limit_reached"
+    DEPTH_LIMIT_REACHED = "depth_limit_reached"
+    CANCELLED = "cancelled"
+    TIMED_OUT = "timed_out"
+
+
+@dataclass
+class SolutionCount:
+    num_solutions: int
+    # False if the search stopped at the solution limit or at a node, depth or
+    # stop check before every solution was counted.
+    is_exact: bool
+    status: SolveStatus
+    num_board_states: int
+
+    @property
+    def is_unique(self) -> bool:
+        return self.is_exact and self.num_solutions == 1
+
+
+@dataclass
+class SolveResult:
+    status: SolveStatus
+    game_board: GameBoard
+    # The moves that complete game_board, in the order they were found.
+    placements: list[Placement]
+    # game_board with every placement made, if it was solved.
+    solution: GameBoard | None
+    metrics: SolveMetrics
+
+    @staticmethod
+    def from_placements(
+        status: SolveStatus,
+        game_board: GameBoard,
+        placements: list[Placement],
+        metrics: SolveMetrics,
+    ) -> "SolveResult":
+        solution = None
+        if status == SolveStatus.SOLVED:
+            solution = game_board.copy()
+            for cell_idx, char in placements:
+                solution.update_cell_idx(cell_idx, char)
+        return SolveResult(
+            status=status,
+            game_board=game_board,
+            placements=placements,
+            solution=solution,
+            metrics=metrics,
+        )
+
+    def get_moves(self) -> list["Move"]:
+        return to_moves(self.game_board, self.placements)
+
+    def get_solution_rows(self) -> list[str] | None:
+        if self.solution is None:
+            return None
+        return format_rows(self.solution)
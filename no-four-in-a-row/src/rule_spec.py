@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+
+from src.game_board import O_CHAR, X_CHAR
+
+Direction = tuple[int, int]
+
+VERTICAL_MOVE = (1, 0)
+HORIZONTAL_MOVE = (0, 1)
+FORWARD_DIAGONAL_MOVE = (-1, 1)
+BACKWARD_DIAGONAL_MOVE = (1, 1)
+DIRECTIONS = (
+    VERTICAL_MOVE,
+    HORIZONTAL_MOVE,
+    FORWARD_DIAGONAL_MOVE,
+    BACKWARD_DIAGONAL_MOVE,
+)
+ORTHOGONAL_DIRECTIONS = (VERTICAL_MOVE, HORIZONTAL_MOVE)
+
+
+@dataclass
+class CompiledRules:
+    # The rules for one board shape, as bitmasks over the board's cells.
+    # windows holds every run of run_length cells along a direction, and
+    # cell_window_ids the positions in windows of those containing each cell,
+    # by the cell's bit index; cell_windows is the same with the windows
+    # themselves. shifts is the bit distance between neighbouring cells along
+    # each direction. cell_lines holds the row and column of each cell with
+    # the most of one symbol it may hold, and is empty unless counts are
+    # balanced.
+    windows: list[int]
+    cell_window_ids: dict[int, list[int]]
+    cell_windows: dict[int, list[int]]
+    shifts: tuple[int, ...]
+    cell_lines: dict[int, list[tuple[int, int]]]
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    # A puzzle variant. No run of run_length cells along any of directions may
+    # hold a single symbol, and with balanced_counts every row and column
+    # holds as many of one symbol as of the other, so rows and columns of odd
+    # length cannot be completed. GameBoard stores exactly two symbols, x and
+    # o; symbols is the order in which moves try them.
+    symbols: tuple[str, ...] = (O_CHAR, X_CHAR)
+    run_length: int = 4
+    directions: tuple[Direction, ...] = DIRECTIONS
+    balanced_counts: bool = False
+
+    def __post_init__(self) -> None:
+        if sorted(self.symbols) != sorted((O_CHAR, X_CHAR)):
+            raise ValueError(f"symbols must be {O_CHAR!r} and {X_CHAR!r}")
+        if self.run_length < 2:
+            raise ValueError("run_length must be at least 2")
+        if not self.directions:
+            raise ValueError("at least one direction is needed")
+        for direction in self.directions:
+            if direction not in DIRECTIONS:
+                raise ValueError(f"unknown direction {direction}")
+        if len(set(self.directions)) != len(self.directions):
+            raise ValueError("directions must not repeat")
+
+    def compile(self, n_rows: int, n_cols: int) -> CompiledRules:
+        stride = n_cols + 1
+        windows, cell_window_ids = self.__build_window_index(n_rows, n_cols)
+        return CompiledRules(
+            windows=windows,
+            cell_window_ids=cell_window_ids,
+            cell_windows={
+                cell_idx: [windows[window_id] for window_id in window_ids]
+                for cell_idx, window_ids in cell_window_ids.items()
+            },
+            shifts=tuple(
+                abs(direction[0] * stride + direction[1])
+                for direction in self.directions
+            ),
+            cell_lines=(
+                self.__build_cell_lines(n_rows, n_cols) if self.balanced_counts else {}
+            ),
+        )
+
+    def __build_window_index(
+        self, n_rows: int, n_cols: int
+    ) -> tuple[list[int], dict[int, list[int]]]:
+        n = self.run_length
+        stride = n_cols + 1
+        windows: list[int] = []
+        cell_window_ids: dict[int, list[int]] = {
+            row_idx * stride + col_idx: []
+            for row_idx in range(n_rows)
+            for col_idx in range(n_cols)
+        }
+        for row_idx in range(n_rows):
+            for col_idx in range(n_cols):
+                for direction in self.directions:
+                    end_row_idx = row_idx + (n - 1) * direction[0]
+                    end_col_idx = col_idx + (n - 1) * direction[1]
+                    if not (0 <= end_row_idx < n_rows and 0 <= end_col_idx < n_cols):
+                        continue
+                    window_idxs = [
+                        (row_idx + i * direction[0]) * stride
+                        + col_idx
+                        + i * direction[1]
+                        for i in range(n)
+                    ]
+                    window = 0
+                    for cell_idx in window_idxs:
+                        window |= 1 << cell_idx
+                        cell_window_ids[cell_idx].append(len(windows))
+                    windows.append(window)
+        return windows, cell_window_ids
+
+    def __build_cell_lines(
+        self, n_rows: int, n_cols: int
+    ) -> dict[int, list[tuple[int, int]]]:
+        stride = n_cols + 1
+        row_mask = (1 << n_cols) - 1
+        col_mask = sum(1 << row_idx * stride for row_idx in range(n_rows))
+        cell_lines: dict[int, list[tuple[int, int]]] = {}
+        for row_idx in range(n_rows):
+            for col_idx in range(n_cols):
+                cell_lines[row_idx * stride + col_idx] = [
+                    (row_mask << row_idx * stride, n_cols // 2),
+                    (col_mask << col_idx, n_rows // 2),
+                ]
+        return cell_lines
@@ -0,0 +1,162 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.board_loaders import parse_rows
+from src.game_board import GameBoard, Placement
+from src.rule_spec import RuleSpec
+from src.solve_metrics import SolveMetrics
+
+CHECKPOINT_VERSION = 2
+DEFAULT_CHECKPOINT_INTERVAL = 300.0
+
+
+@dataclass
+class SavedChoicePoint:
+    num_moves: int
+    moves: list[Placement]
+    next_move_idx: int
+    # The hash before propagation, as in ChoicePoint.
+    board_hash: int
+    is_exhaustive: bool
+
+
+@dataclass
+class SearchCheckpoint:
+    # The frontier of an unfinished backtracking search: the board it started
+    # from, the moves made since, and the guesses whose alternatives are still
+    # to be tried. Along with them go the order of the cells in the valid move
+    # map and the transposition table's hashes from least to most recently
+    # used, so resuming replays the moves and carries on exactly as the search
+    # would have.
+    rows: list[str]
+    rules: RuleSpec
+    cell_idxs: list[int] | None
+    moves_made: list[Placement]
+    choice_points: list[SavedChoicePoint]
+    valid_move_order: list[list[int]]
+    unsolvable_hashes: list[int]
+    is_depth_limit_reached: bool
+    metrics: SolveMetrics
+
+    def get_game_board(self) -> GameBoard:
+        return parse_rows(self.rows, "checkpoint")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "rows": self.rows,
+            "rules": asdict(self.rules),
+            "cell_idxs": self.cell_idxs,
+            "moves_made": self.moves_made,
+            "choice_points": [
+                asdict(choice_point) for choice_point in self.choice_points
+            ],
+            "valid_move_order": self.valid_move_order,
+            "unsolvable_hashes": self.unsolvable_hashes,
+            "is_depth_limit_reached": self.is_depth_limit_reached,
+            "metrics": self.metrics.to_dict(),
+        }
+
+    @staticmethod
+    def from_dict(checkpoint: dict[str, Any]) -> "SearchCheckpoint":
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"unsupported checkpoint version {checkpoint.get('version')!r}"
+            )
+        rules = checkpoint["rules"]
+        return SearchCheckpoint(
+            rows=checkpoint["rows"],
+            rules=RuleSpec(
+                symbols=tuple(rules["symbols"]),
+                run_length=rules["run_length"],
+                directions=tuple(
+                    (direction[0], direction[1]) for direction in rules["directions"]
+                ),
+                balanced_counts=rules["balanced_counts"],
+            ),
+            cell_idxs=checkpoint["cell_idxs"],
+            moves_made=[
+                (cell_idx, char) for cell_idx, char in checkpoint["moves_made"]
+            ],
+            choice_points=[
+                SavedChoicePoint(
+                    num_moves=choice_point["num_moves"],
+                    moves=[
+                        (cell_idx, char) for cell_idx, char in choice_point["moves"]
+                    ],
+                    next_move_idx=choice_point["next_move_idx"],
+                    board_hash=choice_point["board_hash"],
+                    is_exhaustive=choice_point["is_exhaustive"],
+                )
+                for choice_point in checkpoint["choice_points"]
+            ],
+            valid_move_order=checkpoint["valid_move_order"],
+            unsolvable_hashes=checkpoint["unsolvable_hashes"],
+            is_depth_limit_reached=checkpoint["is_depth_limit_reached"],
+            metrics=SolveMetrics.from_dict(checkpoint["metrics"]),
+        )
+
+
+def save_checkpoint(checkpoint_path: str, checkpoint: SearchCheckpoint) -> None:
+    # Written to a temporary file first, so a crash while saving leaves the
+    # previous checkpoint intact.
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "w") as checkpoint_file:
+        json.dump(checkpoint.to_dict(), checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary_path, checkpoint_path)
+
+
+def load_checkpoint(checkpoint_path: str) -> SearchCheckpoint:
+    with open(checkpoint_path) as checkpoint_file:
+        return SearchCheckpoint.from_dict(json.load(checkpoint_file))
+
+
+class SearchCheckpointer:
+    # Decides when a SolverService search saves a checkpoint to path: every
+    # interval seconds, and whenever one is requested, e.g. from a signal
+    # handler. With stop, the search stops as CANCELLED once it is saved.
+    # The checkpoint is removed when a search finishes on its own, so an
+    # existing file always holds unfinished work.
+    path: str
+    interval: float | None
+    is_requested: bool
+    is_stop_requested: bool
+    next_save_time: float
+
+    def __init__(
+        self, path: str, interval: float | None = DEFAULT_CHECKPOINT_INTERVAL
+    ) -> None:
+        self.path = path
+        self.interval = interval
+        self.is_requested = False
+        self.is_stop_requested = False
+        self.next_save_time = 0.0
+        self.reset_timer()
+
+    def request(self, stop: bool = False) -> None:
+        # Only sets flags, so it is safe to call from a signal handler.
+        self.is_requested = True
+        self.is_stop_requested = self.is_stop_requested or stop
+
+    def is_due(self) -> bool:
+        return self.is_requested or (
+            self.interval is not None and time.monotonic() >= self.next_save_time
+        )
+
+    def save(self, checkpoint: SearchCheckpoint) -> None:
+        save_checkpoint(self.path, checkpoint)
+        self.is_requested = False
+        self.reset_timer()
+
+    def reset_timer(self) -> None:
+        if self.interval is not None:
+            self.next_save_time = time.monotonic() + self.interval
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
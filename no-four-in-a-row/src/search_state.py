@@ -0,0 +1,182 @@
+import importlib.util
+from dataclasses import dataclass
+
+from src.game_board import EMPTY_CHAR, GameBoard, Placement
+from src.game_service import GameService, InvalidMoveException
+from src.transposition_table import ZobristHasher
+from src.valid_move_map import ValidMoveMap
+from src.window_counts import WindowCounts
+
+# NumPy is optional. Below this many empty cells the scalar checks are as
+# fast as the vectorized ones or faster, even with NumPy already imported, and
+# importing it takes about 100 ms. No 8x8 board with a clue reaches it.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+VECTORIZE_MIN_EMPTY_CELLS = 64
+
+
+@dataclass(slots=True)
+class ChoicePoint:
+    # A guess on the explicit search stack: the number of moves made before
+    # the guess, and the alternatives still to be tried from that position.
+    # board_hash is the hash of the position before propagation, and
+    # is_exhaustive is cleared if part of the subtree was cut off by a limit.
+    num_moves: int
+    moves: list[Placement]
+    next_move_idx: int = 0
+    board_hash: int = 0
+    is_exhaustive: bool = True
+
+
+class SearchState:
+    # A single board that the search mutates in place. Every move made is
+    # pushed on moves_made together with the valid-move map's trail length
+    # before it, so backtracking pops moves instead of discarding copies.
+    # Moves are (cell bit index, character) placements; Moves and
+    # BoardLocations are only built at the API boundary.
+    game_service: GameService
+    game_board: GameBoard
+    cell_idxs: list[int] | None
+    symbols: tuple[str, ...]
+    cell_lines: dict[int, list[tuple[int, int]]]
+    window_counts: WindowCounts
+    valid_move_map: ValidMoveMap
+    moves_made: list[Placement]
+    trail_marks: list[int]
+    zobrist_hasher: ZobristHasher | None
+    board_hash: int
+
+    def __init__(
+        self,
+        game_service: GameService,
+        game_board: GameBoard,
+        zobrist_hasher: ZobristHasher | None = None,
+        cell_idxs: list[int] | None = None,
+    ) -> None:
+        # cell_idxs limits the search to some of the empty cells; the others
+        # stay empty and are never moved on.
+        self.game_service = game_service
+        self.game_board = game_board.copy()
+        self.cell_idxs = cell_idxs
+        self.symbols = game_service.rules.symbols
+        compiled_rules = game_service.get_compiled_rules(game_board)
+        self.cell_lines = compiled_rules.cell_lines
+        self.window_counts = WindowCounts(
+            compiled_rules, game_service.rules.run_length, self.game_board
+        )
+        self.valid_move_map = self.__get_valid_move_map(cell_idxs)
+        self.moves_made = []
+        self.trail_marks = []
+        self.zobrist_hasher = zobrist_hasher
+        self.board_hash = (
+            zobrist_hasher.hash_board(self.game_board)
+            if zobrist_hasher is not None
+            else 0
+        )
+
+    def make_move(self, new_move: Placement) -> None:
+        if not self.is_valid_move(new_move):
+            raise InvalidMoveException()
+        self.apply_move(new_move)
+
+    def is_valid_move(self, new_move: Placement) -> bool:
+        return self.game_service.is_valid_placement(self.game_board, *new_move)
+
+    def apply_move(self, new_move: Placement) -> None:
+        # make_move without validation, for callers that validated already.
+        cell_idx, char = new_move
+        self.trail_marks.append(self.valid_move_map.trail_length())
+        self.moves_made.append(new_move)
+        self.game_board.update_cell_idx(cell_idx, char)
+        self.__update_board_hash(new_move)
+        self.__update_valid_move_map(cell_idx, char)
+
+    def unmake_move(self) -> None:
+        last_move = self.moves_made.pop()
+        self.valid_move_map.undo_to(self.trail_marks.pop())
+        self.game_board.update_cell_idx(last_move[0], EMPTY_CHAR)
+        self.window_counts.remove(*last_move)
+        self.__update_board_hash(last_move)
+
+    def undo_to(self, num_moves: int) -> None:
+        while len(self.moves_made) > num_moves:
+            self.unmake_move()
+
+    def __update_board_hash(self, move: Placement) -> None:
+        if self.zobrist_hasher is not None:
+            self.board_hash ^= self.zobrist_hasher.get_key(
+                self.game_board, move[0], move[1]
+            )
+
+    def __get_valid_move_map(self, cell_idxs: list[int] | None) -> ValidMoveMap:
+        valid_move_map = ValidMoveMap()
+        empty_cell_idxs = self.game_board.empty_cell_idxs()
+        if cell_idxs is not None:
+            searched_idxs = set(cell_idxs)
+            empty_cell_idxs = [
+                cell_idx for cell_idx in empty_cell_idxs if cell_idx in searched_idxs
+            ]
+        if NUMPY_AVAILABLE and len(empty_cell_idxs) >= VECTORIZE_MIN_EMPTY_CELLS:
+            for cell_idx, chars in self.__valid_chars_vectorized(empty_cell_idxs):
+                valid_move_map.set_chars(cell_idx, chars)
+        else:
+            for cell_idx in empty_cell_idxs:
+                valid_move_map.set_chars(
+                    cell_idx, self.__valid_chars_for_cell(cell_idx)
+                )
+        # The initial map is the state every undo returns to at most.
+        valid_move_map.undo_trail.clear()
+        return valid_move_map
+
+    def __update_valid_move_map(self, cell_idx: int, char: str) -> None:
+        # A move only takes options away, and only the new move's character:
+        # from the blank of every window it leaves one cell short of a run,
+        # and with balanced counts from the rest of a row or column it fills
+        # with its share of the character.
+        valid_move_map = self.valid_move_map
+        valid_move_map.remove_cell(cell_idx)
+        game_board = self.game_board
+        filled_bits = game_board.x_bits | game_board.o_bits
+        blocked_bits = self.window_counts.place(cell_idx, char, filled_bits)
+        if self.cell_lines:
+            player_bits = game_board.get_bits(char)
+            for line, max_count in self.cell_lines[cell_idx]:
+                if (player_bits & line).bit_count() >= max_count:
+                    blocked_bits |= line & ~filled_bits
+        while blocked_bits:
+            cell_bit = blocked_bits & -blocked_bits
+            blocked_bits ^= cell_bit
+            other_idx = cell_bit.bit_length() - 1
+            if other_idx in valid_move_map:
+                valid_chars = valid_move_map.get_chars(other_idx)
+                if char in valid_chars:
+                    valid_move_map.set_chars(other_idx, valid_chars.replace(char, ""))
+
+    def __valid_chars_vectorized(
+        self, empty_cell_idxs: list[int]
+    ) -> list[tuple[int, str]]:
+        from src.vectorized_game_service import VectorizedGameService
+
+        legal_move_masks = VectorizedGameService(
+            self.game_service
+        ).get_legal_move_masks(self.game_board)
+        valid_chars = []
+        for cell_idx in empty_cell_idxs:
+            location = self.game_board.cell_location(cell_idx)
+            valid_chars.append(
+                (
+                    cell_idx,
+                    "".join(
+                        char
+                        for char in self.symbols
+                        if legal_move_masks[char][location]
+                    ),
+                )
+            )
+        return valid_chars
+
+    def __valid_chars_for_cell(self, cell_idx: int) -> str:
+        return "".join(
+            char
+            for char in self.symbols
+            if self.game_service.is_valid_placement(self.game_board, cell_idx, char)
+        )
@@ -0,0 +1,116 @@
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import TracebackType
+
+from src.results import SolveStatus
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Only outcomes that do not depend on the solver's limits are cached.
+CACHEABLE_STATUSES = (SolveStatus.SOLVED, SolveStatus.UNSOLVABLE)
+
+
+@dataclass(frozen=True)
+class CachedSolution:
+    status: SolveStatus
+    # The solved board in the canonical orientation, if it was solved.
+    solution_rows: tuple[str, ...] | None
+
+
+class SolutionCache:
+    # Solutions keyed by canonical board key, see board_symmetry. Lookups go
+    # to an in-memory LRU tier first and then to an optional SQLite database,
+    # whose hits are copied into memory. Every entry is written to both.
+    max_entries: int
+    entries: OrderedDict[str, CachedSolution]
+    num_hits: int
+    num_misses: int
+    __connection: sqlite3.Connection | None
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: str | None = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.num_hits = 0
+        self.num_misses = 0
+        self.__connection = None
+        if db_path is not None:
+            self.__connection = sqlite3.connect(db_path)
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS solutions "
+                "(key TEXT PRIMARY KEY, status TEXT NOT NULL, solution TEXT)"
+            )
+            self.__connection.commit()
+
+    def __enter__(self) -> "SolutionCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> CachedSolution | None:
+        cached_solution = self.entries.get(key)
+        if cached_solution is None and self.__connection is not None:
+            cached_solution = self.__load(key)
+            if cached_solution is not None:
+                self.__remember(key, cached_solution)
+        if cached_solution is None:
+            self.num_misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.num_hits += 1
+        return cached_solution
+
+    def put(self, key: str, cached_solution: CachedSolution) -> None:
+        if cached_solution.status not in CACHEABLE_STATUSES:
+            raise ValueError(f"cannot cache a {cached_solution.status.value} result")
+        self.__remember(key, cached_solution)
+        if self.__connection is not None:
+            solution_rows = cached_solution.solution_rows
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)",
+                (
+                    key,
+                    cached_solution.status.value,
+                    "\n".join(solution_rows) if solution_rows is not None else None,
+                ),
+            )
+            self.__connection.commit()
+
+    def clear(self) -> None:
+        # Only the in-memory tier; the database outlives the process.
+        self.entries.clear()
+
+    def close(self) -> None:
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def __remember(self, key: str, cached_solution: CachedSolution) -> None:
+        self.entries[key] = cached_solution
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def __load(self, key: str) -> CachedSolution | None:
+        assert self.__connection is not None
+        row = self.__connection.execute(
+            "SELECT status, solution FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        status, solution = row
+        return CachedSolution(
+            status=SolveStatus(status),
+            solution_rows=tuple(solution.split("\n")) if solution is not None else None,
+        )
@@ -0,0 +1,135 @@
+import io
+import json
+from typing import TYPE_CHECKING, Any, TextIO
+
+from src.board_loaders import format_rows
+from src.game_board import GameBoard, Placement
+from src.results import SolveStatus
+from src.solve_metrics import SolveMetrics
+
+if TYPE_CHECKING:
+    import cProfile
+
+
+class SolveHooks:
+    # Callbacks from a SolverService search. Every method does nothing by
+    # default, so hooks only override the events they need. Depth is the
+    # number of guesses on the search stack.
+    def on_start(self, game_board: GameBoard) -> None:
+        pass
+
+    def on_guess(self, placement: Placement, depth: int) -> None:
+        pass
+
+    def on_backtrack(self, depth: int) -> None:
+        pass
+
+    def on_propagation(self, placement: Placement, is_deduced: bool) -> None:
+        # A forced move, or with is_deduced one found by probing.
+        pass
+
+    def on_solution(self, placements: list[Placement]) -> None:
+        pass
+
+    def on_finish(self, status: SolveStatus, metrics: SolveMetrics) -> None:
+        pass
+
+
+class ProfilingHooks(SolveHooks):
+    # Runs cProfile for the duration of every search. Statistics accumulate
+    # across searches; with output_path they are also dumped after each one.
+    profile: "cProfile.Profile"
+    output_path: str | None
+
+    def __init__(self, output_path: str | None = None) -> None:
+        import cProfile
+
+        self.profile = cProfile.Profile()
+        self.output_path = output_path
+
+    def on_start(self, game_board: GameBoard) -> None:
+        self.profile.enable()
+
+    def on_finish(self, status: SolveStatus, metrics: SolveMetrics) -> None:
+        self.profile.disable()
+        if self.output_path is not None:
+            self.profile.dump_stats(self.output_path)
+
+    def format_stats(self, sort_key: str = "cumulative", limit: int = 20) -> str:
+        import pstats
+
+        output = io.StringIO()
+        pstats.Stats(self.profile, stream=output).sort_stats(sort_key).print_stats(
+            limit
+        )
+        return output.getvalue()
+
+
+class JsonMetricsHooks(SolveHooks):
+    # Writes the status and metrics of every search as one JSON line.
+    output: TextIO
+
+    def __init__(self, output: TextIO) -> None:
+        self.output = output
+
+    def on_finish(self, status: SolveStatus, metrics: SolveMetrics) -> None:
+        self.output.write(
+            json.dumps({"status": status.value, **metrics.to_dict()}) + "\n"
+        )
+        self.output.flush()
+
+
+class TraceHooks(SolveHooks):
+    # Streams every event of every search as one JSON line, so a long solve
+    # can be followed, or replayed later, while it runs. Cells are given as
+    # row and column. Lines are flushed at the end of each search, and every
+    # flush_interval events before that.
+    output: TextIO
+    flush_interval: int
+    game_board: GameBoard | None
+    num_events: int
+
+    def __init__(self, output: TextIO, flush_interval: int = 1000) -> None:
+        self.output = output
+        self.flush_interval = flush_interval
+        self.game_board = None
+        self.num_events = 0
+
+    def on_start(self, game_board: GameBoard) -> None:
+        self.game_board = game_board
+        self.__write({"event": "start", "rows": format_rows(game_board)})
+
+    def on_guess(self, placement: Placement, depth: int) -> None:
+        self.__write({"event": "guess", **self.__cell(placement), "depth": depth})
+
+    def on_backtrack(self, depth: int) -> None:
+        self.__write({"event": "backtrack", "depth": depth})
+
+    def on_propagation(self, placement: Placement, is_deduced: bool) -> None:
+        self.__write(
+            {"event": "propagation", **self.__cell(placement), "is_deduced": is_deduced}
+        )
+
+    def on_solution(self, placements: list[Placement]) -> None:
+        self.__write({"event": "solution", "num_moves": len(placements)})
+
+    def on_finish(self, status: SolveStatus, metrics: SolveMetrics) -> None:
+        self.__write(
+            {
+                "event": "finish",
+                "status": status.value,
+                "num_board_states": metrics.num_board_states,
+            }
+        )
+        self.output.flush()
+
+    def __cell(self, placement: Placement) -> dict[str, Any]:
+        assert self.game_board is not None
+        row_idx, col_idx = self.game_board.cell_location(placement[0])
+        return {"row": row_idx, "col": col_idx, "char": placement[1]}
+
+    def __write(self, event: dict[str, Any]) -> None:
+        self.output.write(json.dumps(event) + "\n")
+        self.num_events += 1
+        if self.num_events % self.flush_interval == 0:
+            self.output.flush()
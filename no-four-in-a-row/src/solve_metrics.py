@@ -0,0 +1,84 @@
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class SolveMetrics:
+    # Everything measured during a single search. A new instance is created
+    # for every search, so numbers never leak from one board to the next.
+    num_board_states: int = 0
+    num_guesses: int = 0
+    num_incorrect_guesses: int = 0
+    num_guesses_avoided: int = 0
+    num_forced_moves: int = 0
+    num_probes: int = 0
+    num_transposition_hits: int = 0
+    num_transposition_misses: int = 0
+    max_depth: int = 0
+    backtracks_by_depth: dict[int, int] = field(default_factory=dict)
+    wall_time: float = 0.0
+    # Only measured when the solver service collects timings.
+    validation_time: float = 0.0
+    map_update_time: float = 0.0
+    branching_time: float = 0.0
+    propagation_time: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.num_board_states / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def num_backtracks(self) -> int:
+        return sum(self.backtracks_by_depth.values())
+
+    def record_backtrack(self, depth: int) -> None:
+        self.backtracks_by_depth[depth] = self.backtracks_by_depth.get(depth, 0) + 1
+
+    def merge(self, other: "SolveMetrics") -> None:
+        # Adds the work of another search, e.g. a subproblem solved in a
+        # worker process. Wall time is left alone, as the searches overlap.
+        self.num_board_states += other.num_board_states
+        self.num_guesses += other.num_guesses
+        self.num_incorrect_guesses += other.num_incorrect_guesses
+        self.num_guesses_avoided += other.num_guesses_avoided
+        self.num_forced_moves += other.num_forced_moves
+        self.num_probes += other.num_probes
+        self.num_transposition_hits += other.num_transposition_hits
+        self.num_transposition_misses += other.num_transposition_misses
+        self.max_depth = max(self.max_depth, other.max_depth)
+        for depth, num_backtracks in other.backtracks_by_depth.items():
+            self.backtracks_by_depth[depth] = (
+                self.backtracks_by_depth.get(depth, 0) + num_backtracks
+            )
+        self.validation_time += other.validation_time
+        self.map_update_time += other.map_update_time
+        self.branching_time += other.branching_time
+        self.propagation_time += other.propagation_time
+
+    def to_dict(self) -> dict[str, Any]:
+        metrics = asdict(self)
+        metrics["backtracks_by_depth"] = {
+            str(depth): num_backtracks
+            for depth, num_backtracks in sorted(self.backtracks_by_depth.items())
+        }
+        metrics["num_backtracks"] = self.num_backtracks
+        metrics["nodes_per_second"] = self.nodes_per_second
+        return metrics
+
+    @staticmethod
+    def from_dict(metrics: dict[str, Any]) -> "SolveMetrics":
+        # The inverse of to_dict; the derived numbers it adds are dropped.
+        values = {
+            name: value
+            for name, value in metrics.items()
+            if name not in ("num_backtracks", "nodes_per_second")
+        }
+        values["backtracks_by_depth"] = {
+            int(depth): num_backtracks
+            for depth, num_backtracks in metrics.get("backtracks_by_depth", {}).items()
+        }
+        return SolveMetrics(**values)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
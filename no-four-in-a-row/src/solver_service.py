@@ -1,155 +1,483 @@
-from src.game_service import GameService
-from src.game_board import GameBoard
-from src.models import BoardLocation, Move
-from src.decorators import timing_decorator  # type: ignore
+import copy
+import time
+from typing import TYPE_CHECKING, Callable
+
+from src.board_loaders import format_rows
+from src.branching_strategies import BranchingStrategy, MostConstrainedCellBranching
+from src.game_service import GameService, InvalidMoveException
+from src.game_board import EMPTY_CHAR, GameBoard, Placement
+from src.propagation_service import PropagationService
+from src.results import SolutionCount, SolveResult, SolveStatus, to_moves
+from src.search_checkpoint import (
+    SavedChoicePoint,
+    SearchCheckpoint,
+    SearchCheckpointer,
+)
+from src.search_state import ChoicePoint, SearchState
+from src.solve_hooks import SolveHooks
+from src.solve_metrics import SolveMetrics
+from src.transposition_table import TranspositionTable, ZobristHasher
+from src.valid_move_map import ValidMoveMap
+
+if TYPE_CHECKING:
+    from src.models import Move
+    from src.solving_engines import SolvingEngine
 
 
 class SolverService:
     game_service: GameService
-    num_guesses: int = 0
-    num_incorrect_guesses: int = 0
-    num_board_states: int = 0
+    propagation_service: PropagationService | None
+    branching_strategy: BranchingStrategy
+    transposition_table: TranspositionTable | None
+    zobrist_hasher: ZobristHasher | None
+    max_depth: int | None
+    max_nodes: int | None
+    should_stop: Callable[[], bool] | None
+    stop_check_interval: int
+    engine: "SolvingEngine | None"
+    hooks: list[SolveHooks]
+    collect_timings: bool
+    checkpointer: SearchCheckpointer | None
+    metrics: SolveMetrics
 
-    def __init__(self, game_service: GameService) -> None:
+    def __init__(
+        self,
+        game_service: GameService,
+        use_propagation: bool = True,
+        branching_strategy: BranchingStrategy | None = None,
+        use_transposition_table: bool = True,
+        transposition_table_size: int = 100_000,
+        max_depth: int | None = None,
+        max_nodes: int | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        stop_check_interval: int = 1000,
+        engine: "SolvingEngine | None" = None,
+        hooks: list[SolveHooks] | None = None,
+        collect_timings: bool = False,
+        checkpointer: SearchCheckpointer | None = None,
+    ) -> None:
         self.game_service = game_service
+        self.propagation_service = (
+            PropagationService(game_service) if use_propagation else None
+        )
+        self.branching_strategy = (
+            branching_strategy
+            if branching_strategy is not None
+            else MostConstrainedCellBranching(game_service)
+        )
+        self.transposition_table = (
+            TranspositionTable(transposition_table_size)
+            if use_transposition_table
+            else None
+        )
+        self.zobrist_hasher = ZobristHasher() if use_transposition_table else None
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.should_stop = should_stop
+        self.stop_check_interval = stop_check_interval
+        # Replaces the built-in backtracking search when set.
+        self.engine = engine
+        self.hooks = hooks if hooks is not None else []
+        # Splits solve time between validation, valid-move map updates,
+        # branching and probing, at the cost of a few timer calls per move.
+        self.collect_timings = collect_timings
+        # Saves the built-in search's frontier so it can be resumed later.
+        self.checkpointer = checkpointer
+        # The metrics of the current or most recent search.
+        self.metrics = SolveMetrics()
 
-    @timing_decorator
-    def solve(self, game_board: GameBoard) -> None:
-        game_board.display_board()
-        valid_move_map = self.__get_valid_move_map(game_board)
+    def solve(self, game_board: GameBoard) -> SolveResult:
+        status, moves_made = self.search_placements(game_board)
+        return SolveResult.from_placements(status, game_board, moves_made, self.metrics)
 
-        is_solved, moves_made = self.__recursive_solve(
-            game_board=game_board, valid_move_map=valid_move_map
-        )
-        if is_solved:
-            self.__display_moves_made(game_board, moves_made)
-        else:
-            print("Invalid Board. Cannot be solved.")
+    def search(self, game_board: GameBoard) -> tuple[SolveStatus, list["Move"]]:
+        status, moves_made = self.search_placements(game_board)
+        return status, self.to_moves(game_board, moves_made)
 
-    def __recursive_solve(
-        self,
-        game_board: GameBoard,
-        valid_move_map: dict[str, list[Move]],
-        previously_made_moves: list[Move] = [],
-    ) -> tuple[bool, list[Move]]:
-        while self.__forcible_moves_exist(valid_move_map):
-            new_move = self.__get_forcible_move(valid_move_map)
-            (
-                game_board,
-                previously_made_moves,
-                valid_move_map,
-            ) = self.__make_move_and_update_data(
-                game_board=game_board,
-                new_move=new_move,
-                previously_made_moves=previously_made_moves,
-            )
+    def to_moves(
+        self, game_board: GameBoard, placements: list[Placement]
+    ) -> list["Move"]:
+        return to_moves(game_board, placements)
 
-        if self.__is_solved(valid_move_map):
-            return True, previously_made_moves
-        if not self.__every_empty_space_has_valid_move(valid_move_map):
-            self.num_incorrect_guesses += 1
-            return False, []
-
-        # No forcible moves left: make a guess
-        for new_move in self.__flatten_valid_moves(valid_move_map):
-            self.num_guesses += 1
-            (
-                new_game_board,
-                new_previously_made_moves,
-                new_valid_move_map,
-            ) = self.__make_move_and_update_data(
-                game_board=game_board,
-                new_move=new_move,
-                previously_made_moves=previously_made_moves,
+    def search_placements(
+        self, game_board: GameBoard, cell_idxs: list[int] | None = None
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # With cell_idxs only those empty cells are filled in, which is only
+        # sound if no window has both one of them and another empty cell.
+        start = self.__start_search(game_board)
+        if self.engine is not None:
+            status, moves_made = self.engine.search_placements(
+                self, game_board, cell_idxs
+            )
+            if status == SolveStatus.SOLVED:
+                for hook in self.hooks:
+                    hook.on_solution(moves_made)
+        else:
+            search_state = self.__new_search_state(game_board, cell_idxs)
+            status, moves_made = self.__checkpointed_solve(
+                search_state, [], False, start
             )
-            is_solved, final_moves_made = self.__recursive_solve(
-                game_board=new_game_board,
-                valid_move_map=new_valid_move_map,
-                previously_made_moves=new_previously_made_moves,
+        self.__finish_search(status, start)
+        return status, moves_made
+
+    def resume(self, checkpoint: SearchCheckpoint) -> SolveResult:
+        status, moves_made = self.resume_placements(checkpoint)
+        return SolveResult.from_placements(
+            status, checkpoint.get_game_board(), moves_made, self.metrics
+        )
+
+    def resume_placements(
+        self, checkpoint: SearchCheckpoint
+    ) -> tuple[SolveStatus, list[Placement]]:
+        # Carries on a search saved by the checkpointer, possibly in another
+        # process. The metrics, including wall time, continue from the
+        # checkpoint's.
+        if self.engine is not None:
+            raise ValueError("only the built-in search can resume from a checkpoint")
+        if checkpoint.rules != self.game_service.rules:
+            raise ValueError("the checkpoint was saved under different rules")
+        game_board = checkpoint.get_game_board()
+        start = self.__start_search(game_board) - checkpoint.metrics.wall_time
+        self.metrics = copy.deepcopy(checkpoint.metrics)
+        search_state = self.__new_search_state(game_board, checkpoint.cell_idxs)
+        if self.transposition_table is not None:
+            for board_hash in checkpoint.unsolvable_hashes:
+                self.transposition_table.add_unsolvable(board_hash)
+        for move in checkpoint.moves_made:
+            search_state.apply_move(move)
+        search_state.valid_move_map.restore_order(checkpoint.valid_move_order)
+        choice_points = [
+            ChoicePoint(
+                num_moves=choice_point.num_moves,
+                moves=list(choice_point.moves),
+                next_move_idx=choice_point.next_move_idx,
+                board_hash=choice_point.board_hash,
+                is_exhaustive=choice_point.is_exhaustive,
             )
-            if is_solved:
-                return True, final_moves_made
-        return False, []
-
-    def __get_valid_move_map(self, game_board: GameBoard) -> dict[str, list[Move]]:
-        empty_spaces_valid_moves_dict = {}
-        empty_cells = self.__get_empty_cells(game_board)
-        for empty_cell in empty_cells:
-            valid_moves = self.__valid_moves_for_cell(game_board, empty_cell)
-            empty_spaces_valid_moves_dict[empty_cell.model_dump_json()] = valid_moves
-        return empty_spaces_valid_moves_dict
-
-    def __valid_moves_for_cell(
-        self, game_board: GameBoard, cell: BoardLocation
-    ) -> list[Move]:
-        possible_moves = [
-            Move(cell=cell, char="o"),
-            Move(cell=cell, char="x"),
-        ]
-        valid_moves = [
-            move
-            for move in possible_moves
-            if self.game_service.is_valid_move(game_board, move)
+            for choice_point in checkpoint.choice_points
         ]
-        return valid_moves
+        status, moves_made = self.__checkpointed_solve(
+            search_state, choice_points, checkpoint.is_depth_limit_reached, start
+        )
+        self.__finish_search(status, start)
+        return status, moves_made
+
+    def count_solutions(self, game_board: GameBoard, limit: int = 2) -> SolutionCount:
+        # Counts solutions with the backtracking search, stopping once limit
+        # of them are found; limit=2 is enough to check uniqueness. Always
+        # uses the built-in search, even when an engine is set.
+        if not self.branching_strategy.is_disjoint:
+            raise ValueError(
+                f"{type(self.branching_strategy).__name__} can reach a solution "
+                "more than once and cannot be used to count solutions"
+            )
+        start = self.__start_search(game_board)
+        search_state = self.__new_search_state(game_board)
+        status, num_solutions = self.__iterative_solve(search_state, limit)
+        # UNSOLVABLE here means the whole tree was searched.
+        is_exact = status == SolveStatus.UNSOLVABLE
+        if is_exact and num_solutions > 0:
+            status = SolveStatus.SOLVED
+        self.__finish_search(status, start)
+        return SolutionCount(
+            num_solutions=num_solutions,
+            is_exact=is_exact,
+            status=status,
+            num_board_states=self.metrics.num_board_states,
+        )
+
+    def __start_search(self, game_board: GameBoard) -> float:
+        self.metrics = SolveMetrics()
+        for hook in self.hooks:
+            hook.on_start(game_board)
+        return time.perf_counter()
+
+    def __finish_search(self, status: SolveStatus, start: float) -> None:
+        self.metrics.wall_time = time.perf_counter() - start
+        for hook in self.hooks:
+            hook.on_finish(status, self.metrics)
+
+    def __new_search_state(
+        self, game_board: GameBoard, cell_idxs: list[int] | None = None
+    ) -> SearchState:
+        if self.transposition_table is not None:
+            # Entries are only valid for the board they were found on.
+            self.transposition_table.clear()
+        start = time.perf_counter() if self.collect_timings else 0.0
+        search_state = SearchState(
+            self.game_service, game_board, self.zobrist_hasher, cell_idxs
+        )
+        if self.collect_timings:
+            self.metrics.map_update_time += time.perf_counter() - start
+        return search_state
+
+    def __checkpointed_solve(
+        self,
+        search_state: SearchState,
+        choice_points: list[ChoicePoint],
+        is_depth_limit_reached: bool,
+        start: float,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        checkpointer = self.checkpointer
+        if checkpointer is not None:
+            checkpointer.reset_timer()
+        status, _ = self.__iterative_solve(
+            search_state,
+            choice_points=choice_points,
+            is_depth_limit_reached=is_depth_limit_reached,
+            checkpointer=checkpointer,
+            start=start,
+        )
+        if checkpointer is not None and status not in (
+            SolveStatus.NODE_LIMIT_REACHED,
+            SolveStatus.CANCELLED,
+        ):
+            # The search finished on its own, so its checkpoint is stale.
+            checkpointer.remove()
+        moves_made = (
+            search_state.moves_made.copy() if status == SolveStatus.SOLVED else []
+        )
+        return status, moves_made
+
+    def __iterative_solve(
+        self,
+        search_state: SearchState,
+        solution_limit: int = 1,
+        choice_points: list[ChoicePoint] | None = None,
+        is_depth_limit_reached: bool = False,
+        checkpointer: SearchCheckpointer | None = None,
+        start: float = 0.0,
+    ) -> tuple[SolveStatus, int]:
+        # Returns SOLVED once solution_limit solutions are found, and
+        # UNSOLVABLE once the tree is exhausted, along with the number of
+        # solutions found. choice_points and is_depth_limit_reached continue
+        # a resumed search.
+        valid_move_map = search_state.valid_move_map
+        metrics = self.metrics
+        hooks = self.hooks
+        num_solutions = 0
+        if choice_points is None:
+            choice_points = []
+        max_num_board_states = (
+            metrics.num_board_states + self.max_nodes
+            if self.max_nodes is not None
+            else None
+        )
+        transposition_table = self.transposition_table
+        next_stop_check = metrics.num_board_states + self.stop_check_interval
+
+        while True:
+            # The top of the loop is the only point where the search state
+            # and choice_points alone determine the rest of the search, so the
+            # search only stops here, saving a checkpoint first if it has a
+            # checkpointer.
+            stop_status = None
+            if (
+                max_num_board_states is not None
+                and metrics.num_board_states >= max_num_board_states
+            ):
+                stop_status = SolveStatus.NODE_LIMIT_REACHED
+            elif (
+                self.should_stop is not None
+                and metrics.num_board_states >= next_stop_check
+            ):
+                if self.should_stop():
+                    stop_status = SolveStatus.CANCELLED
+                next_stop_check = metrics.num_board_states + self.stop_check_interval
+            if checkpointer is not None and (
+                stop_status is not None or checkpointer.is_due()
+            ):
+                checkpointer.save(
+                    self.__get_checkpoint(
+                        search_state, choice_points, is_depth_limit_reached, start
+                    )
+                )
+                if checkpointer.is_stop_requested:
+                    stop_status = SolveStatus.CANCELLED
+            if stop_status is not None:
+                return stop_status, num_solutions
+
+            board_hash = search_state.board_hash
+            if transposition_table is not None and (
+                transposition_table.is_known_unsolvable(board_hash)
+            ):
+                # Reached before through a different order of guesses.
+                metrics.num_transposition_hits += 1
+                is_consistent = False
+            else:
+                if transposition_table is not None:
+                    metrics.num_transposition_misses += 1
+                is_consistent = self.propagate(search_state)
+
+                if self.__is_solved(valid_move_map):
+                    num_solutions += 1
+                    for hook in hooks:
+                        hook.on_solution(search_state.moves_made)
+                    if num_solutions >= solution_limit:
+                        return SolveStatus.SOLVED, num_solutions
+                    # Keep searching, but the guesses leading here have a
+                    # solution below them.
+                    is_consistent = False
+                    for choice_point in choice_points:
+                        choice_point.is_exhaustive = False
+                elif not is_consistent:
+                    metrics.num_incorrect_guesses += 1
+                    if transposition_table is not None:
+                        transposition_table.add_unsolvable(board_hash)
+
+            # Anything but a new guess means going back to an earlier one.
+            is_backtracking = True
+            if is_consistent:
+                if self.max_depth is not None and len(choice_points) >= self.max_depth:
+                    is_depth_limit_reached = True
+                    for choice_point in choice_points:
+                        choice_point.is_exhaustive = False
+                else:
+                    # No forcible moves left: make a guess
+                    choice_points.append(
+                        ChoicePoint(
+                            num_moves=len(search_state.moves_made),
+                            moves=self.__select_moves(search_state),
+                            board_hash=board_hash,
+                        )
+                    )
+                    metrics.max_depth = max(metrics.max_depth, len(choice_points))
+                    is_backtracking = False
 
-    def __forcible_moves_exist(self, valid_move_map: dict[str, list[Move]]) -> bool:
-        for empty_cell in valid_move_map.keys():
-            if len(valid_move_map[empty_cell]) == 1:
+            # Resume from the most recent guess that still has alternatives
+            while choice_points:
+                choice_point = choice_points[-1]
+                search_state.undo_to(choice_point.num_moves)
+                if choice_point.next_move_idx < len(choice_point.moves):
+                    new_move = choice_point.moves[choice_point.next_move_idx]
+                    choice_point.next_move_idx += 1
+                    depth = len(choice_points)
+                    if is_backtracking:
+                        metrics.record_backtrack(depth)
+                        for hook in hooks:
+                            hook.on_backtrack(depth)
+                    metrics.num_guesses += 1
+                    for hook in hooks:
+                        hook.on_guess(new_move, depth)
+                    self.make_move(search_state, new_move)
+                    break
+                choice_points.pop()
+                if transposition_table is not None and choice_point.is_exhaustive:
+                    transposition_table.add_unsolvable(choice_point.board_hash)
+            else:
+                if is_depth_limit_reached:
+                    return SolveStatus.DEPTH_LIMIT_REACHED, num_solutions
+                return SolveStatus.UNSOLVABLE, num_solutions
+
+    def __get_checkpoint(
+        self,
+        search_state: SearchState,
+        choice_points: list[ChoicePoint],
+        is_depth_limit_reached: bool,
+        start: float,
+    ) -> SearchCheckpoint:
+        game_board = search_state.game_board.copy()
+        for cell_idx, _ in search_state.moves_made:
+            game_board.update_cell_idx(cell_idx, EMPTY_CHAR)
+        metrics = copy.deepcopy(self.metrics)
+        metrics.wall_time = time.perf_counter() - start
+        return SearchCheckpoint(
+            rows=format_rows(game_board),
+            rules=self.game_service.rules,
+            cell_idxs=search_state.cell_idxs,
+            moves_made=search_state.moves_made.copy(),
+            choice_points=[
+                SavedChoicePoint(
+                    num_moves=choice_point.num_moves,
+                    moves=list(choice_point.moves),
+                    next_move_idx=choice_point.next_move_idx,
+                    board_hash=choice_point.board_hash,
+                    is_exhaustive=choice_point.is_exhaustive,
+                )
+                for choice_point in choice_points
+            ],
+            valid_move_order=search_state.valid_move_map.get_order(),
+            unsolvable_hashes=(
+                list(self.transposition_table.entries)
+                if self.transposition_table is not None
+                else []
+            ),
+            is_depth_limit_reached=is_depth_limit_reached,
+            metrics=metrics,
+        )
+
+    def propagate(self, search_state: SearchState) -> bool:
+        # Makes forced and deduced moves until a guess is needed. Returns False
+        # if the position turned out to have no solution.
+        valid_move_map = search_state.valid_move_map
+        while True:
+            while self.__forcible_moves_exist(valid_move_map):
+                new_move = self.__get_forcible_move(valid_move_map)
+                self.metrics.num_forced_moves += 1
+                for hook in self.hooks:
+                    hook.on_propagation(new_move, False)
+                self.make_move(search_state, new_move)
+
+            if not self.__every_empty_space_has_valid_move(valid_move_map):
+                return False
+            if self.propagation_service is None or self.__is_solved(valid_move_map):
                 return True
-        return False
-
-    def __get_forcible_move(self, valid_move_map: dict[str, list[Move]]) -> Move:
-        for empty_cell in valid_move_map.keys():
-            if len(valid_move_map[empty_cell]) == 1:
-                return valid_move_map[empty_cell][0]
-        raise Exception("No forcible move found")
-
-    def __flatten_valid_moves(
-        self, valid_move_map: dict[str, list[Move]]
-    ) -> list[Move]:
-        return [move for moves in valid_move_map.values() for move in moves]
-
-    def __get_empty_cells(self, game_board: GameBoard) -> list[BoardLocation]:
-        empty_cells: list[BoardLocation] = []
-        for row_idx in range(game_board.n_rows):
-            for col_idx in range(game_board.n_cols):
-                if game_board.get_cell(row_idx, col_idx) == " ":
-                    empty_cells.append(BoardLocation(row_idx=row_idx, col_idx=col_idx))
-        return empty_cells
-
-    def __every_empty_space_has_valid_move(
-        self, valid_move_map: dict[str, list[Move]]
-    ) -> bool:
-        for empty_cell in valid_move_map.keys():
-            if len(valid_move_map[empty_cell]) == 0:
+
+            is_consistent, deduced_move = self.__probe(search_state)
+            if not is_consistent:
                 return False
-        return True
+            if deduced_move is None:
+                return True
+            # The deduction stands in for a guess that would have been needed.
+            self.metrics.num_guesses_avoided += 1
+            for hook in self.hooks:
+                hook.on_propagation(deduced_move, True)
+            self.make_move(search_state, deduced_move)
 
-    def __make_move_and_update_data(
-        self,
-        game_board: GameBoard,
-        new_move: Move,
-        previously_made_moves: list[Move],
-    ) -> tuple[GameBoard, list[Move], dict[str, list[Move]]]:
-        self.num_board_states += 1
-        new_moves_made = previously_made_moves.copy() + [new_move]
-        new_game_board = self.game_service.make_move(game_board, new_move)
+    def __probe(self, search_state: SearchState) -> tuple[bool, Placement | None]:
+        assert self.propagation_service is not None
+        self.metrics.num_probes += 1
+        if not self.collect_timings:
+            return self.propagation_service.probe(search_state)
+        start = time.perf_counter()
+        result = self.propagation_service.probe(search_state)
+        self.metrics.propagation_time += time.perf_counter() - start
+        return result
 
-        new_valid_move_map = self.__get_valid_move_map(new_game_board)
+    def __select_moves(self, search_state: SearchState) -> list[Placement]:
+        if not self.collect_timings:
+            return self.branching_strategy.select_moves(search_state)
+        start = time.perf_counter()
+        moves = self.branching_strategy.select_moves(search_state)
+        self.metrics.branching_time += time.perf_counter() - start
+        return moves
 
-        return new_game_board, new_moves_made, new_valid_move_map
+    def __forcible_moves_exist(self, valid_move_map: ValidMoveMap) -> bool:
+        return valid_move_map.count_cells_with(1) > 0
 
-    def __is_solved(self, valid_move_map: dict[str, list[Move]]) -> bool:
-        return len(valid_move_map.keys()) == 0
+    def __get_forcible_move(self, valid_move_map: ValidMoveMap) -> Placement:
+        cell_idx = valid_move_map.first_cell_with(1)
+        if cell_idx is None:
+            raise Exception("No forcible move found")
+        return cell_idx, valid_move_map.get_chars(cell_idx)
 
-    def __display_moves_made(
-        self, game_board: GameBoard, moves_made: list[Move]
-    ) -> None:
-        for move in moves_made:
-            game_board = self.game_service.make_move(game_board, move)
-            game_board.display_board(move)
-        print("Game Complete. Solved")
-        print(f"Number of board states analysed: {self.num_board_states}")
-        print(f"Number of guesses: {self.num_guesses}")
-        print(f"Number of incorrect guesses: {self.num_incorrect_guesses}")
+    def __every_empty_space_has_valid_move(self, valid_move_map: ValidMoveMap) -> bool:
+        return valid_move_map.count_cells_with(0) == 0
+
+    def make_move(self, search_state: SearchState, new_move: Placement) -> None:
+        metrics = self.metrics
+        metrics.num_board_states += 1
+        if not self.collect_timings:
+            search_state.make_move(new_move)
+            return
+        start = time.perf_counter()
+        is_valid = search_state.is_valid_move(new_move)
+        validated = time.perf_counter()
+        metrics.validation_time += validated - start
+        if not is_valid:
+            raise InvalidMoveException()
+        search_state.apply_move(new_move)
+        metrics.map_update_time += time.perf_counter() - validated
+
+    def __is_solved(self, valid_move_map: ValidMoveMap) -> bool:
+        return len(valid_move_map) == 0
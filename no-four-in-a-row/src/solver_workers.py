@@ -0,0 +1,36 @@
+import copy
+from typing import TYPE_CHECKING
+
+from src.solver_service import SolverService
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Event
+
+# Boards cross process boundaries as GameBoard.encode() tuples.
+EncodedBoard = tuple[int, int, int, int]
+
+# Set in each worker process by init_worker.
+worker_solver_service: SolverService | None = None
+
+
+def copy_for_workers(solver_service: SolverService) -> SolverService:
+    # Workers get their own stop check, which replaces the caller's, and no
+    # hooks, which belong to the calling process.
+    worker_copy = copy.copy(solver_service)
+    worker_copy.should_stop = None
+    worker_copy.hooks = []
+    return worker_copy
+
+
+def init_worker(
+    solver_service: SolverService, stop_event: "Event | None" = None
+) -> None:
+    global worker_solver_service
+    if stop_event is not None:
+        solver_service.should_stop = stop_event.is_set
+    worker_solver_service = solver_service
+
+
+def get_worker_solver_service() -> SolverService:
+    assert worker_solver_service is not None
+    return worker_solver_service
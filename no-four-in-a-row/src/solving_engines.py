@@ -0,0 +1,106 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from src.cdcl_solver import CdclSolver
+from src.game_board import O_CHAR, X_CHAR, GameBoard, Placement
+from src.game_service import GameService
+from src.results import SolveStatus
+
+if TYPE_CHECKING:
+    from src.solver_service import SolverService
+
+
+class SolvingEngine(ABC):
+    # Replaces the backtracking search of a SolverService. Engines read the
+    # node limit and stop callback from the solver service and add to its
+    # metrics, so every service built on SolverService works with any engine.
+    # cell_idxs limits the search to some of the empty cells, as in
+    # SolverService.search_placements.
+    @abstractmethod
+    def search_placements(
+        self,
+        solver_service: "SolverService",
+        game_board: GameBoard,
+        cell_idxs: list[int] | None = None,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        pass
+
+
+class SatEngine(SolvingEngine):
+    # Encodes the board as SAT and solves it with CdclSolver. Each empty cell
+    # is a variable that is true for x and false for o, and each window with an
+    # empty cell and no o (no x) gets a clause saying not all of its empty
+    # cells are x (o). Windows without an empty cell are left out, as moves
+    # cannot change them. Assignments count as board states, decisions as
+    # guesses and conflicts as incorrect guesses; max_depth is not used.
+    game_service: GameService
+    num_restarts: int
+    num_learned_clauses: int
+
+    def __init__(self, game_service: GameService) -> None:
+        if game_service.rules.balanced_counts:
+            raise ValueError("SatEngine does not support balanced counts")
+        self.game_service = game_service
+        self.num_restarts = 0
+        self.num_learned_clauses = 0
+
+    def search_placements(
+        self,
+        solver_service: "SolverService",
+        game_board: GameBoard,
+        cell_idxs: list[int] | None = None,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        empty_cell_idxs = (
+            game_board.empty_cell_idxs() if cell_idxs is None else sorted(cell_idxs)
+        )
+        var_by_cell = {
+            cell_idx: var for var, cell_idx in enumerate(empty_cell_idxs, start=1)
+        }
+        cdcl_solver = CdclSolver(len(empty_cell_idxs))
+        for clause in self.__get_clauses(game_board, var_by_cell):
+            cdcl_solver.add_clause(clause)
+
+        status = cdcl_solver.solve(
+            max_assignments=solver_service.max_nodes,
+            should_stop=solver_service.should_stop,
+            stop_check_interval=solver_service.stop_check_interval,
+        )
+        metrics = solver_service.metrics
+        metrics.num_board_states += cdcl_solver.num_assignments
+        metrics.num_guesses += cdcl_solver.num_decisions
+        metrics.num_incorrect_guesses += cdcl_solver.num_conflicts
+        self.num_restarts += cdcl_solver.num_restarts
+        self.num_learned_clauses += cdcl_solver.num_learned_clauses
+
+        if status != SolveStatus.SOLVED:
+            return status, []
+        model = cdcl_solver.get_model()
+        return status, [
+            (cell_idx, X_CHAR if model[var] else O_CHAR)
+            for cell_idx, var in var_by_cell.items()
+        ]
+
+    def __get_clauses(
+        self, game_board: GameBoard, var_by_cell: dict[int, int]
+    ) -> list[list[int]]:
+        windows = {
+            window
+            for cell_windows in self.game_service.get_cell_windows(game_board).values()
+            for window in cell_windows
+        }
+        empty_bits = sum(1 << cell_idx for cell_idx in var_by_cell)
+        clauses = []
+        for window in sorted(windows):
+            if not window & empty_bits:
+                continue
+            window_vars = []
+            empty_window_bits = window & empty_bits
+            while empty_window_bits:
+                cell_bit = empty_window_bits & -empty_window_bits
+                window_vars.append(var_by_cell[cell_bit.bit_length() - 1])
+                empty_window_bits ^= cell_bit
+            if not window & game_board.o_bits:
+                clauses.append([-var for var in window_vars])
+            if not window & game_board.x_bits:
+                clauses.append(window_vars)
+        return clauses
@@ -0,0 +1,70 @@
+import random
+from collections import OrderedDict
+
+from src.game_board import O_CHAR, X_CHAR, GameBoard
+
+ZOBRIST_SEED = 0
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class ZobristHasher:
+    # One random 64-bit key per (cell, character). The hash of a board is the
+    # XOR of the keys of its filled cells, so it can be updated incrementally
+    # by XOR-ing a single key in or out for every move made or unmade. The
+    # keys of a shape depend only on the seed, so hashes saved in a
+    # checkpoint stay valid in another process.
+    seed: int
+    keys_by_shape: dict[tuple[int, int], dict[str, list[int]]]
+
+    def __init__(self, seed: int = ZOBRIST_SEED) -> None:
+        self.seed = seed
+        self.keys_by_shape = {}
+
+    def hash_board(self, game_board: GameBoard) -> int:
+        board_hash = 0
+        for cell_idx in game_board.cell_idxs():
+            for char in (X_CHAR, O_CHAR):
+                if game_board.get_bits(char) >> cell_idx & 1:
+                    board_hash ^= self.get_key(game_board, cell_idx, char)
+        return board_hash
+
+    def get_key(self, game_board: GameBoard, cell_idx: int, char: str) -> int:
+        shape = (game_board.n_rows, game_board.n_cols)
+        if shape not in self.keys_by_shape:
+            num_bits = game_board.n_rows * game_board.stride
+            shape_random = random.Random(f"{self.seed}:{shape[0]}x{shape[1]}")
+            self.keys_by_shape[shape] = {
+                char: [shape_random.getrandbits(64) for _ in range(num_bits)]
+                for char in (X_CHAR, O_CHAR)
+            }
+        return self.keys_by_shape[shape][char][cell_idx]
+
+
+class TranspositionTable:
+    # Hashes of positions whose whole subtree is known to have no solution.
+    # Bounded in size; the least recently used entry is evicted first. The
+    # solver counts hits and misses in its SolveMetrics.
+    max_entries: int
+    entries: OrderedDict[int, None]
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def is_known_unsolvable(self, board_hash: int) -> bool:
+        if board_hash in self.entries:
+            self.entries.move_to_end(board_hash)
+            return True
+        return False
+
+    def add_unsolvable(self, board_hash: int) -> None:
+        self.entries[board_hash] = None
+        self.entries.move_to_end(board_hash)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
@@ -0,0 +1,94 @@
+from src.game_board import Placement
+
+MAX_MOVES_PER_CELL = 2
+
+
+class ValidMoveMap:
+    # The characters that can still be placed in every empty cell, keyed by
+    # the cell's bit index, plus the empty cells bucketed by how many valid
+    # characters they have. The buckets are dicts used as ordered sets so that
+    # counting and picking a cell with a given number of moves is O(1).
+    # Every change is recorded on an undo trail so the map can be rolled back
+    # in place while backtracking.
+    chars_by_cell: dict[int, str]
+    cells_by_num_moves: list[dict[int, None]]
+    undo_trail: list[tuple[int, str | None]]
+
+    def __init__(self) -> None:
+        self.chars_by_cell = {}
+        self.cells_by_num_moves = [{} for _ in range(MAX_MOVES_PER_CELL + 1)]
+        self.undo_trail = []
+
+    def __len__(self) -> int:
+        return len(self.chars_by_cell)
+
+    def __contains__(self, cell_idx: int) -> bool:
+        return cell_idx in self.chars_by_cell
+
+    def get_chars(self, cell_idx: int) -> str:
+        return self.chars_by_cell[cell_idx]
+
+    def get_moves(self, cell_idx: int) -> list[Placement]:
+        return [(cell_idx, char) for char in self.chars_by_cell[cell_idx]]
+
+    def set_chars(self, cell_idx: int, chars: str) -> None:
+        self.undo_trail.append((cell_idx, self.chars_by_cell.get(cell_idx)))
+        self.__set_chars(cell_idx, chars)
+
+    def remove_cell(self, cell_idx: int) -> None:
+        self.undo_trail.append((cell_idx, self.chars_by_cell.get(cell_idx)))
+        self.__remove_cell(cell_idx)
+
+    def trail_length(self) -> int:
+        return len(self.undo_trail)
+
+    def undo_to(self, trail_length: int) -> None:
+        while len(self.undo_trail) > trail_length:
+            cell_idx, previous_chars = self.undo_trail.pop()
+            if previous_chars is None:
+                self.__remove_cell(cell_idx)
+            else:
+                self.__set_chars(cell_idx, previous_chars)
+
+    def count_cells_with(self, num_moves: int) -> int:
+        return len(self.cells_by_num_moves[num_moves])
+
+    def first_cell_with(self, num_moves: int) -> int | None:
+        return next(iter(self.cells_by_num_moves[num_moves]), None)
+
+    def all_moves(self) -> list[Placement]:
+        return [
+            (cell_idx, char)
+            for cell_idx, chars in self.chars_by_cell.items()
+            for char in chars
+        ]
+
+    def get_order(self) -> list[list[int]]:
+        # The order of the cells in chars_by_cell and in each bucket. It
+        # decides which cell is picked next and depends on the changes undone
+        # so far, which replaying the moves on the current path does not
+        # reproduce.
+        return [list(self.chars_by_cell)] + [
+            list(cells) for cells in self.cells_by_num_moves
+        ]
+
+    def restore_order(self, order: list[list[int]]) -> None:
+        # Reorders the same cells as get_order returned them.
+        chars_by_cell = self.chars_by_cell.copy()
+        self.chars_by_cell.clear()
+        for cell_idx in order[0]:
+            self.chars_by_cell[cell_idx] = chars_by_cell[cell_idx]
+        for cells, cell_order in zip(self.cells_by_num_moves, order[1:]):
+            cells.clear()
+            cells.update(dict.fromkeys(cell_order))
+
+    def __set_chars(self, cell_idx: int, chars: str) -> None:
+        previous_chars = self.chars_by_cell.get(cell_idx)
+        if previous_chars is not None:
+            del self.cells_by_num_moves[len(previous_chars)][cell_idx]
+        self.chars_by_cell[cell_idx] = chars
+        self.cells_by_num_moves[len(chars)][cell_idx] = None
+
+    def __remove_cell(self, cell_idx: int) -> None:
+        previous_chars = self.chars_by_cell.pop(cell_idx)
+        del self.cells_by_num_moves[len(previous_chars)][cell_idx]
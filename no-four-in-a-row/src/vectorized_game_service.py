@@ -0,0 +1,135 @@
+import numpy as np
+import numpy.typing as npt
+
+from src.game_board import O_CHAR, X_CHAR, GameBoard
+from src.game_service import GameService
+
+BoolArray = npt.NDArray[np.bool_]
+IntArray = npt.NDArray[np.int16]
+
+
+class VectorizedGameService:
+    # Whole-board versions of the GameService rules computed with NumPy. For
+    # every direction the number of each character in every window is a sum
+    # of shifted copies of the board, so legality of every cell is found in a
+    # fixed number of array operations instead of a Python loop per cell.
+    # Results match GameService.is_valid_placement exactly.
+    game_service: GameService
+
+    def __init__(self, game_service: GameService) -> None:
+        self.game_service = game_service
+
+    def get_legal_move_masks(self, game_board: GameBoard) -> dict[str, BoolArray]:
+        n = self.game_service.disallowed_num_consecutive_chars
+        empty = ~(self.__to_array(game_board, game_board.x_bits | game_board.o_bits))
+        window_counts = self.__get_window_counts(game_board)
+        legal_move_masks = {}
+        for char in (X_CHAR, O_CHAR):
+            illegal = np.zeros((game_board.n_rows, game_board.n_cols), dtype=np.bool_)
+            for direction, num_cells, num_chars in zip(
+                self.game_service.rules.directions,
+                window_counts["cells"],
+                window_counts[char],
+            ):
+                # A window with n - 1 of the character would be completed by
+                # placing it in the window's remaining cell.
+                nearly_full = (num_cells == n) & (num_chars == n - 1)
+                illegal |= self.__any_window_containing(
+                    nearly_full, direction, game_board
+                )
+            if self.game_service.rules.balanced_counts:
+                # Rows and columns already holding half their cells of the
+                # character cannot take another.
+                char_layer = self.__to_array(game_board, game_board.get_bits(char))
+                row_counts = char_layer.sum(axis=1, dtype=np.int16)
+                col_counts = char_layer.sum(axis=0, dtype=np.int16)
+                illegal |= (row_counts >= game_board.n_cols // 2)[:, np.newaxis]
+                illegal |= (col_counts >= game_board.n_rows // 2)[np.newaxis, :]
+            legal_move_masks[char] = empty & ~illegal
+        return legal_move_masks
+
+    def has_disallowed_run(self, game_board: GameBoard) -> bool:
+        n = self.game_service.disallowed_num_consecutive_chars
+        window_counts = self.__get_window_counts(game_board)
+        return any(
+            bool(np.any((num_cells == n) & (num_chars == n)))
+            for char in (X_CHAR, O_CHAR)
+            for num_cells, num_chars in zip(window_counts["cells"], window_counts[char])
+        )
+
+    def is_completed_board_valid(self, game_board: GameBoard) -> bool:
+        filled = self.__to_array(game_board, game_board.x_bits | game_board.o_bits)
+        return bool(np.all(filled)) and not self.has_disallowed_run(game_board)
+
+    def __get_window_counts(self, game_board: GameBoard) -> dict[str, list[IntArray]]:
+        # For every direction, the number of board cells and of each character
+        # in the window starting at every position up to n - 1 cells outside
+        # the board. Out-of-board positions count as neither.
+        n = self.game_service.disallowed_num_consecutive_chars
+        padding = n - 1
+        layers = {
+            "cells": np.ones((game_board.n_rows, game_board.n_cols), dtype=np.bool_),
+            X_CHAR: self.__to_array(game_board, game_board.x_bits),
+            O_CHAR: self.__to_array(game_board, game_board.o_bits),
+        }
+        window_counts: dict[str, list[IntArray]] = {}
+        for name, layer in layers.items():
+            padded = np.pad(layer.astype(np.int16), 2 * padding)
+            window_counts[name] = []
+            for direction in self.game_service.rules.directions:
+                counts = np.zeros(
+                    (game_board.n_rows + 2 * padding, game_board.n_cols + 2 * padding),
+                    dtype=np.int16,
+                )
+                for i in range(n):
+                    counts += self.__shifted(
+                        padded,
+                        padding + i * direction[0],
+                        padding + i * direction[1],
+                        counts.shape,
+                    )
+                window_counts[name].append(counts)
+        return window_counts
+
+    def __any_window_containing(
+        self,
+        window_starts: BoolArray,
+        direction: tuple[int, int],
+        game_board: GameBoard,
+    ) -> BoolArray:
+        # window_starts is indexed by window start position offset by the
+        # padding, for a single direction. Every cell is covered by the n
+        # windows starting 0 to n - 1 steps behind it.
+        n = self.game_service.disallowed_num_consecutive_chars
+        padding = n - 1
+        shape = (game_board.n_rows, game_board.n_cols)
+        covered = np.zeros(shape, dtype=np.bool_)
+        for i in range(n):
+            covered |= self.__shifted(
+                window_starts,
+                padding - i * direction[0],
+                padding - i * direction[1],
+                shape,
+            )
+        return covered
+
+    def __shifted(
+        self,
+        array: npt.NDArray,
+        row_offset: int,
+        col_offset: int,
+        shape: tuple[int, ...],
+    ) -> npt.NDArray:
+        return array[
+            row_offset : row_offset + shape[0], col_offset : col_offset + shape[1]
+        ]
+
+    def __to_array(self, game_board: GameBoard, bits: int) -> BoolArray:
+        num_bits = game_board.n_rows * game_board.stride
+        as_bytes = np.frombuffer(
+            bits.to_bytes((num_bits + 7) // 8, "little"), dtype=np.uint8
+        )
+        unpacked = np.unpackbits(as_bytes, bitorder="little")[:num_bits]
+        return unpacked.reshape(game_board.n_rows, game_board.stride)[
+            :, : game_board.n_cols
+        ].astype(np.bool_)
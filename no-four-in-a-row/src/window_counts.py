@@ -0,0 +1,65 @@
+from src.game_board import O_CHAR, X_CHAR, GameBoard
+from src.rule_spec import CompiledRules
+
+OTHER_CHAR = {X_CHAR: O_CHAR, O_CHAR: X_CHAR}
+
+
+class WindowCounts:
+    # The number of x and of o in every window of a board, by the window's
+    # position in CompiledRules.windows, kept up to date as moves are placed
+    # and removed. The rest of a window's run_length cells are blank. With
+    # these, whether a window is one cell short of a run is a lookup rather
+    # than a count over its cells.
+    run_length: int
+    windows: list[int]
+    cell_window_ids: dict[int, list[int]]
+    counts: dict[str, list[int]]
+
+    def __init__(
+        self, compiled_rules: CompiledRules, run_length: int, game_board: GameBoard
+    ) -> None:
+        self.run_length = run_length
+        self.windows = compiled_rules.windows
+        self.cell_window_ids = compiled_rules.cell_window_ids
+        self.counts = {
+            char: [
+                (window & game_board.get_bits(char)).bit_count()
+                for window in self.windows
+            ]
+            for char in (X_CHAR, O_CHAR)
+        }
+
+    def num_blanks(self, window_id: int) -> int:
+        return (
+            self.run_length
+            - self.counts[X_CHAR][window_id]
+            - self.counts[O_CHAR][window_id]
+        )
+
+    def is_nearly_full(self, window_id: int, char: str) -> bool:
+        # One blank and the rest char, so char cannot go in the blank.
+        return (
+            self.counts[char][window_id] == self.run_length - 1
+            and self.counts[OTHER_CHAR[char]][window_id] == 0
+        )
+
+    def place(self, cell_idx: int, char: str, filled_bits: int) -> int:
+        # Counts char at cell_idx. filled_bits are the board's filled cells
+        # including cell_idx. Returns the blanks of the windows that are now
+        # nearly full of char as a bitmask; char cannot go in any of them.
+        counts = self.counts[char]
+        other_counts = self.counts[OTHER_CHAR[char]]
+        nearly_full_count = self.run_length - 1
+        windows = self.windows
+        blocked_bits = 0
+        for window_id in self.cell_window_ids[cell_idx]:
+            count = counts[window_id] + 1
+            counts[window_id] = count
+            if count == nearly_full_count and not other_counts[window_id]:
+                blocked_bits |= windows[window_id] & ~filled_bits
+        return blocked_bits
+
+    def remove(self, cell_idx: int, char: str) -> None:
+        counts = self.counts[char]
+        for window_id in self.cell_window_ids[cell_idx]:
+            counts[window_id] -= 1
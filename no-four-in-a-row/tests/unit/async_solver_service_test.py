@@ -0,0 +1,161 @@
+# test_async_solver_service.py
+
+import asyncio
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.async_solver_service import AsyncSolverService
+from src.board_loaders import parse_rows
+from src.game_board import GameBoard, Placement
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solver_service import SolverService
+from src.solving_engines import SolvingEngine
+
+SOLVABLE_ROWS = ["xxoo", "xx  ", " oox", "  oo"]
+SLOW_ROWS = ["  ", "  "]
+
+
+class StallingEngine(SolvingEngine):
+    # Never finishes a 2x2 board, but checks for a stop like a real search,
+    # so tests can time out and cancel requests. Other boards are solved.
+    def search_placements(
+        self,
+        solver_service: SolverService,
+        game_board: GameBoard,
+        cell_idxs: list[int] | None = None,
+    ) -> tuple[SolveStatus, list[Placement]]:
+        if game_board.n_rows != 2:
+            return SolverService(solver_service.game_service).search_placements(
+                game_board
+            )
+        assert solver_service.should_stop is not None
+        while not solver_service.should_stop():
+            solver_service.metrics.num_board_states += 1
+            time.sleep(0.001)
+        return SolveStatus.CANCELLED, []
+
+
+def get_service(
+    max_queue_size: int = 100, default_timeout: float | None = None
+) -> AsyncSolverService:
+    solver_service = SolverService(GameService(), engine=StallingEngine())
+    return AsyncSolverService(
+        solver_service,
+        num_workers=2,
+        max_queue_size=max_queue_size,
+        default_timeout=default_timeout,
+    )
+
+
+def test_solve_many_boards() -> None:
+    async def run() -> list[SolveStatus]:
+        async with get_service(max_queue_size=2) as service:
+            results = await asyncio.gather(
+                *(service.solve(parse_rows(SOLVABLE_ROWS)) for _ in range(6))
+            )
+        assert all(result.get_solution_rows() is not None for result in results)
+        return [result.status for result in results]
+
+    assert asyncio.run(run()) == [SolveStatus.SOLVED] * 6
+
+
+def test_timeout_returns_partial_metrics() -> None:
+    async def run() -> None:
+        async with get_service() as service:
+            start = time.perf_counter()
+            slow_result, result = await asyncio.gather(
+                service.solve(parse_rows(SLOW_ROWS), timeout=0.2),
+                service.solve(parse_rows(SOLVABLE_ROWS)),
+            )
+            assert time.perf_counter() - start < 5
+        assert slow_result.status == SolveStatus.TIMED_OUT
+        assert slow_result.metrics.num_board_states > 0
+        assert result.status == SolveStatus.SOLVED
+
+    asyncio.run(run())
+
+
+def test_cancel_running_and_queued_requests() -> None:
+    async def run() -> None:
+        async with get_service(default_timeout=10) as service:
+            requests = [await service.submit(parse_rows(SLOW_ROWS)) for _ in range(3)]
+            await asyncio.sleep(0.2)
+            for request in requests:
+                service.cancel(request)
+            results = await asyncio.gather(*(request.future for request in requests))
+        assert [result.status for result in results] == [SolveStatus.CANCELLED] * 3
+        # The first two were running and stopped part-way through.
+        assert results[0].metrics.num_board_states > 0
+        assert results[2].metrics.num_board_states == 0
+
+    asyncio.run(run())
+
+
+def test_serve_unix_socket(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "solver.sock")
+
+    async def run() -> list[dict]:
+        async with get_service() as service:
+            server = await service.serve(socket_path)
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            for message in [
+                {"id": 1, "rows": SLOW_ROWS, "timeout": 0.1},
+                {"id": 2, "rows": SOLVABLE_ROWS},
+                {"id": 3, "rows": ["xo", "x"]},
+                {"id": 4, "rows": SOLVABLE_ROWS, "timeout": "soon"},
+                {"id": 5, "rows": SOLVABLE_ROWS, "timeout": -1},
+                {"id": 6, "rows": SOLVABLE_ROWS, "timeout": 5},
+            ]:
+                writer.write((json.dumps(message) + "\n").encode())
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(6)]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        return sorted(responses, key=lambda response: response["id"])
+
+    responses = asyncio.run(run())
+    assert responses[0]["status"] == "timed_out"
+    assert responses[0]["metrics"]["num_board_states"] > 0
+    assert responses[1]["status"] == "solved"
+    assert responses[1]["solution"] == ["xxoo", "xxxo", "ooox", "oxoo"]
+    assert "error" in responses[2]
+    assert responses[3]["error"] == "timeout must be a positive number"
+    assert responses[4]["error"] == "timeout must be a positive number"
+    assert responses[5]["status"] == "solved"
+
+
+def test_close_does_not_block_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    shutdown = ProcessPoolExecutor.shutdown
+
+    def slow_shutdown(
+        executor: ProcessPoolExecutor, wait: bool = True, **kwargs: bool
+    ) -> None:
+        time.sleep(0.2)
+        shutdown(executor, wait, **kwargs)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "shutdown", slow_shutdown)
+
+    async def run() -> int:
+        num_ticks = 0
+
+        async def tick() -> None:
+            nonlocal num_ticks
+            while True:
+                await asyncio.sleep(0.01)
+                num_ticks += 1
+
+        service = get_service()
+        await service.start()
+        await service.submit(parse_rows(SLOW_ROWS))
+        ticker = asyncio.create_task(tick())
+        await service.close()
+        ticker.cancel()
+        return num_ticks
+
+    assert asyncio.run(run()) >= 5
@@ -0,0 +1,166 @@
+# test_batch_solver_service.py
+
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.batch_solver_service import (
+    MAX_IN_FLIGHT_PER_WORKER,
+    BatchSolverService,
+    iter_boards,
+    iter_boards_or_errors,
+    read_board_stream,
+)
+from src.board_loaders import BoardFormatError
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.main import main
+from src.solver_service import SolverService
+
+SOLVABLE_ROWS = ["xxoo", "xx  ", " oox", "  oo"]
+UNSOLVABLE_ROWS = ["xxoo", "xx  ", "xxox", "  oo"]
+
+
+@pytest.fixture
+def board_dir(tmp_path: Path) -> Path:
+    for name, rows in [("a", SOLVABLE_ROWS), ("b", UNSOLVABLE_ROWS)]:
+        (tmp_path / f"{name}.csv").write_text("\n".join(",".join(row) for row in rows))
+    return tmp_path
+
+
+def test_read_board_stream() -> None:
+    stream = io.StringIO(
+        json.dumps(SOLVABLE_ROWS) + "\n\n" + json.dumps(UNSOLVABLE_ROWS)
+    )
+    boards = list(read_board_stream(stream, "input"))
+    assert [board_id for board_id, _ in boards] == ["input:1", "input:3"]
+    assert isinstance(boards[0][1], GameBoard)
+    assert boards[0][1].board == [list(row) for row in SOLVABLE_ROWS]
+
+
+def test_read_board_stream_yields_invalid_lines_as_errors() -> None:
+    stream = io.StringIO(
+        '{"rows": 1}\n["xo", "x"]\nnot json\n' + json.dumps(SOLVABLE_ROWS) + "\n"
+    )
+    boards = list(read_board_stream(stream, "input"))
+    assert [board_id for board_id, _ in boards] == [
+        "input:1",
+        "input:2",
+        "input:3",
+        "input:4",
+    ]
+    assert all(isinstance(board, BoardFormatError) for _, board in boards[:3])
+    assert isinstance(boards[3][1], GameBoard)
+
+
+def test_iter_boards_from_directory_and_glob(board_dir: Path) -> None:
+    from_directory = [board_id for board_id, _ in iter_boards([str(board_dir)])]
+    from_glob = [board_id for board_id, _ in iter_boards([str(board_dir / "a*.csv")])]
+    assert from_directory == [str(board_dir / "a.csv"), str(board_dir / "b.csv")]
+    assert from_glob == [str(board_dir / "a.csv")]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_solve_all_in_input_order(num_workers: int) -> None:
+    boards = [
+        (str(idx), GameBoard([list(row) for row in rows]))
+        for idx, rows in enumerate([SOLVABLE_ROWS, UNSOLVABLE_ROWS] * 3)
+    ]
+    batch_solver_service = BatchSolverService(
+        SolverService(game_service=GameService()), num_workers=num_workers
+    )
+    results = list(batch_solver_service.solve_all(boards, ordered=True))
+    assert [result["id"] for result in results] == [str(idx) for idx in range(6)]
+    assert [result["status"] for result in results[:2]] == ["solved", "unsolvable"]
+    assert results[0]["solution"] == ["xxoo", "xxxo", "ooox", "oxoo"]
+    assert results[1]["solution"] is None
+    assert all(result["num_board_states"] > 0 for result in results)
+
+
+def test_solve_all_in_input_order_bounds_buffered_results() -> None:
+    # The first board takes far longer than the others, whose results wait
+    # for it without being read further ahead than max_in_flight boards.
+    num_pulled = 0
+
+    def boards() -> Iterator[tuple[str, GameBoard]]:
+        nonlocal num_pulled
+        num_pulled += 1
+        yield "slow", GameBoard([[" " for _ in range(10)] for _ in range(10)])
+        for idx in range(50):
+            num_pulled += 1
+            yield str(idx), GameBoard([list(row) for row in SOLVABLE_ROWS])
+
+    batch_solver_service = BatchSolverService(
+        SolverService(game_service=GameService()), num_workers=2
+    )
+    results = batch_solver_service.solve_all(boards(), ordered=True)
+    assert next(results)["id"] == "slow"
+    assert num_pulled <= 2 * MAX_IN_FLIGHT_PER_WORKER
+    assert len(list(results)) == 50
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_solve_all_reports_unreadable_boards(tmp_path: Path, num_workers: int) -> None:
+    # A bad board in a text file, a bad CSV file and a truncated packed file
+    # each become an error result, and the boards after them are still solved.
+    (tmp_path / "a.txt").write_text(
+        "\n".join(["xo", "x"]) + "\n\n" + "\n".join(SOLVABLE_ROWS)
+    )
+    (tmp_path / "b.csv").write_text("xx,o\n")
+    (tmp_path / "c.nfb").write_bytes(b"NFB")
+    (tmp_path / "d.csv").write_text("\n".join(",".join(row) for row in SOLVABLE_ROWS))
+    batch_solver_service = BatchSolverService(
+        SolverService(game_service=GameService()), num_workers=num_workers
+    )
+    results = list(
+        batch_solver_service.solve_all(
+            iter_boards_or_errors([str(tmp_path)]), ordered=True
+        )
+    )
+    assert [result["id"] for result in results] == [
+        f"{tmp_path / 'a.txt'}:1",
+        f"{tmp_path / 'a.txt'}:4",
+        str(tmp_path / "b.csv"),
+        str(tmp_path / "c.nfb"),
+        str(tmp_path / "d.csv"),
+    ]
+    assert ["error" in result for result in results] == [
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert results[1]["status"] == results[4]["status"] == "solved"
+
+
+def test_iter_boards_raises_on_unreadable_board(tmp_path: Path) -> None:
+    (tmp_path / "a.csv").write_text("xx,o\n")
+    with pytest.raises(BoardFormatError):
+        list(iter_boards([str(tmp_path)]))
+
+
+def test_main_batch_writes_json_lines(board_dir: Path, capsys: Any) -> None:
+    main(["--batch", "--workers", "1", str(board_dir)])
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["status"] for line in lines] == ["solved", "unsolvable"]
+
+
+def test_iter_boards_from_text_and_packed_files(tmp_path: Path) -> None:
+    text_path = tmp_path / "boards.txt"
+    text_path.write_text("\n".join(SOLVABLE_ROWS) + "\n\n" + "\n".join(UNSOLVABLE_ROWS))
+    packed_path = tmp_path / "boards.nfb"
+    main(["--pack", str(packed_path), str(text_path)])
+
+    boards = list(iter_boards([str(tmp_path)]))
+    assert [board_id for board_id, _ in boards] == [
+        f"{packed_path}[0]",
+        f"{packed_path}[1]",
+        f"{text_path}:1",
+        f"{text_path}:6",
+    ]
+    assert boards[0][1].encode() == boards[2][1].encode()
+    assert boards[1][1].board == [list(row) for row in UNSOLVABLE_ROWS]
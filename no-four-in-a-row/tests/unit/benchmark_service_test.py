@@ -0,0 +1,165 @@
+# test_benchmark_service.py
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.benchmark_service import (
+    PROJECT_DIR,
+    STARTUP_MODULE,
+    BenchmarkCase,
+    BenchmarkService,
+    compare_to_baseline,
+    iter_corpus,
+    measure_startup,
+    parse_import_times,
+)
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.generator_service import GeneratorService
+from src.solver_service import SolverService
+
+BOARDS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "boards")
+
+
+@pytest.fixture
+def solver_service() -> SolverService:
+    return SolverService(GameService())
+
+
+@pytest.fixture
+def benchmark_service(solver_service: SolverService) -> BenchmarkService:
+    return BenchmarkService(solver_service, repeats=2)
+
+
+def test_corpus_is_reproducible(solver_service: SolverService) -> None:
+    generator_service = GeneratorService(solver_service)
+    first = list(iter_corpus(generator_service, ["small"]))
+    second = list(iter_corpus(generator_service, ["small"]))
+    assert [case.name for case in first] == [
+        "4x4-10",
+        "4x4-30",
+        "4x4-50",
+        "8x8-10",
+        "8x8-30",
+        "8x8-50",
+    ]
+    assert [case.game_board.encode() for case in first] == [
+        case.game_board.encode() for case in second
+    ]
+
+
+def test_corpus_includes_fixture_boards(solver_service: SolverService) -> None:
+    cases = list(
+        iter_corpus(GeneratorService(solver_service), ["fixtures"], BOARDS_DIR)
+    )
+    assert "invalid-board.csv" in [case.name for case in cases]
+    assert all(case.tier == "fixtures" for case in cases)
+
+
+def test_run_case(benchmark_service: BenchmarkService) -> None:
+    case = BenchmarkCase(
+        name="4x4",
+        tier="small",
+        game_board=GameBoard(
+            [
+                ["x", "x", "o", "o"],
+                ["x", "x", " ", " "],
+                [" ", "o", "o", "x"],
+                [" ", " ", "o", "o"],
+            ]
+        ),
+    )
+    result = benchmark_service.run_case(case)
+    assert result["status"] == "solved"
+    assert result["num_empty_cells"] == 5
+    assert result["num_board_states"] > 0
+    assert result["peak_memory"] > 0
+    assert 0 < result["min_wall_time"] <= result["median_wall_time"]
+
+
+def test_save_and_load(benchmark_service: BenchmarkService, tmp_path: Path) -> None:
+    results = [{"name": "board", "median_wall_time": 1.0}]
+    path = str(tmp_path / "results.json")
+    benchmark_service.save(results, path)
+    assert BenchmarkService.load(path) == results
+
+
+def test_compare_to_baseline() -> None:
+    baseline = [
+        {
+            "name": "board",
+            "median_wall_time": 1.0,
+            "num_board_states": 100,
+            "peak_memory": 1000,
+        }
+    ]
+    results = [
+        {
+            "name": "board",
+            "median_wall_time": 1.5,
+            "num_board_states": 110,
+            "peak_memory": 1000,
+        },
+        {
+            "name": "new-board",
+            "median_wall_time": 9.0,
+            "num_board_states": 1,
+            "peak_memory": 1,
+        },
+    ]
+    regressions = compare_to_baseline(results, baseline, threshold=0.2)
+    assert [(regression.name, regression.metric) for regression in regressions] == [
+        ("board", "median_wall_time")
+    ]
+    assert regressions[0].ratio == 1.5
+
+
+def test_compare_to_baseline_ignores_timer_noise() -> None:
+    baseline = [
+        {
+            "name": "board",
+            "median_wall_time": 0.0001,
+            "num_board_states": 10,
+            "peak_memory": 1000,
+        }
+    ]
+    results = [{**baseline[0], "median_wall_time": 0.0002}]
+    assert compare_to_baseline(results, baseline) == []
+
+
+def test_parse_import_times() -> None:
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   src.game_board\n"
+        "import time:       300 |        420 | src.main\n"
+    )
+    assert parse_import_times(output) == {
+        "src.game_board": (120, 120),
+        "src.main": (300, 420),
+    }
+
+
+def test_startup_defers_optional_modules() -> None:
+    # Guards the command line's startup: pydantic, prettytable, process pools
+    # and the rest are only imported by the options that use them. Process
+    # pools need multiprocessing, which must not be imported any sooner.
+    result = measure_startup(repeats=1)
+    assert result["deferred_modules"] == []
+    assert result["median_wall_time"] > 0
+    assert len(result["slowest_modules"]) > 0
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {STARTUP_MODULE}; print('multiprocessing' in sys.modules)",
+        ],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,120 @@
+# test_board_loaders.py
+
+from pathlib import Path
+
+import pytest
+from src.board_loaders import (
+    HEADER_SIZE,
+    BoardFormatError,
+    PackedBoardReader,
+    PackedBoardWriter,
+    format_rows,
+    format_text_board,
+    iter_text_boards,
+    load_board_file,
+    load_csv,
+    pack_board,
+    parse_rows,
+    unpack_board,
+    write_packed_boards,
+)
+from src.game_board import GameBoard
+
+ROWS = ["ooo xx x", "x  o o  ", "xx oo xo"]
+
+
+@pytest.fixture
+def game_board() -> GameBoard:
+    return GameBoard([list(row) for row in ROWS])
+
+
+def test_parse_rows(game_board: GameBoard) -> None:
+    parsed_board = parse_rows(ROWS)
+    assert parsed_board.encode() == game_board.encode()
+    assert format_rows(parsed_board) == ROWS
+    assert format_text_board(parsed_board) == "\n".join(ROWS)
+
+
+@pytest.mark.parametrize("rows", [[], [""], ["xo", "xoo"], ["xo", "x-"], ["XO", "xo"]])
+def test_parse_rows_rejects_invalid_boards(rows: list[str]) -> None:
+    with pytest.raises(BoardFormatError):
+        parse_rows(rows)
+
+
+def test_load_csv(tmp_path: Path, game_board: GameBoard) -> None:
+    board_path = tmp_path / "board.csv"
+    board_path.write_text("\n".join(",".join(row) for row in ROWS))
+    assert load_csv(str(board_path)).encode() == game_board.encode()
+
+    board_path.write_text("x,o\nx,oo\n")
+    with pytest.raises(BoardFormatError):
+        load_csv(str(board_path))
+
+
+def test_iter_text_boards(tmp_path: Path) -> None:
+    board_path = tmp_path / "boards.txt"
+    board_path.write_text("\n".join(ROWS) + "\n\n\n" + "xo\n  \n")
+    boards = list(iter_text_boards(str(board_path)))
+    assert [board_id for board_id, _ in boards] == [
+        f"{board_path}:1",
+        f"{board_path}:6",
+    ]
+    assert boards[1][1].board == [["x", "o"], [" ", " "]]
+
+
+def test_pack_board_round_trip(game_board: GameBoard) -> None:
+    record = pack_board(game_board)
+    # Two bits per cell, rounded up to whole bytes per plane.
+    assert len(record) == 2 * 3
+    assert unpack_board(record, 3, 8).encode() == game_board.encode()
+
+
+def test_unpack_board_rejects_overlapping_cells() -> None:
+    with pytest.raises(BoardFormatError):
+        unpack_board(b"\x01\x01", 2, 2)
+    with pytest.raises(BoardFormatError):
+        unpack_board(b"\x10\x00", 2, 2)
+
+
+def test_packed_board_file_random_access(tmp_path: Path) -> None:
+    board_path = str(tmp_path / "boards.nfb")
+    boards = [
+        parse_rows([("x" * (idx % 5)).ljust(5), ("o" * (idx % 3)).rjust(5)])
+        for idx in range(20)
+    ]
+    assert write_packed_boards(board_path, boards) == 20
+
+    with PackedBoardReader(board_path) as reader:
+        assert len(reader) == 20
+        assert (reader.n_rows, reader.n_cols) == (2, 5)
+        assert reader[7].encode() == boards[7].encode()
+        assert reader[-1].encode() == boards[-1].encode()
+        assert [board.encode() for board in reader] == [
+            board.encode() for board in boards
+        ]
+        with pytest.raises(IndexError):
+            reader[20]
+
+    loaded = list(load_board_file(board_path))
+    assert loaded[3][0] == f"{board_path}[3]"
+
+
+def test_packed_board_writer_rejects_other_shapes(
+    tmp_path: Path, game_board: GameBoard
+) -> None:
+    with PackedBoardWriter(str(tmp_path / "boards.nfb"), 2, 2) as writer:
+        with pytest.raises(BoardFormatError):
+            writer.write(game_board)
+
+
+def test_packed_board_reader_rejects_invalid_files(tmp_path: Path) -> None:
+    board_path = tmp_path / "boards.nfb"
+    board_path.write_bytes(b"CSV!" + bytes(HEADER_SIZE))
+    with pytest.raises(BoardFormatError):
+        PackedBoardReader(str(board_path))
+
+    write_packed_boards(str(board_path), [parse_rows(["xo", "ox"])])
+    with open(board_path, "ab") as board_file:
+        board_file.write(b"\x00")
+    with pytest.raises(BoardFormatError):
+        PackedBoardReader(str(board_path))
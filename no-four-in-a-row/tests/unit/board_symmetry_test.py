@@ -0,0 +1,45 @@
+# test_board_symmetry.py
+
+import pytest
+from src.board_loaders import parse_rows
+from src.board_symmetry import (
+    SYMMETRIES,
+    BoardSymmetry,
+    canonicalize,
+    from_canonical,
+    get_canonical_key,
+)
+
+ROWS = ["xo ", "  x", "o  ", "x o"]
+
+
+def test_symmetries_are_distinct() -> None:
+    assert len(SYMMETRIES) == 16
+    assert len({tuple(symmetry.apply(ROWS)) for symmetry in SYMMETRIES}) == 16
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_invert_undoes_apply(symmetry: BoardSymmetry) -> None:
+    assert symmetry.invert(symmetry.apply(ROWS)) == ROWS
+
+
+def test_rotation_and_swap() -> None:
+    assert BoardSymmetry(1).apply(["xo", "  "]) == [" x", " o"]
+    assert BoardSymmetry(0, swaps_chars=True).apply(["xo", "  "]) == ["ox", "  "]
+
+
+def test_symmetric_boards_share_a_canonical_key() -> None:
+    keys = {
+        get_canonical_key(parse_rows(symmetry.apply(ROWS)))[0]
+        for symmetry in SYMMETRIES
+    }
+    assert len(keys) == 1
+    assert get_canonical_key(parse_rows(["xo ", "  x", "o  ", "xo "]))[0] not in keys
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_from_canonical_restores_orientation(symmetry: BoardSymmetry) -> None:
+    game_board = parse_rows(symmetry.apply(ROWS))
+    canonical_rows, canonical_symmetry = canonicalize(game_board)
+    restored_board = from_canonical(canonical_rows, canonical_symmetry)
+    assert restored_board.encode() == game_board.encode()
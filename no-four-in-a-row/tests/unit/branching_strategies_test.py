@@ -0,0 +1,106 @@
+# test_branching_strategies.py
+
+import pytest
+from src.branching_strategies import (
+    AllMovesBranching,
+    BranchingStrategy,
+    FirstCellBranching,
+    MostConstrainedCellBranching,
+    RandomCellBranching,
+)
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.search_state import SearchState
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def game_service() -> GameService:
+    return GameService()
+
+
+@pytest.fixture
+def search_state(game_service: GameService) -> SearchState:
+    board = GameBoard(
+        [
+            [" ", " ", " ", " ", " "],
+            [" ", "x", "x", " ", " "],
+            [" ", " ", " ", " ", " "],
+            [" ", " ", " ", " ", " "],
+            [" ", " ", " ", " ", " "],
+        ]
+    )
+    return SearchState(game_service, board)
+
+
+def test_all_moves_branching(search_state: SearchState) -> None:
+    moves = AllMovesBranching().select_moves(search_state)
+    assert len(moves) == 2 * len(search_state.valid_move_map)
+
+
+def test_first_cell_branching(search_state: SearchState) -> None:
+    moves = FirstCellBranching().select_moves(search_state)
+    assert len(moves) == 2
+    assert moves[0][0] == moves[1][0]
+
+
+def test_most_constrained_cell_branching(
+    game_service: GameService, search_state: SearchState
+) -> None:
+    moves = MostConstrainedCellBranching(game_service).select_moves(search_state)
+    assert len(moves) == 2
+    assert moves[0][0] == moves[1][0]
+    assert search_state.game_board.cell_location(moves[0][0]) in {
+        (1, 0),
+        (1, 3),
+        (2, 1),
+        (2, 2),
+    }
+
+
+def test_least_constraining_value_first(game_service: GameService) -> None:
+    board = GameBoard(
+        [
+            [" ", "x", "x", " "],
+            [" ", " ", " ", " "],
+            [" ", " ", " ", " "],
+            [" ", " ", " ", " "],
+        ]
+    )
+    search_state = SearchState(game_service, board)
+    strategy = MostConstrainedCellBranching(game_service, least_constraining_value=True)
+    moves = strategy.select_moves(search_state)
+    assert [char for _, char in moves] == ["o", "x"]
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        AllMovesBranching(),
+        FirstCellBranching(),
+        MostConstrainedCellBranching(GameService()),
+        MostConstrainedCellBranching(GameService(), least_constraining_value=True),
+        RandomCellBranching(seed=0),
+    ],
+)
+def test_solve_with_strategy(strategy: BranchingStrategy) -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            [" ", "o", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+    solver_service = SolverService(
+        game_service=GameService(), branching_strategy=strategy
+    )
+    assert solver_service.solve(board).status == SolveStatus.SOLVED
+
+
+def test_random_cell_branching_is_seeded(search_state: SearchState) -> None:
+    first = RandomCellBranching(seed=1).select_moves(search_state)
+    assert first == RandomCellBranching(seed=1).select_moves(search_state)
+    assert len(first) == 2
+    assert first[0][0] == first[1][0]
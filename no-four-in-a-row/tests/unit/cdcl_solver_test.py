@@ -0,0 +1,88 @@
+# test_cdcl_solver.py
+
+import itertools
+import random
+
+from src.cdcl_solver import CdclSolver, luby
+from src.results import SolveStatus
+
+
+def is_satisfiable(num_vars: int, clauses: list[list[int]]) -> bool:
+    return any(
+        all(
+            any((lit > 0) == values[abs(lit) - 1] for lit in clause)
+            for clause in clauses
+        )
+        for values in itertools.product([False, True], repeat=num_vars)
+    )
+
+
+def test_luby() -> None:
+    assert [luby(i) for i in range(15)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_solve_satisfiable() -> None:
+    cdcl_solver = CdclSolver(3)
+    for clause in [[1, 2], [-1, 3], [-3, -2], [-2, 1]]:
+        cdcl_solver.add_clause(clause)
+    assert cdcl_solver.solve() == SolveStatus.SOLVED
+    assert cdcl_solver.get_model()[1:] == [True, False, True]
+
+
+def test_solve_unsatisfiable() -> None:
+    cdcl_solver = CdclSolver(2)
+    for clause in [[1, 2], [1, -2], [-1, 2], [-1, -2]]:
+        cdcl_solver.add_clause(clause)
+    assert cdcl_solver.solve() == SolveStatus.UNSOLVABLE
+
+
+def test_empty_clause_is_unsatisfiable() -> None:
+    cdcl_solver = CdclSolver(1)
+    cdcl_solver.add_clause([])
+    assert cdcl_solver.solve() == SolveStatus.UNSOLVABLE
+
+
+def test_solve_matches_brute_force_on_random_3_sat() -> None:
+    rng = random.Random(0)
+    for _ in range(200):
+        num_vars = rng.randint(3, 12)
+        clauses = [
+            [rng.choice([1, -1]) * rng.randint(1, num_vars) for _ in range(3)]
+            for _ in range(int(num_vars * rng.uniform(3, 5.5)))
+        ]
+        cdcl_solver = CdclSolver(num_vars)
+        for clause in clauses:
+            cdcl_solver.add_clause(clause)
+        status = cdcl_solver.solve()
+        assert (status == SolveStatus.SOLVED) == is_satisfiable(num_vars, clauses)
+        if status == SolveStatus.SOLVED:
+            model = cdcl_solver.get_model()
+            assert all(
+                any((lit > 0) == model[abs(lit)] for lit in clause)
+                for clause in clauses
+            )
+
+
+def test_solve_learns_and_restarts() -> None:
+    rng = random.Random(1)
+    num_vars = 120
+    cdcl_solver = CdclSolver(num_vars)
+    for _ in range(int(4.3 * num_vars)):
+        cdcl_solver.add_clause(
+            [rng.choice([1, -1]) * rng.randint(1, num_vars) for _ in range(3)]
+        )
+    cdcl_solver.solve()
+    assert cdcl_solver.num_learned_clauses > 0
+    assert cdcl_solver.num_restarts > 0
+
+
+def test_solve_stops_at_assignment_limit() -> None:
+    cdcl_solver = CdclSolver(10)
+    cdcl_solver.add_clause([1, 2])
+    assert cdcl_solver.solve(max_assignments=1) == SolveStatus.NODE_LIMIT_REACHED
+
+
+def test_solve_stops_when_asked() -> None:
+    cdcl_solver = CdclSolver(10)
+    status = cdcl_solver.solve(should_stop=lambda: True, stop_check_interval=1)
+    assert status == SolveStatus.CANCELLED
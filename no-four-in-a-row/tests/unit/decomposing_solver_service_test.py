@@ -0,0 +1,74 @@
+# test_decomposing_solver_service.py
+
+import pytest
+from src.board_loaders import parse_rows
+from src.decomposing_solver_service import DecomposingSolverService
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solver_service import SolverService
+from src.solving_engines import SatEngine
+
+TWO_REGION_ROWS = ["  xoxxo  ", "  oxoox  ", "  xoxxo  ", "  oxoox  "]
+
+
+@pytest.fixture
+def two_region_board() -> GameBoard:
+    return parse_rows(TWO_REGION_ROWS)
+
+
+@pytest.fixture
+def decomposing_solver_service() -> DecomposingSolverService:
+    return DecomposingSolverService(SolverService(game_service=GameService()))
+
+
+def test_find_components_splits_distant_regions(
+    decomposing_solver_service: DecomposingSolverService, two_region_board: GameBoard
+) -> None:
+    components = decomposing_solver_service.find_components(two_region_board)
+    assert [
+        sorted({two_region_board.cell_location(idx)[1] for idx in cell_idxs})
+        for cell_idxs in components
+    ] == [[0, 1], [7, 8]]
+
+
+def test_find_components_ignores_windows_with_both_chars(
+    decomposing_solver_service: DecomposingSolverService,
+) -> None:
+    components = decomposing_solver_service.find_components(parse_rows(["  xo   "]))
+    assert components == [[0], [1], [4, 5, 6]]
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_solve_combines_components(
+    two_region_board: GameBoard, num_workers: int
+) -> None:
+    solver_service = SolverService(game_service=GameService())
+    result = DecomposingSolverService(solver_service, num_workers).solve(
+        two_region_board
+    )
+    assert result.status == SolveStatus.SOLVED
+    assert result.solution is not None
+    assert result.solution.empty_cell_idxs() == []
+    assert len(result.placements) == 16
+    assert solver_service.search_placements(result.solution)[0] == SolveStatus.SOLVED
+    assert result.metrics.num_board_states >= 16
+
+
+def test_solve_with_sat_engine(two_region_board: GameBoard) -> None:
+    game_service = GameService()
+    solver_service = SolverService(game_service, engine=SatEngine(game_service))
+    result = DecomposingSolverService(solver_service).solve(two_region_board)
+    assert result.status == SolveStatus.SOLVED
+    assert len(result.placements) == 16
+
+
+def test_unsolvable_component(
+    decomposing_solver_service: DecomposingSolverService,
+) -> None:
+    # The top right cell can be neither x nor o.
+    board = parse_rows(["  oxoxxx ", "  xoxoxoo", "  oxoxoxo", "  xoxoxoo"])
+    assert len(decomposing_solver_service.find_components(board)) > 1
+    status, moves_made = decomposing_solver_service.search_placements(board)
+    assert status == SolveStatus.UNSOLVABLE
+    assert moves_made == []
@@ -39,6 +39,19 @@ def test_copy(standard_board: GameBoard) -> None:
     assert new_board is not standard_board
 
 
+def test_copy_is_independent(standard_board: GameBoard) -> None:
+    new_board = standard_board.copy()
+    new_board.update_cell(0, 0, " ")
+    assert new_board.get_cell(0, 0) == " "
+    assert standard_board.get_cell(0, 0) == "x"
+
+
+def test_player_bits_do_not_overlap(standard_board: GameBoard) -> None:
+    assert standard_board.x_bits & standard_board.o_bits == 0
+    assert standard_board.x_bits & (1 << standard_board.bit_index(1, 1))
+    assert standard_board.o_bits & (1 << standard_board.bit_index(0, 1))
+
+
 # Test for creating a GameBoard from a CSV file
 def test_from_csv(tmp_path: Path) -> None:
     d = tmp_path / "sub"
@@ -83,3 +96,8 @@ def test_display_board(standard_board: GameBoard, capsys: Any) -> None:
     standard_board.display_board()
     captured = capsys.readouterr()
     assert "x" in captured.out
+
+
+def test_encode_round_trip(standard_board: GameBoard) -> None:
+    decoded_board = GameBoard.from_encoded(standard_board.encode())
+    assert decoded_board.board == standard_board.board
@@ -161,3 +161,29 @@ def test_backward_diagonal_invalid_move(game_service: GameService) -> None:
     )
     move = Move(cell=BoardLocation(row_idx=0, col_idx=0), char="o")
     assert not game_service.is_valid_move(board, move)
+
+
+def test_horizontal_run_does_not_wrap_rows(game_service: GameService) -> None:
+    board = GameBoard(
+        [
+            [" ", " ", "o", "o"],
+            ["o", " ", " ", " "],
+            [" ", " ", " ", " "],
+            [" ", " ", " ", " "],
+        ]
+    )
+    move = Move(cell=BoardLocation(row_idx=0, col_idx=1), char="o")
+    assert game_service.is_valid_move(board, move)
+
+
+def test_diagonal_run_does_not_wrap_rows(game_service: GameService) -> None:
+    board = GameBoard(
+        [
+            [" ", " ", "o", " "],
+            [" ", " ", " ", "o"],
+            ["o", " ", " ", " "],
+            [" ", " ", " ", " "],
+        ]
+    )
+    move = Move(cell=BoardLocation(row_idx=3, col_idx=1), char="o")
+    assert game_service.is_valid_move(board, move)
@@ -0,0 +1,100 @@
+# test_generator_service.py
+
+import io
+import json
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.generator_service import GeneratorService
+from src.models import BoardShape
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def game_service() -> GameService:
+    return GameService()
+
+
+@pytest.fixture
+def generator_service(game_service: GameService) -> GeneratorService:
+    return GeneratorService(SolverService(game_service))
+
+
+def test_generate_unique_puzzle(
+    game_service: GameService, generator_service: GeneratorService
+) -> None:
+    generated_puzzle = generator_service.generate(BoardShape(rows=5, cols=6), seed=1)
+    puzzle, solution = generated_puzzle.puzzle, generated_puzzle.solution
+    assert (puzzle.n_rows, puzzle.n_cols) == (5, 6)
+    assert solution.empty_cell_idxs() == []
+    assert puzzle.empty_cell_idxs() != []
+    solution_count = SolverService(game_service).count_solutions(puzzle)
+    assert solution_count.is_unique
+    # Every clue is needed.
+    for cell_idx in puzzle.cell_idxs():
+        if cell_idx in puzzle.empty_cell_idxs():
+            assert solution.get_cell(*solution.cell_location(cell_idx)) != " "
+            continue
+        fewer_clues = puzzle.copy()
+        fewer_clues.update_cell_idx(cell_idx, " ")
+        assert not SolverService(game_service).count_solutions(fewer_clues).is_unique
+
+
+def test_solution_is_valid(game_service: GameService) -> None:
+    generator_service = GeneratorService(SolverService(game_service))
+    solution = generator_service.generate(BoardShape(rows=6, cols=6)).solution
+    empty_board = GameBoard([[" "] * 6 for _ in range(6)])
+    for cell_idx in solution.cell_idxs():
+        char = solution.get_cell(*solution.cell_location(cell_idx))
+        assert game_service.is_valid_placement(empty_board, cell_idx, char)
+        empty_board.update_cell_idx(cell_idx, char)
+
+
+def test_generate_is_reproducible(generator_service: GeneratorService) -> None:
+    board_shape = BoardShape(rows=5, cols=5)
+    first = generator_service.generate(board_shape, seed=3).to_json_dict()
+    second = generator_service.generate(board_shape, seed=3).to_json_dict()
+    other = generator_service.generate(board_shape, seed=4).to_json_dict()
+    assert first == second
+    assert first != other
+
+
+def test_generate_reaches_target_difficulty(game_service: GameService) -> None:
+    generator_service = GeneratorService(
+        SolverService(game_service),
+        target_guesses=2,
+        difficulty_solver_service=SolverService(game_service, use_propagation=False),
+    )
+    generated_puzzle = generator_service.generate(BoardShape(rows=6, cols=6))
+    assert generated_puzzle.num_guesses >= 2
+
+
+def test_generate_many_matches_across_workers(
+    generator_service: GeneratorService,
+) -> None:
+    board_shape = BoardShape(rows=4, cols=5)
+    serial = [
+        generated_puzzle.to_json_dict()
+        for generated_puzzle in generator_service.generate_many(
+            board_shape, 4, seed=10, num_workers=1
+        )
+    ]
+    parallel = [
+        generated_puzzle.to_json_dict()
+        for generated_puzzle in generator_service.generate_many(
+            board_shape, 4, seed=10, num_workers=2
+        )
+    ]
+    assert serial == parallel
+    assert [result["seed"] for result in serial] == [10, 11, 12, 13]
+
+
+def test_write_json_lines(generator_service: GeneratorService) -> None:
+    output = io.StringIO()
+    generator_service.write_json_lines(
+        BoardShape(rows=4, cols=4), 2, output, num_workers=1
+    )
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [result["seed"] for result in results] == [0, 1]
+    assert all(len(result["puzzle"]) == 4 for result in results)
@@ -0,0 +1,51 @@
+# test_parallel_solver_service.py
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.parallel_solver_service import ParallelSolverService
+from src.results import SolveStatus
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def parallel_solver_service() -> ParallelSolverService:
+    solver_service = SolverService(game_service=GameService())
+    return ParallelSolverService(solver_service, num_workers=2, split_depth=1)
+
+
+def test_parallel_search_solves_board(
+    parallel_solver_service: ParallelSolverService,
+) -> None:
+    board = GameBoard([[" " for _ in range(6)] for _ in range(6)])
+    status, moves_made = parallel_solver_service.search(board)
+    assert status == SolveStatus.SOLVED
+
+    game_service = GameService()
+    for move in moves_made:
+        board = game_service.make_move(board, move)
+    assert all(char != " " for row in board.board for char in row)
+
+
+def test_parallel_search_merges_counters(
+    parallel_solver_service: ParallelSolverService,
+) -> None:
+    board = GameBoard([[" " for _ in range(6)] for _ in range(6)])
+    parallel_solver_service.search(board)
+    assert parallel_solver_service.solver_service.metrics.num_board_states >= 36
+
+
+def test_parallel_search_invalid_board(
+    parallel_solver_service: ParallelSolverService,
+) -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            ["x", "x", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+    status, moves_made = parallel_solver_service.search(board)
+    assert status == SolveStatus.UNSOLVABLE
+    assert moves_made == []
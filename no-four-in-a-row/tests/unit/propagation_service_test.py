@@ -0,0 +1,54 @@
+# test_propagation_service.py
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.propagation_service import PropagationService
+from src.search_state import SearchState
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def bigger_board() -> GameBoard:
+    return GameBoard(
+        [
+            ["o", "o", "o", " ", "x", " ", "x", "x"],
+            ["o", "x", "x", " ", " ", " ", "x", "o"],
+            [" ", " ", " ", "x", "x", " ", "x", "o"],
+            [" ", "x", " ", " ", " ", " ", "o", " "],
+            [" ", "x", "x", " ", "o", " ", "o", " "],
+            ["o", "o", "x", " ", "x", " ", "x", "o"],
+            [" ", " ", "o", " ", " ", " ", " ", "x"],
+            [" ", " ", "x", " ", "x", " ", " ", "o"],
+        ]
+    )
+
+
+def test_probe_deduces_valid_move(bigger_board: GameBoard) -> None:
+    game_service = GameService()
+    search_state = SearchState(game_service, bigger_board)
+    is_consistent, deduced_move = PropagationService(game_service).probe(search_state)
+    assert is_consistent
+    assert deduced_move is not None
+    assert game_service.is_valid_placement(search_state.game_board, *deduced_move)
+
+
+def test_probe_without_deduction() -> None:
+    board = GameBoard([[" " for _ in range(5)] for _ in range(5)])
+    game_service = GameService()
+    search_state = SearchState(game_service, board)
+    assert PropagationService(game_service).probe(search_state) == (True, None)
+
+
+def test_propagation_avoids_guesses(bigger_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    solver_service.solve(bigger_board)
+    assert solver_service.metrics.num_guesses == 0
+    assert solver_service.metrics.num_guesses_avoided > 0
+
+
+def test_solve_without_propagation_guesses(bigger_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService(), use_propagation=False)
+    solver_service.solve(bigger_board)
+    assert solver_service.metrics.num_guesses > 0
+    assert solver_service.metrics.num_guesses_avoided == 0
@@ -0,0 +1,91 @@
+# test_reporters.py
+
+import io
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.reporters import (
+    FinalBoardReporter,
+    PlainTextRenderer,
+    QuietReporter,
+    ReplayReporter,
+    TableRenderer,
+)
+from src.results import SolveResult
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def board() -> GameBoard:
+    return GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            [" ", "o", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+
+
+@pytest.fixture
+def result(board: GameBoard) -> SolveResult:
+    return SolverService(GameService()).solve(board)
+
+
+def test_plain_text_renderer(board: GameBoard) -> None:
+    rendered = PlainTextRenderer().render(board, board.bit_index(0, 1))
+    assert rendered.splitlines() == [
+        "x X o o",
+        "x x . .",
+        ". o o x",
+        ". . o o",
+    ]
+
+
+def test_table_renderer(board: GameBoard) -> None:
+    rendered = TableRenderer().render(board)
+    assert rendered.count("\n") > board.n_rows
+    assert "\033[91mx\033[0m" in rendered
+
+
+def test_quiet_reporter(
+    result: SolveResult, capsys: pytest.CaptureFixture[str]
+) -> None:
+    QuietReporter().report(result)
+    assert capsys.readouterr().out == ""
+
+
+def test_final_board_reporter(result: SolveResult) -> None:
+    output = io.StringIO()
+    FinalBoardReporter(PlainTextRenderer(), output).report(result)
+    lines = output.getvalue().splitlines()
+    assert result.solution is not None
+    assert lines[:4] == PlainTextRenderer().render(result.solution).splitlines()
+    assert lines[4] == "Game Complete. Solved"
+
+
+def test_replay_reporter(result: SolveResult) -> None:
+    output = io.StringIO()
+    ReplayReporter(PlainTextRenderer(), output).report(result)
+    lines = output.getvalue().splitlines()
+    # The original board and one board per move, four rows each.
+    num_boards = 1 + len(result.placements)
+    assert lines[4 * num_boards] == "Game Complete. Solved"
+    assert "." not in "".join(lines[4 * (num_boards - 1) : 4 * num_boards])
+
+
+def test_reporters_describe_unsolvable_board() -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            ["x", "x", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+    result = SolverService(GameService()).solve(board)
+    assert result.solution is None
+    output = io.StringIO()
+    ReplayReporter(PlainTextRenderer(), output).report(result)
+    assert output.getvalue().splitlines()[-1] == "Invalid Board. Cannot be solved."
@@ -0,0 +1,98 @@
+# test_rule_spec.py
+
+import pytest
+from src.board_loaders import parse_rows
+from src.board_symmetry import SYMMETRIES, get_symmetries
+from src.decomposing_solver_service import DecomposingSolverService
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.rule_spec import HORIZONTAL_MOVE, ORTHOGONAL_DIRECTIONS, RuleSpec
+from src.solver_service import SolverService
+from src.solving_engines import SatEngine
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"symbols": ("x", "y")},
+        {"run_length": 1},
+        {"directions": ()},
+        {"directions": ((2, 0),)},
+        {"directions": (HORIZONTAL_MOVE, HORIZONTAL_MOVE)},
+    ],
+)
+def test_invalid_rule_spec(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        RuleSpec(**kwargs)
+
+
+def test_compile_builds_tables_for_the_shape() -> None:
+    compiled_rules = RuleSpec(
+        run_length=3, directions=ORTHOGONAL_DIRECTIONS, balanced_counts=True
+    ).compile(4, 3)
+    # Two vertical windows per column and one horizontal window per row.
+    num_windows = sum(len(windows) for windows in compiled_rules.cell_windows.values())
+    assert num_windows == 3 * (2 * 3) + 3 * 4
+    assert compiled_rules.shifts == (4, 1)
+    assert [max_count for _, max_count in compiled_rules.cell_lines[0]] == [1, 2]
+
+
+def test_directions_limit_runs() -> None:
+    board = parse_rows(["xo ", "ox ", "   "])
+    diagonal_move = (board.bit_index(2, 2), "x")
+    assert not GameService(3).is_valid_placement(board, *diagonal_move)
+    game_service = GameService(
+        rules=RuleSpec(run_length=3, directions=ORTHOGONAL_DIRECTIONS)
+    )
+    assert game_service.is_valid_placement(board, *diagonal_move)
+
+
+def test_balanced_counts_limit_rows_and_columns() -> None:
+    game_service = GameService(rules=RuleSpec(balanced_counts=True))
+    board = parse_rows(["x x ", "    ", "x   ", "    "])
+    assert not game_service.is_valid_placement(board, board.bit_index(0, 1), "x")
+    assert not game_service.is_valid_placement(board, board.bit_index(1, 0), "x")
+    assert game_service.is_valid_placement(board, board.bit_index(1, 1), "x")
+
+
+def test_solve_balanced_board() -> None:
+    game_service = GameService(
+        rules=RuleSpec(
+            run_length=3, directions=ORTHOGONAL_DIRECTIONS, balanced_counts=True
+        )
+    )
+    result = SolverService(game_service).solve(parse_rows([" " * 6] * 6))
+    assert result.status == SolveStatus.SOLVED
+    rows = result.get_solution_rows()
+    assert rows is not None
+    for line in rows + ["".join(col) for col in zip(*rows)]:
+        assert line.count("x") == line.count("o") == 3
+        assert "xxx" not in line and "ooo" not in line
+
+
+def test_balanced_counts_join_rows_into_one_component() -> None:
+    rows = ["  xoxxo  ", "  oxoox  ", "  xoxxo  ", "  oxoox  "]
+    solver_service = SolverService(GameService(rules=RuleSpec(balanced_counts=True)))
+    components = DecomposingSolverService(solver_service).find_components(
+        parse_rows(rows)
+    )
+    assert len(components) == 1
+
+
+def test_sat_engine_rejects_balanced_counts() -> None:
+    with pytest.raises(ValueError):
+        SatEngine(GameService(rules=RuleSpec(balanced_counts=True)))
+
+
+def test_symmetries_follow_directions() -> None:
+    assert get_symmetries(RuleSpec().directions) == SYMMETRIES
+    # Rotations swap rows and columns, and both are counted.
+    assert get_symmetries(ORTHOGONAL_DIRECTIONS) == SYMMETRIES
+    # With only rows counted, the board cannot be rotated by 90 degrees.
+    horizontal_symmetries = get_symmetries((HORIZONTAL_MOVE,))
+    assert {symmetry.transform_idx for symmetry in horizontal_symmetries} == {
+        0,
+        2,
+        4,
+        5,
+    }
@@ -0,0 +1,194 @@
+# test_search_checkpoint.py
+
+import os
+from pathlib import Path
+
+import pytest
+from src.board_loaders import parse_rows
+from src.game_board import GameBoard, Placement
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.rule_spec import RuleSpec
+from src.main import main
+from src.search_checkpoint import (
+    SearchCheckpoint,
+    SearchCheckpointer,
+    load_checkpoint,
+)
+from src.solve_hooks import SolveHooks
+from src.solver_service import SolverService
+
+
+class StopAfterGuessesHooks(SolveHooks):
+    # Asks for a checkpoint and a stop after num_guesses guesses, as SIGTERM
+    # does from the command line.
+    checkpointer: SearchCheckpointer
+    num_guesses: int
+
+    def __init__(self, checkpointer: SearchCheckpointer, num_guesses: int) -> None:
+        self.checkpointer = checkpointer
+        self.num_guesses = num_guesses
+
+    def on_guess(self, placement: Placement, depth: int) -> None:
+        self.num_guesses -= 1
+        if self.num_guesses == 0:
+            self.checkpointer.request(stop=True)
+
+
+class CountingCheckpointer(SearchCheckpointer):
+    num_saves: int = 0
+
+    def save(self, checkpoint: SearchCheckpoint) -> None:
+        self.num_saves += 1
+        super().save(checkpoint)
+
+
+# The search for this board backtracks and fills the transposition table.
+BACKTRACKING_ROWS = [
+    "        ",
+    "o  o    ",
+    "  o    o",
+    "       x",
+    "        ",
+    "    o  o",
+    "        ",
+    "o x     ",
+]
+
+
+@pytest.fixture
+def board() -> GameBoard:
+    return parse_rows(["  o     ", "        ", "   x    ", "        "] * 2)
+
+
+def test_checkpoint_and_resume(board: GameBoard, tmp_path: Path) -> None:
+    game_service = GameService()
+    checkpoint_path = str(tmp_path / "search.json")
+    checkpointer = SearchCheckpointer(checkpoint_path, interval=None)
+    solver_service = SolverService(
+        game_service,
+        use_propagation=False,
+        checkpointer=checkpointer,
+        hooks=[StopAfterGuessesHooks(checkpointer, 5)],
+    )
+    status, _ = solver_service.search_placements(board)
+    assert status == SolveStatus.CANCELLED
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    assert checkpoint.get_game_board().board == board.board
+    assert len(checkpoint.choice_points) > 0
+    assert checkpoint.metrics.num_guesses == 5
+
+    resumed_solver_service = SolverService(
+        game_service,
+        use_propagation=False,
+        checkpointer=SearchCheckpointer(checkpoint_path, interval=None),
+    )
+    result = resumed_solver_service.resume(checkpoint)
+    assert result.status == SolveStatus.SOLVED
+    assert result.solution is not None
+    assert not result.solution.empty_cell_idxs()
+    assert resumed_solver_service.metrics.num_guesses > 5
+    # The finished search leaves no checkpoint behind.
+    assert not os.path.exists(checkpoint_path)
+
+
+@pytest.mark.parametrize("num_guesses", [1, 8, 12, 20])
+def test_resumed_search_matches_uninterrupted_search(
+    num_guesses: int, tmp_path: Path
+) -> None:
+    # A resumed search only matches if it restores the transposition table,
+    # the hashes of the guesses and the order in which cells are picked.
+    board = parse_rows(BACKTRACKING_ROWS)
+    game_service = GameService()
+    solver_service = SolverService(game_service, use_propagation=False)
+    status, moves_made = solver_service.search_placements(board)
+    assert status == SolveStatus.SOLVED
+
+    checkpoint_path = str(tmp_path / "search.json")
+    checkpointer = SearchCheckpointer(checkpoint_path, interval=None)
+    SolverService(
+        game_service,
+        use_propagation=False,
+        checkpointer=checkpointer,
+        hooks=[StopAfterGuessesHooks(checkpointer, num_guesses)],
+    ).search_placements(board)
+    resumed_solver_service = SolverService(game_service, use_propagation=False)
+    resumed_status, resumed_moves_made = resumed_solver_service.resume_placements(
+        load_checkpoint(checkpoint_path)
+    )
+
+    assert resumed_status == status
+    assert resumed_moves_made == moves_made
+    assert solver_service.transposition_table is not None
+    assert resumed_solver_service.transposition_table is not None
+    assert len(solver_service.transposition_table) > 0
+    assert list(resumed_solver_service.transposition_table.entries) == list(
+        solver_service.transposition_table.entries
+    )
+    assert (
+        resumed_solver_service.metrics.num_board_states
+        == solver_service.metrics.num_board_states
+    )
+    assert (
+        resumed_solver_service.metrics.num_guesses == solver_service.metrics.num_guesses
+    )
+
+
+def test_node_limit_saves_checkpoint(tmp_path: Path) -> None:
+    board = parse_rows(BACKTRACKING_ROWS)
+    game_service = GameService()
+    solver_service = SolverService(game_service, use_propagation=False)
+    status, moves_made = solver_service.search_placements(board)
+
+    checkpoint_path = str(tmp_path / "search.json")
+    limited_solver_service = SolverService(
+        game_service,
+        use_propagation=False,
+        max_nodes=30,
+        checkpointer=SearchCheckpointer(checkpoint_path, interval=None),
+    )
+    limited_status, _ = limited_solver_service.search_placements(board)
+    assert limited_status == SolveStatus.NODE_LIMIT_REACHED
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    assert (
+        checkpoint.metrics.num_board_states
+        == limited_solver_service.metrics.num_board_states
+    )
+    resumed_solver_service = SolverService(game_service, use_propagation=False)
+    assert resumed_solver_service.resume_placements(checkpoint) == (
+        status,
+        moves_made,
+    )
+    assert (
+        resumed_solver_service.metrics.num_board_states
+        == solver_service.metrics.num_board_states
+    )
+
+
+def test_periodic_checkpoints(board: GameBoard, tmp_path: Path) -> None:
+    checkpoint_path = str(tmp_path / "search.json")
+    checkpointer = CountingCheckpointer(checkpoint_path, interval=0.0)
+    solver_service = SolverService(GameService(), checkpointer=checkpointer)
+    assert solver_service.search_placements(board)[0] == SolveStatus.SOLVED
+    assert checkpointer.num_saves > 1
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_resume_rejects_other_rules(board: GameBoard, tmp_path: Path) -> None:
+    checkpoint_path = str(tmp_path / "search.json")
+    checkpointer = SearchCheckpointer(checkpoint_path, interval=None)
+    checkpointer.request(stop=True)
+    SolverService(GameService(), checkpointer=checkpointer).search_placements(board)
+
+    solver_service = SolverService(GameService(rules=RuleSpec(run_length=3)))
+    with pytest.raises(ValueError):
+        solver_service.resume(load_checkpoint(checkpoint_path))
+
+
+def test_main_rejects_checkpoint_with_several_boards(tmp_path: Path) -> None:
+    board_path = tmp_path / "boards.txt"
+    board_path.write_text("xo\n  \n\nox\n  \n")
+    with pytest.raises(SystemExit, match="single board"):
+        main([str(board_path), "--checkpoint", str(tmp_path / "search.json")])
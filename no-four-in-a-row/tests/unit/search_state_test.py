@@ -0,0 +1,60 @@
+# test_search_state.py
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService, InvalidMoveException
+from src.search_state import SearchState
+
+
+@pytest.fixture
+def search_state() -> SearchState:
+    board = GameBoard(
+        [
+            [" ", "o", "o", " "],
+            [" ", " ", " ", " "],
+            [" ", " ", " ", " "],
+            [" ", " ", " ", " "],
+        ]
+    )
+    return SearchState(GameService(), board)
+
+
+def test_does_not_mutate_original_board() -> None:
+    board = GameBoard([[" ", " "], [" ", " "]])
+    search_state = SearchState(GameService(), board)
+    search_state.make_move((board.bit_index(0, 0), "x"))
+    assert board.get_cell(0, 0) == " "
+
+
+def test_make_move_updates_valid_moves(search_state: SearchState) -> None:
+    game_board = search_state.game_board
+    search_state.make_move((game_board.bit_index(0, 0), "o"))
+    assert game_board.get_cell(0, 0) == "o"
+    assert search_state.valid_move_map.get_chars(game_board.bit_index(0, 3)) == "x"
+
+
+def test_undo_to_restores_board_and_valid_moves(search_state: SearchState) -> None:
+    game_board = search_state.game_board
+    before = dict(search_state.valid_move_map.chars_by_cell)
+    search_state.make_move((game_board.bit_index(0, 0), "o"))
+    search_state.make_move((game_board.bit_index(1, 1), "x"))
+    search_state.undo_to(0)
+    assert search_state.moves_made == []
+    assert game_board.get_cell(0, 0) == " "
+    assert game_board.get_cell(1, 1) == " "
+    assert search_state.valid_move_map.chars_by_cell == before
+
+
+def test_make_invalid_move_raises(search_state: SearchState) -> None:
+    game_board = search_state.game_board
+    search_state.make_move((game_board.bit_index(0, 0), "o"))
+    with pytest.raises(InvalidMoveException):
+        search_state.make_move((game_board.bit_index(0, 3), "o"))
+
+
+def test_cell_idxs_limits_valid_move_map() -> None:
+    board = GameBoard([[" ", " "], [" ", "x"]])
+    cell_idxs = [board.bit_index(0, 0), board.bit_index(1, 0)]
+    search_state = SearchState(GameService(), board, cell_idxs=cell_idxs)
+    assert len(search_state.valid_move_map) == 2
+    assert board.bit_index(0, 1) not in search_state.valid_move_map
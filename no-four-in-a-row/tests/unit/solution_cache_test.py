@@ -0,0 +1,63 @@
+# test_solution_cache.py
+
+from pathlib import Path
+
+import pytest
+from src.board_loaders import parse_rows
+from src.board_symmetry import SYMMETRIES
+from src.caching_solver_service import CachingSolverService
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solution_cache import CachedSolution, SolutionCache
+from src.solver_service import SolverService
+
+ROWS = ["xxoo", "xx  ", " oox", "  oo"]
+SOLVED = CachedSolution(SolveStatus.SOLVED, ("xo", "ox"))
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    solution_cache = SolutionCache(max_entries=2)
+    solution_cache.put("a", SOLVED)
+    solution_cache.put("b", SOLVED)
+    solution_cache.get("a")
+    solution_cache.put("c", SOLVED)
+    assert solution_cache.get("b") is None
+    assert solution_cache.get("a") == SOLVED
+    assert (solution_cache.num_hits, solution_cache.num_misses) == (2, 1)
+
+
+def test_rejects_results_that_depend_on_limits() -> None:
+    with pytest.raises(ValueError):
+        SolutionCache().put("a", CachedSolution(SolveStatus.CANCELLED, None))
+
+
+def test_sqlite_tier_outlives_the_cache(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "solutions.db")
+    with SolutionCache(db_path=db_path) as solution_cache:
+        solution_cache.put("a", SOLVED)
+        solution_cache.put("b", CachedSolution(SolveStatus.UNSOLVABLE, None))
+    with SolutionCache(db_path=db_path) as solution_cache:
+        assert solution_cache.get("a") == SOLVED
+        assert solution_cache.get("b") == CachedSolution(SolveStatus.UNSOLVABLE, None)
+        assert len(solution_cache) == 2
+
+
+def test_symmetric_boards_are_solved_once() -> None:
+    solver_service = SolverService(game_service=GameService())
+    caching_solver_service = CachingSolverService(solver_service, SolutionCache())
+    for symmetry in SYMMETRIES:
+        game_board = parse_rows(symmetry.apply(ROWS))
+        result = caching_solver_service.solve(game_board)
+        assert result.status == SolveStatus.SOLVED
+        if symmetry != SYMMETRIES[0]:
+            assert result.metrics.num_board_states == 0
+        assert result.solution is not None
+        # The cached solution is valid in the caller's orientation.
+        assert solver_service.search_placements(result.solution)[0] == (
+            SolveStatus.SOLVED
+        )
+        assert sorted(cell_idx for cell_idx, _ in result.placements) == (
+            game_board.empty_cell_idxs()
+        )
+    solution_cache = caching_solver_service.solution_cache
+    assert (solution_cache.num_hits, solution_cache.num_misses) == (15, 1)
@@ -0,0 +1,106 @@
+# test_solve_hooks.py
+
+import io
+import json
+
+import pytest
+from src.game_board import GameBoard, Placement
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solve_hooks import JsonMetricsHooks, ProfilingHooks, SolveHooks, TraceHooks
+from src.solve_metrics import SolveMetrics
+from src.solver_service import SolverService
+
+
+class RecordingHooks(SolveHooks):
+    events: list[str]
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def on_start(self, game_board: GameBoard) -> None:
+        self.events.append("start")
+
+    def on_guess(self, placement: Placement, depth: int) -> None:
+        self.events.append(f"guess {depth}")
+
+    def on_backtrack(self, depth: int) -> None:
+        self.events.append(f"backtrack {depth}")
+
+    def on_solution(self, placements: list[Placement]) -> None:
+        self.events.append("solution")
+
+    def on_finish(self, status: SolveStatus, metrics: SolveMetrics) -> None:
+        self.events.append(f"finish {status.value}")
+
+
+@pytest.fixture
+def board() -> GameBoard:
+    return GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            [" ", "o", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+
+
+def test_hooks_receive_events(board: GameBoard) -> None:
+    hooks = RecordingHooks()
+    solver_service = SolverService(GameService(), use_propagation=False, hooks=[hooks])
+    solver_service.search_placements(board)
+    assert hooks.events[0] == "start"
+    assert "guess 1" in hooks.events
+    assert hooks.events[-2:] == ["solution", "finish solved"]
+
+
+def test_hooks_receive_backtracks() -> None:
+    hooks = RecordingHooks()
+    solver_service = SolverService(
+        GameService(),
+        use_propagation=False,
+        use_transposition_table=False,
+        hooks=[hooks],
+    )
+    solver_service.count_solutions(GameBoard([[" ", " "], [" ", " "]]), limit=100)
+    assert "backtrack 1" in hooks.events
+    assert hooks.events.count("solution") == solver_service.metrics.num_backtracks + 1
+
+
+def test_profiling_hooks(board: GameBoard) -> None:
+    hooks = ProfilingHooks()
+    SolverService(GameService(), hooks=[hooks]).search_placements(board)
+    assert "propagate" in hooks.format_stats(limit=100)
+
+
+def test_json_metrics_hooks(board: GameBoard) -> None:
+    output = io.StringIO()
+    solver_service = SolverService(GameService(), hooks=[JsonMetricsHooks(output)])
+    solver_service.search_placements(board)
+    solver_service.search_placements(board)
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["status"] == "solved"
+    assert lines[0]["num_board_states"] == lines[1]["num_board_states"] > 0
+
+
+def test_trace_hooks(board: GameBoard) -> None:
+    output = io.StringIO()
+    solver_service = SolverService(GameService(), hooks=[TraceHooks(output)])
+    solver_service.search_placements(board)
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert events[0] == {
+        "event": "start",
+        "rows": ["xxoo", "xx  ", " oox", "  oo"],
+    }
+    propagations = [event for event in events if event["event"] == "propagation"]
+    assert len(propagations) == solver_service.metrics.num_forced_moves
+    assert {"row": 1, "col": 2} in [
+        {"row": event["row"], "col": event["col"]} for event in propagations
+    ]
+    assert events[-1] == {
+        "event": "finish",
+        "status": "solved",
+        "num_board_states": solver_service.metrics.num_board_states,
+    }
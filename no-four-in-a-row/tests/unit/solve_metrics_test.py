@@ -0,0 +1,43 @@
+# test_solve_metrics.py
+
+import json
+
+from src.solve_metrics import SolveMetrics
+
+
+def test_record_backtrack() -> None:
+    metrics = SolveMetrics()
+    metrics.record_backtrack(2)
+    metrics.record_backtrack(2)
+    metrics.record_backtrack(1)
+    assert metrics.backtracks_by_depth == {2: 2, 1: 1}
+    assert metrics.num_backtracks == 3
+
+
+def test_nodes_per_second() -> None:
+    assert SolveMetrics().nodes_per_second == 0.0
+    assert SolveMetrics(num_board_states=10, wall_time=0.5).nodes_per_second == 20.0
+
+
+def test_merge() -> None:
+    metrics = SolveMetrics(num_board_states=3, max_depth=4, wall_time=1.0)
+    metrics.record_backtrack(1)
+    other = SolveMetrics(num_board_states=5, max_depth=2, validation_time=0.5)
+    other.record_backtrack(1)
+    other.record_backtrack(3)
+    metrics.merge(other)
+    assert metrics.num_board_states == 8
+    assert metrics.max_depth == 4
+    assert metrics.backtracks_by_depth == {1: 2, 3: 1}
+    assert metrics.validation_time == 0.5
+    assert metrics.wall_time == 1.0
+
+
+def test_to_json() -> None:
+    metrics = SolveMetrics(num_board_states=4, wall_time=2.0)
+    metrics.record_backtrack(1)
+    exported = json.loads(metrics.to_json())
+    assert exported["num_board_states"] == 4
+    assert exported["backtracks_by_depth"] == {"1": 1}
+    assert exported["num_backtracks"] == 1
+    assert exported["nodes_per_second"] == 2.0
@@ -0,0 +1,172 @@
+# test_solver_service.py
+
+import pytest
+from src.branching_strategies import AllMovesBranching
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solver_service import SolverService
+
+
+@pytest.fixture
+def not_forcible_board() -> GameBoard:
+    return GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            [" ", "o", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+
+
+@pytest.fixture
+def invalid_board() -> GameBoard:
+    return GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            ["x", "x", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+
+
+def test_solve_valid_board(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    assert solver_service.solve(not_forcible_board).status == SolveStatus.SOLVED
+
+
+def test_solve_returns_result_without_output(
+    not_forcible_board: GameBoard, capsys: pytest.CaptureFixture[str]
+) -> None:
+    result = SolverService(game_service=GameService()).solve(not_forcible_board)
+    assert capsys.readouterr().out == ""
+    assert result.solution is not None
+    assert result.solution.empty_cell_idxs() == []
+    assert len(result.placements) == len(result.get_moves()) == 5
+    assert result.get_solution_rows() == ["".join(row) for row in result.solution.board]
+    assert result.metrics.num_board_states > 0
+
+
+def test_solve_invalid_board(invalid_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    assert solver_service.solve(invalid_board).status == SolveStatus.UNSOLVABLE
+
+
+def test_solve_does_not_mutate_board(not_forcible_board: GameBoard) -> None:
+    before = not_forcible_board.board
+    SolverService(game_service=GameService()).solve(not_forcible_board)
+    assert not_forcible_board.board == before
+
+
+def test_solve_stops_at_node_limit(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService(), max_nodes=1)
+    assert (
+        solver_service.solve(not_forcible_board).status
+        == SolveStatus.NODE_LIMIT_REACHED
+    )
+
+
+def test_solve_stops_at_depth_limit(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService(), max_depth=0)
+    assert (
+        solver_service.solve(not_forcible_board).status
+        == SolveStatus.DEPTH_LIMIT_REACHED
+    )
+
+
+def test_solve_large_empty_board() -> None:
+    board = GameBoard([[" " for _ in range(12)] for _ in range(12)])
+    solver_service = SolverService(game_service=GameService())
+    assert solver_service.solve(board).status == SolveStatus.SOLVED
+
+
+def test_count_solutions_unique() -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", "x", " "],
+            ["x", "x", "o", "x"],
+            [" ", " ", "x", "o"],
+        ]
+    )
+    solver_service = SolverService(game_service=GameService())
+    solution_count = solver_service.count_solutions(board)
+    assert solution_count.num_solutions == 1
+    assert solution_count.is_unique
+    assert solution_count.status == SolveStatus.SOLVED
+    assert solution_count.num_board_states > 0
+
+
+def test_count_solutions_none(invalid_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    solution_count = solver_service.count_solutions(invalid_board)
+    assert solution_count.num_solutions == 0
+    assert solution_count.is_exact
+    assert solution_count.status == SolveStatus.UNSOLVABLE
+
+
+def test_count_solutions_exact(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    solution_count = solver_service.count_solutions(not_forcible_board, limit=10)
+    assert solution_count.num_solutions == 4
+    assert solution_count.is_exact
+
+
+def test_count_solutions_all() -> None:
+    # Every filling of a 2x2 board is valid with runs of 3 disallowed.
+    board = GameBoard([[" ", " "], [" ", " "]])
+    solver_service = SolverService(game_service=GameService(3))
+    solution_count = solver_service.count_solutions(board, limit=100)
+    assert solution_count.num_solutions == 16
+    assert solution_count.is_exact
+
+
+def test_count_solutions_stops_at_limit() -> None:
+    board = GameBoard([[" " for _ in range(6)] for _ in range(6)])
+    solver_service = SolverService(game_service=GameService())
+    solution_count = solver_service.count_solutions(board, limit=2)
+    assert solution_count.num_solutions == 2
+    assert not solution_count.is_exact
+    assert not solution_count.is_unique
+
+
+def test_count_solutions_rejects_overlapping_branching(
+    not_forcible_board: GameBoard,
+) -> None:
+    solver_service = SolverService(
+        game_service=GameService(), branching_strategy=AllMovesBranching()
+    )
+    with pytest.raises(ValueError):
+        solver_service.count_solutions(not_forcible_board)
+
+
+def test_metrics_are_per_search(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService())
+    solver_service.search_placements(not_forcible_board)
+    first = solver_service.metrics
+    solver_service.search_placements(not_forcible_board)
+    assert solver_service.metrics is not first
+    assert solver_service.metrics.num_board_states == first.num_board_states > 0
+    assert solver_service.metrics.wall_time > 0
+
+
+def test_metrics_track_depth_and_backtracks() -> None:
+    board = GameBoard([[" " for _ in range(5)] for _ in range(5)])
+    solver_service = SolverService(game_service=GameService(), use_propagation=False)
+    solver_service.count_solutions(board, limit=5)
+    metrics = solver_service.metrics
+    assert metrics.max_depth > 0
+    assert metrics.num_backtracks > 0
+    assert max(metrics.backtracks_by_depth) <= metrics.max_depth
+
+
+def test_collect_timings(not_forcible_board: GameBoard) -> None:
+    solver_service = SolverService(game_service=GameService(), collect_timings=True)
+    solver_service.search_placements(not_forcible_board)
+    metrics = solver_service.metrics
+    assert metrics.validation_time > 0
+    assert metrics.map_update_time > 0
+    assert metrics.propagation_time > 0
+    assert metrics.num_probes > 0
@@ -0,0 +1,35 @@
+# test_solver_workers.py
+
+import multiprocessing
+
+import pytest
+from src import solver_workers
+from src.game_service import GameService
+from src.solve_hooks import SolveHooks
+from src.solver_service import SolverService
+from src.solver_workers import copy_for_workers, get_worker_solver_service, init_worker
+
+
+def test_copy_for_workers_drops_stop_check_and_hooks() -> None:
+    solver_service = SolverService(game_service=GameService())
+    solver_service.should_stop = lambda: False
+    solver_service.hooks = [SolveHooks()]
+
+    worker_copy = copy_for_workers(solver_service)
+    assert worker_copy.should_stop is None
+    assert worker_copy.hooks == []
+    assert worker_copy.game_service is solver_service.game_service
+    assert solver_service.should_stop is not None
+    assert len(solver_service.hooks) == 1
+
+
+def test_init_worker_sets_stop_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(solver_workers, "worker_solver_service", None)
+    stop_event = multiprocessing.Event()
+    init_worker(SolverService(game_service=GameService()), stop_event)
+
+    worker_solver_service = get_worker_solver_service()
+    assert worker_solver_service.should_stop is not None
+    assert not worker_solver_service.should_stop()
+    stop_event.set()
+    assert worker_solver_service.should_stop()
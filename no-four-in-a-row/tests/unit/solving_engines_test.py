@@ -0,0 +1,87 @@
+# test_solving_engines.py
+
+import random
+
+import pytest
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.solver_service import SolverService
+from src.solving_engines import SatEngine
+
+
+@pytest.fixture
+def game_service() -> GameService:
+    return GameService()
+
+
+@pytest.fixture
+def sat_solver_service(game_service: GameService) -> SolverService:
+    return SolverService(game_service, engine=SatEngine(game_service))
+
+
+def test_sat_engine_solves_board(sat_solver_service: SolverService) -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            [" ", "o", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+    status, moves_made = sat_solver_service.search(board)
+    assert status == SolveStatus.SOLVED
+    assert len(moves_made) == 5
+    game_service = sat_solver_service.game_service
+    for move in moves_made:
+        board = game_service.make_move(board, move)
+    assert board.empty_cell_idxs() == []
+
+
+def test_sat_engine_invalid_board(sat_solver_service: SolverService) -> None:
+    board = GameBoard(
+        [
+            ["x", "x", "o", "o"],
+            ["x", "x", " ", " "],
+            ["x", "x", "o", "x"],
+            [" ", " ", "o", "o"],
+        ]
+    )
+    assert sat_solver_service.search(board) == (SolveStatus.UNSOLVABLE, [])
+
+
+def test_sat_engine_updates_counters(sat_solver_service: SolverService) -> None:
+    sat_solver_service.search(GameBoard([[" "] * 6 for _ in range(6)]))
+    assert sat_solver_service.metrics.num_board_states >= 36
+    assert sat_solver_service.metrics.num_guesses > 0
+
+
+def test_sat_engine_stops_at_node_limit(game_service: GameService) -> None:
+    solver_service = SolverService(
+        game_service, max_nodes=1, engine=SatEngine(game_service)
+    )
+    status, _ = solver_service.search(GameBoard([[" "] * 6 for _ in range(6)]))
+    assert status == SolveStatus.NODE_LIMIT_REACHED
+
+
+@pytest.mark.parametrize("disallowed_num_consecutive_chars", [3, 4])
+def test_sat_engine_agrees_with_backtracking(
+    disallowed_num_consecutive_chars: int,
+) -> None:
+    rng = random.Random(disallowed_num_consecutive_chars)
+    game_service = GameService(disallowed_num_consecutive_chars)
+    for _ in range(30):
+        board = GameBoard(
+            [
+                [rng.choice("xo") if rng.random() < 0.3 else " " for _ in range(6)]
+                for _ in range(6)
+            ]
+        )
+        backtracking_status, _ = SolverService(game_service).search_placements(board)
+        sat_status, placements = SolverService(
+            game_service, engine=SatEngine(game_service)
+        ).search_placements(board)
+        assert sat_status == backtracking_status
+        for cell_idx, char in placements:
+            assert game_service.is_valid_placement(board, cell_idx, char)
+            board.update_cell_idx(cell_idx, char)
@@ -0,0 +1,85 @@
+# test_transposition_table.py
+
+from src.game_board import GameBoard
+from src.game_service import GameService
+from src.results import SolveStatus
+from src.search_state import SearchState
+from src.solver_service import SolverService
+from src.transposition_table import TranspositionTable, ZobristHasher
+
+
+def test_hash_is_independent_of_move_order() -> None:
+    zobrist_hasher = ZobristHasher()
+    board = GameBoard([[" " for _ in range(4)] for _ in range(4)])
+    first_move = (board.bit_index(0, 0), "x")
+    second_move = (board.bit_index(2, 1), "o")
+
+    search_state = SearchState(GameService(), board, zobrist_hasher)
+    search_state.make_move(first_move)
+    search_state.make_move(second_move)
+    other_search_state = SearchState(GameService(), board, zobrist_hasher)
+    other_search_state.make_move(second_move)
+    other_search_state.make_move(first_move)
+
+    assert search_state.board_hash == other_search_state.board_hash
+    assert search_state.board_hash == zobrist_hasher.hash_board(search_state.game_board)
+
+
+def test_hash_is_restored_on_undo() -> None:
+    zobrist_hasher = ZobristHasher()
+    board = GameBoard([["x", " ", " "], [" ", "o", " "], [" ", " ", " "]])
+    search_state = SearchState(GameService(), board, zobrist_hasher)
+    initial_hash = search_state.board_hash
+    search_state.make_move((board.bit_index(2, 2), "x"))
+    assert search_state.board_hash != initial_hash
+    search_state.undo_to(0)
+    assert search_state.board_hash == initial_hash
+
+
+def test_keys_do_not_depend_on_other_shapes() -> None:
+    board = GameBoard([["x", " ", " "], [" ", "o", " "], [" ", " ", " "]])
+    other_board = GameBoard([[" " for _ in range(4)] for _ in range(4)])
+    zobrist_hasher = ZobristHasher()
+    zobrist_hasher.hash_board(other_board)
+    assert zobrist_hasher.hash_board(board) == ZobristHasher().hash_board(board)
+
+
+def test_table_remembers_unsolvable_hashes() -> None:
+    transposition_table = TranspositionTable()
+    assert not transposition_table.is_known_unsolvable(1)
+    transposition_table.add_unsolvable(1)
+    assert transposition_table.is_known_unsolvable(1)
+    transposition_table.clear()
+    assert not transposition_table.is_known_unsolvable(1)
+
+
+def test_table_evicts_least_recently_used() -> None:
+    transposition_table = TranspositionTable(max_entries=2)
+    transposition_table.add_unsolvable(1)
+    transposition_table.add_unsolvable(2)
+    transposition_table.is_known_unsolvable(1)
+    transposition_table.add_unsolvable(3)
+    assert len(transposition_table) == 2
+    assert transposition_table.is_known_unsolvable(1)
+    assert not transposition_table.is_known_unsolvable(2)
+
+
+def test_solve_with_and_without_table_agree() -> None:
+    board = GameBoard(
+        [
+            [" ", " ", " ", " ", " ", "x"],
+            ["x", " ", " ", "x", "o", "x"],
+            ["x", " ", "o", "x", "o", " "],
+            [" ", " ", "o", " ", " ", " "],
+            ["o", "o", " ", " ", "x", "x"],
+            [" ", " ", " ", "x", "x", "o"],
+        ]
+    )
+    with_table = SolverService(game_service=GameService())
+    without_table = SolverService(
+        game_service=GameService(), use_transposition_table=False
+    )
+    assert with_table.solve(board).status == SolveStatus.SOLVED
+    assert without_table.solve(board).status == SolveStatus.SOLVED
+    assert with_table.metrics.num_transposition_misses > 0
+    assert without_table.metrics.num_transposition_misses == 0
@@ -0,0 +1,71 @@
+# test_valid_move_map.py
+
+import pytest
+from src.valid_move_map import ValidMoveMap
+
+
+@pytest.fixture
+def valid_move_map() -> ValidMoveMap:
+    valid_move_map = ValidMoveMap()
+    valid_move_map.set_chars(0, "ox")
+    valid_move_map.set_chars(1, "o")
+    valid_move_map.set_chars(2, "")
+    return valid_move_map
+
+
+def test_counts_cells_by_num_moves(valid_move_map: ValidMoveMap) -> None:
+    assert len(valid_move_map) == 3
+    assert valid_move_map.count_cells_with(0) == 1
+    assert valid_move_map.count_cells_with(1) == 1
+    assert valid_move_map.count_cells_with(2) == 1
+
+
+def test_set_chars_moves_cell_between_buckets(valid_move_map: ValidMoveMap) -> None:
+    valid_move_map.set_chars(0, "x")
+    assert valid_move_map.count_cells_with(2) == 0
+    assert valid_move_map.count_cells_with(1) == 2
+    assert valid_move_map.first_cell_with(1) == 1
+
+
+def test_remove_cell(valid_move_map: ValidMoveMap) -> None:
+    valid_move_map.remove_cell(2)
+    assert 2 not in valid_move_map
+    assert valid_move_map.count_cells_with(0) == 0
+    assert valid_move_map.first_cell_with(0) is None
+
+
+def test_undo_to_restores_previous_state(valid_move_map: ValidMoveMap) -> None:
+    trail_length = valid_move_map.trail_length()
+    valid_move_map.remove_cell(1)
+    valid_move_map.set_chars(0, "")
+    valid_move_map.set_chars(3, "x")
+    valid_move_map.undo_to(trail_length)
+    assert 1 in valid_move_map
+    assert 3 not in valid_move_map
+    assert valid_move_map.get_chars(0) == "ox"
+    assert valid_move_map.count_cells_with(0) == 1
+    assert valid_move_map.count_cells_with(1) == 1
+    assert valid_move_map.count_cells_with(2) == 1
+
+
+def test_get_moves(valid_move_map: ValidMoveMap) -> None:
+    assert valid_move_map.get_moves(0) == [(0, "o"), (0, "x")]
+
+
+def test_all_moves(valid_move_map: ValidMoveMap) -> None:
+    assert valid_move_map.all_moves() == [(0, "o"), (0, "x"), (1, "o")]
+
+
+def test_restore_order(valid_move_map: ValidMoveMap) -> None:
+    valid_move_map.set_chars(3, "x")
+    order = valid_move_map.get_order()
+    # Undoing a change moves a cell to the end of its bucket.
+    trail_length = valid_move_map.trail_length()
+    valid_move_map.remove_cell(1)
+    valid_move_map.undo_to(trail_length)
+    assert valid_move_map.first_cell_with(1) == 3
+
+    valid_move_map.restore_order(order)
+    assert valid_move_map.get_order() == order
+    assert valid_move_map.first_cell_with(1) == 1
+    assert valid_move_map.all_moves() == [(0, "o"), (0, "x"), (1, "o"), (3, "x")]
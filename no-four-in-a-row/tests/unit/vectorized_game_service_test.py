@@ -0,0 +1,102 @@
+# test_vectorized_game_service.py
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src import search_state as search_state_module  # noqa: E402
+from src.game_board import GameBoard  # noqa: E402
+from src.game_service import GameService  # noqa: E402
+from src.search_state import VECTORIZE_MIN_EMPTY_CELLS, SearchState  # noqa: E402
+from src.vectorized_game_service import VectorizedGameService  # noqa: E402
+
+
+def random_board(rng: random.Random, n_rows: int, n_cols: int) -> GameBoard:
+    return GameBoard(
+        [[rng.choice(" xo") for _ in range(n_cols)] for _ in range(n_rows)]
+    )
+
+
+@pytest.mark.parametrize("disallowed_num_consecutive_chars", [2, 3, 4, 5])
+def test_legal_move_masks_match_is_valid_placement(
+    disallowed_num_consecutive_chars: int,
+) -> None:
+    rng = random.Random(disallowed_num_consecutive_chars)
+    game_service = GameService(disallowed_num_consecutive_chars)
+    vectorized_game_service = VectorizedGameService(game_service)
+    for _ in range(20):
+        board = random_board(rng, rng.randint(1, 9), rng.randint(1, 9))
+        masks = vectorized_game_service.get_legal_move_masks(board)
+        for cell_idx in board.cell_idxs():
+            location = board.cell_location(cell_idx)
+            for char in "xo":
+                assert masks[char][location] == game_service.is_valid_placement(
+                    board, cell_idx, char
+                )
+
+
+def test_has_disallowed_run() -> None:
+    vectorized_game_service = VectorizedGameService(GameService())
+    assert not vectorized_game_service.has_disallowed_run(
+        GameBoard([["x", "x", "x", " "], ["o", " ", " ", " "]])
+    )
+    assert vectorized_game_service.has_disallowed_run(
+        GameBoard(
+            [
+                ["o", " ", " ", " "],
+                [" ", "o", " ", " "],
+                [" ", " ", "o", " "],
+                [" ", " ", " ", "o"],
+            ]
+        )
+    )
+
+
+def test_is_completed_board_valid() -> None:
+    vectorized_game_service = VectorizedGameService(GameService())
+    assert vectorized_game_service.is_completed_board_valid(
+        GameBoard([["x", "x", "o", "o"], ["o", "o", "x", "x"]])
+    )
+    assert not vectorized_game_service.is_completed_board_valid(
+        GameBoard([["x", "x", "o", "o"], ["o", " ", "x", "x"]])
+    )
+    assert not vectorized_game_service.is_completed_board_valid(
+        GameBoard([["x", "x", "x", "x"], ["o", "o", "x", "o"]])
+    )
+
+
+def test_search_state_valid_moves_match_scalar(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rng = random.Random(0)
+    board = GameBoard([[rng.choice("   xo") for _ in range(12)] for _ in range(12)])
+    assert len(board.empty_cell_idxs()) >= VECTORIZE_MIN_EMPTY_CELLS
+    vectorized = SearchState(GameService(), board).valid_move_map.chars_by_cell
+    monkeypatch.setattr(search_state_module, "NUMPY_AVAILABLE", False)
+    scalar = SearchState(GameService(), board).valid_move_map.chars_by_cell
+    assert vectorized == scalar
+
+
+def test_bundled_boards_do_not_import_numpy() -> None:
+    # The small boards are faster to solve with the scalar checks, and the
+    # command line would spend longer importing NumPy than solving them.
+    project_dir = os.path.join(os.path.dirname(__file__), "..", "..")
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from src.main import main; "
+            "main(['boards', '--report', 'quiet']); "
+            "print('numpy' in sys.modules)",
+        ],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,35 @@
+# test_window_counts.py
+
+from src.board_loaders import parse_rows
+from src.game_board import O_CHAR, X_CHAR
+from src.rule_spec import ORTHOGONAL_DIRECTIONS, RuleSpec
+from src.window_counts import WindowCounts
+
+RULES = RuleSpec(run_length=3, directions=ORTHOGONAL_DIRECTIONS)
+
+
+def test_counts_cover_every_window() -> None:
+    game_board = parse_rows(["xx ", "o  ", "   "])
+    compiled_rules = RULES.compile(3, 3)
+    window_counts = WindowCounts(compiled_rules, 3, game_board)
+    top_row_id = compiled_rules.windows.index(0b111)
+    assert window_counts.counts[X_CHAR][top_row_id] == 2
+    assert window_counts.num_blanks(top_row_id) == 1
+    assert window_counts.is_nearly_full(top_row_id, X_CHAR)
+    assert not window_counts.is_nearly_full(top_row_id, O_CHAR)
+
+
+def test_place_returns_blocked_blanks_and_remove_undoes_it() -> None:
+    game_board = parse_rows(["x  ", "   ", "o  "])
+    compiled_rules = RULES.compile(3, 3)
+    window_counts = WindowCounts(compiled_rules, 3, game_board)
+    before = {char: list(counts) for char, counts in window_counts.counts.items()}
+
+    game_board.update_cell_idx(1, X_CHAR)
+    blocked_bits = window_counts.place(1, X_CHAR, game_board.x_bits | game_board.o_bits)
+    # The top row now needs only its last cell for a run of x. The middle
+    # column holds a single x, and the first column also holds an o.
+    assert blocked_bits == 1 << 2
+
+    window_counts.remove(1, X_CHAR)
+    assert window_counts.counts == before